@@ -1,9 +1,12 @@
+import asyncio
 import os
 from logging.config import fileConfig
+from typing import Any
 
 from alembic import context
 from dotenv import load_dotenv
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import Connection, engine_from_config, make_url, pool
+from sqlalchemy.ext.asyncio import async_engine_from_config
 from sqlmodel import SQLModel
 
 from app.models import (  # noqa: F401
@@ -13,10 +16,12 @@ from app.models import (  # noqa: F401
     Recipes,
     Users,
 )
+from app.models.recipe_search import SEARCH_TABLE_PREFIX
 
 load_dotenv()
 
-DATABASE_URL = os.getenv("DATABASE_MIGRATION_URL")
+# Sin una URL propia para migrar se usa la de la aplicación (driver asíncrono)
+DATABASE_URL = os.getenv("DATABASE_MIGRATION_URL") or os.getenv("DATABASE_URL")
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -37,6 +42,16 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = SQLModel.metadata
 
+
+def include_object(
+    object_: Any, name: str | None, type_: str, reflected: bool, compare_to: Any
+) -> bool:
+    """Excluye de autogenerate el índice de búsqueda FTS5, que no tiene modelo."""
+    return not (
+        type_ == "table" and name is not None and name.startswith(SEARCH_TABLE_PREFIX)
+    )
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -59,6 +74,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -67,6 +83,31 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def do_run_migrations(connection: Connection) -> None:
+    """Ejecuta las migraciones sobre una conexión ya abierta."""
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    """Migra con un driver asíncrono (asyncpg, aiosqlite), como la aplicación."""
+    connectable = async_engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await connectable.dispose()
+
+
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode.
 
@@ -74,6 +115,11 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    url = make_url(config.get_main_option("sqlalchemy.url") or "")
+    if url.get_dialect().is_async:
+        asyncio.run(run_async_migrations())
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
@@ -81,10 +127,7 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
-
-        with context.begin_transaction():
-            context.run_migrations()
+        do_run_migrations(connection)
 
 
 if context.is_offline_mode():
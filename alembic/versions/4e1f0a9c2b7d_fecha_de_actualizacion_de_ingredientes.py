@@ -0,0 +1,34 @@
+"""fecha de actualizacion de ingredientes
+
+Revision ID: 4e1f0a9c2b7d
+Revises: 780c6926ca18
+Create Date: 2026-10-17 13:42:08.114503
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4e1f0a9c2b7d"
+down_revision: str | Sequence[str] | None = "780c6926ca18"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Se agrega nullable, se completa y luego se marca NOT NULL: SQLite no admite
+    # ADD COLUMN con un valor por defecto no constante.
+    op.add_column("ingredients", sa.Column("updated_at", sa.DateTime(), nullable=True))
+    op.execute("UPDATE ingredients SET updated_at = CURRENT_TIMESTAMP")
+    with op.batch_alter_table("ingredients") as batch_op:
+        batch_op.alter_column("updated_at", existing_type=sa.DateTime(), nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("ingredients") as batch_op:
+        batch_op.drop_column("updated_at")
@@ -0,0 +1,31 @@
+"""nombre de ingrediente unico
+
+Revision ID: 780c6926ca18
+Revises: cc22d82b8023
+Create Date: 2026-10-17 11:04:19.552871
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "780c6926ca18"
+down_revision: str | Sequence[str] | None = "cc22d82b8023"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # El upsert masivo usa ON CONFLICT(name): requiere un índice único.
+    # Falla si ya existen ingredientes con nombres repetidos; deben unificarse antes.
+    op.drop_index(op.f("ix_ingredients_name"), table_name="ingredients")
+    op.create_index(op.f("ix_ingredients_name"), "ingredients", ["name"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_ingredients_name"), table_name="ingredients")
+    op.create_index(op.f("ix_ingredients_name"), "ingredients", ["name"], unique=False)
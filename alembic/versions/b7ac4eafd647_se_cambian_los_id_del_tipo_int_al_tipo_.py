@@ -21,6 +21,14 @@ depends_on: str | Sequence[str] | None = None
 
 def upgrade() -> None:
     """Upgrade schema."""
+    # Las tablas con IDs enteros de 3dbe7bd73dab se reemplazan (no tenían datos);
+    # sin esto una base nueva falla con "table categories already exists". El
+    # downgrade las vuelve a crear.
+    op.drop_index(op.f("ix_users_id"), table_name="users")
+    op.drop_index(op.f("ix_users_email"), table_name="users")
+    op.drop_table("users")
+    op.drop_index(op.f("ix_categories_category_id"), table_name="categories")
+    op.drop_table("categories")
     # ### commands auto generated by Alembic - please adjust! ###
     op.create_table(
         "categories",
@@ -53,3 +61,37 @@ def downgrade() -> None:
     op.drop_table("users")
     op.drop_table("categories")
     # ### end Alembic commands ###
+    # Restaura las tablas con IDs enteros que quitó el upgrade (3dbe7bd73dab)
+    op.create_table(
+        "categories",
+        sa.Column("category_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("category_id"),
+        sa.UniqueConstraint("name"),
+    )
+    op.create_index(
+        op.f("ix_categories_category_id"), "categories", ["category_id"], unique=False
+    )
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("email", sa.String(), nullable=True),
+        sa.Column("full_name", sa.String(), nullable=True),
+        sa.Column("family_name", sa.String(), nullable=True),
+        sa.Column("hashed_password", sa.String(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=True,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
+    op.create_index(op.f("ix_users_id"), "users", ["id"], unique=False)
@@ -0,0 +1,149 @@
+"""búsqueda de texto completo de recetas (FTS5)
+
+Revision ID: b8d4f2a6c0e1
+Revises: a3c5e7f9b1d2
+Create Date: 2026-10-17 21:40:12.318204
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8d4f2a6c0e1"
+down_revision: str | Sequence[str] | None = "a3c5e7f9b1d2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Copia congelada de app/models/recipe_search.py al momento de esta revisión
+INGREDIENT_NAMES = """(
+    SELECT coalesce(group_concat(i.name, ' '), '')
+    FROM recipe_ingredients AS ri
+    JOIN ingredients AS i ON i.ingredient_id = ri.ingredient_id
+    WHERE ri.recipe_id = recipe_search.recipe_id
+)"""
+
+TRIGGERS = {
+    "recipe_search_ai": """CREATE TRIGGER recipe_search_ai AFTER INSERT ON recipe_search
+BEGIN
+    INSERT INTO recipe_search_fts(rowid, name, description, instructions, ingredients)
+    VALUES (new.id, new.name, new.description, new.instructions, new.ingredients);
+END""",
+    "recipe_search_ad": """CREATE TRIGGER recipe_search_ad AFTER DELETE ON recipe_search
+BEGIN
+    INSERT INTO recipe_search_fts(
+        recipe_search_fts, rowid, name, description, instructions, ingredients
+    )
+    VALUES (
+        'delete', old.id, old.name, old.description, old.instructions, old.ingredients
+    );
+END""",
+    "recipe_search_au": """CREATE TRIGGER recipe_search_au AFTER UPDATE ON recipe_search
+BEGIN
+    INSERT INTO recipe_search_fts(
+        recipe_search_fts, rowid, name, description, instructions, ingredients
+    )
+    VALUES (
+        'delete', old.id, old.name, old.description, old.instructions, old.ingredients
+    );
+    INSERT INTO recipe_search_fts(rowid, name, description, instructions, ingredients)
+    VALUES (new.id, new.name, new.description, new.instructions, new.ingredients);
+END""",
+    "recipes_search_ai": """CREATE TRIGGER recipes_search_ai AFTER INSERT ON recipes
+BEGIN
+    INSERT INTO recipe_search(recipe_id, name, description, instructions)
+    VALUES (new.recipe_id, new.name, new.description, new.instructions);
+END""",
+    "recipes_search_au": """CREATE TRIGGER recipes_search_au
+AFTER UPDATE OF name, description, instructions ON recipes
+BEGIN
+    UPDATE recipe_search
+    SET name = new.name, description = new.description,
+        instructions = new.instructions
+    WHERE recipe_id = new.recipe_id;
+END""",
+    "recipes_search_ad": """CREATE TRIGGER recipes_search_ad AFTER DELETE ON recipes
+BEGIN
+    DELETE FROM recipe_search WHERE recipe_id = old.recipe_id;
+END""",
+    "recipe_ingredients_search_ai": f"""CREATE TRIGGER recipe_ingredients_search_ai
+AFTER INSERT ON recipe_ingredients
+BEGIN
+    UPDATE recipe_search SET ingredients = {INGREDIENT_NAMES}
+    WHERE recipe_id = new.recipe_id;
+END""",
+    "recipe_ingredients_search_au": f"""CREATE TRIGGER recipe_ingredients_search_au
+AFTER UPDATE OF recipe_id, ingredient_id ON recipe_ingredients
+BEGIN
+    UPDATE recipe_search SET ingredients = {INGREDIENT_NAMES}
+    WHERE recipe_id IN (old.recipe_id, new.recipe_id);
+END""",
+    "recipe_ingredients_search_ad": f"""CREATE TRIGGER recipe_ingredients_search_ad
+AFTER DELETE ON recipe_ingredients
+BEGIN
+    UPDATE recipe_search SET ingredients = {INGREDIENT_NAMES}
+    WHERE recipe_id = old.recipe_id;
+END""",
+    "ingredients_search_au": f"""CREATE TRIGGER ingredients_search_au
+AFTER UPDATE OF name ON ingredients
+BEGIN
+    UPDATE recipe_search SET ingredients = {INGREDIENT_NAMES}
+    WHERE recipe_id IN (
+        SELECT recipe_id FROM recipe_ingredients WHERE ingredient_id = new.ingredient_id
+    );
+END""",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # El trigger de renombre de ingredientes busca recetas por ingredient_id
+    op.create_index(
+        op.f("ix_recipe_ingredients_ingredient_id"),
+        "recipe_ingredients",
+        ["ingredient_id"],
+        unique=False,
+    )
+    # FTS5 es propio de SQLite
+    if op.get_context().dialect.name != "sqlite":
+        return
+    op.execute(
+        """CREATE TABLE recipe_search (
+    id INTEGER PRIMARY KEY,
+    recipe_id CHAR(32) NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    instructions TEXT,
+    ingredients TEXT NOT NULL DEFAULT ''
+)"""
+    )
+    op.execute(
+        """CREATE VIRTUAL TABLE recipe_search_fts USING fts5(
+    name, description, instructions, ingredients,
+    content='recipe_search', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+)"""
+    )
+    for statement in TRIGGERS.values():
+        op.execute(statement)
+    # Documentos de las recetas existentes; recipe_search_ai completa el índice
+    op.execute(
+        f"""INSERT INTO recipe_search(recipe_id, name, description, instructions,
+    ingredients)
+SELECT recipe_id, name, description, instructions,
+    {INGREDIENT_NAMES.replace("recipe_search.recipe_id", "recipes.recipe_id")}
+FROM recipes"""
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_context().dialect.name == "sqlite":
+        for name in TRIGGERS:
+            op.execute(f"DROP TRIGGER IF EXISTS {name}")
+        op.execute("DROP TABLE IF EXISTS recipe_search_fts")
+        op.execute("DROP TABLE IF EXISTS recipe_search")
+    op.drop_index(
+        op.f("ix_recipe_ingredients_ingredient_id"), table_name="recipe_ingredients"
+    )
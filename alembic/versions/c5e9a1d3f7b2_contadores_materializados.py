@@ -0,0 +1,75 @@
+"""contadores materializados de ingredientes y recetas
+
+Revision ID: c5e9a1d3f7b2
+Revises: b8d4f2a6c0e1
+Create Date: 2026-10-17 23:05:41.627310
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5e9a1d3f7b2"
+down_revision: str | Sequence[str] | None = "b8d4f2a6c0e1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ADD COLUMN con un default constante, sin batch: recrear recipes e ingredients
+    # borraría los triggers de la búsqueda de texto completo.
+    op.add_column(
+        "ingredients",
+        sa.Column("usage_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "recipes",
+        sa.Column("ingredient_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "recipes",
+        sa.Column("total_time", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        """UPDATE ingredients SET usage_count = (
+    SELECT count(DISTINCT ri.recipe_id) FROM recipe_ingredients AS ri
+    WHERE ri.ingredient_id = ingredients.ingredient_id
+)"""
+    )
+    op.execute(
+        """UPDATE recipes SET
+    ingredient_count = (
+        SELECT count(DISTINCT ri.ingredient_id) FROM recipe_ingredients AS ri
+        WHERE ri.recipe_id = recipes.recipe_id
+    ),
+    total_time = coalesce(prep_time, 0)"""
+    )
+    op.create_index(
+        "ix_ingredients_usage_count",
+        "ingredients",
+        ["usage_count", "ingredient_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_recipes_ingredient_count",
+        "recipes",
+        ["ingredient_count", "recipe_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_recipes_total_time", "recipes", ["total_time", "recipe_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_recipes_total_time", table_name="recipes")
+    op.drop_index("ix_recipes_ingredient_count", table_name="recipes")
+    op.drop_index("ix_ingredients_usage_count", table_name="ingredients")
+    op.drop_column("recipes", "total_time")
+    op.drop_column("recipes", "ingredient_count")
+    op.drop_column("ingredients", "usage_count")
@@ -0,0 +1,61 @@
+"""fechas con zona horaria
+
+Revision ID: e2a4c6f8b0d1
+Revises: c5e9a1d3f7b2
+Create Date: 2026-10-18 10:12:37.480215
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a4c6f8b0d1"
+down_revision: str | Sequence[str] | None = "c5e9a1d3f7b2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Columnas escritas con fechas en UTC con zona (ver app.models.types.UTCDateTime)
+COLUMNS = (
+    ("users", "created_at"),
+    ("users", "updated_at"),
+    ("ingredients", "updated_at"),
+    ("recipes", "created_at"),
+    ("recipes", "update_at"),
+    ("plan_entries", "created_at"),
+    ("plan_entries", "updated_at"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite no distingue ambos tipos: solo PostgreSQL necesita el cambio. Los
+    # valores existentes se guardaron en UTC.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
@@ -21,6 +21,10 @@ depends_on: str | Sequence[str] | None = None
 
 def upgrade() -> None:
     """Upgrade schema."""
+    # Repite 9ff77af7f43e: la tabla que creó aquella (vacía, porque ninguna base
+    # pudo pasar de esta revisión con ella) se reemplaza por la de esta. El
+    # downgrade la vuelve a crear.
+    op.drop_table("ingredients")
     # ### commands auto generated by Alembic - please adjust! ###
     op.create_table(
         "ingredients",
@@ -39,3 +43,13 @@ def downgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
     op.drop_table("ingredients")
     # ### end Alembic commands ###
+    # Restaura la tabla de 9ff77af7f43e, que quitó el upgrade
+    op.create_table(
+        "ingredients",
+        sa.Column("name", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("category_id", sa.Uuid(), nullable=False),
+        sa.Column("default_unit", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("ingredient_id", sa.Uuid(), nullable=False),
+        sa.PrimaryKeyConstraint("ingredient_id"),
+        sa.UniqueConstraint("ingredient_id"),
+    )
@@ -0,0 +1,132 @@
+"""Soporte de peticiones condicionales (ETag / Last-Modified) para los GET.
+
+Los endpoints de un único recurso emiten un ETag débil y, si el recurso tiene
+fecha de modificación, ``Last-Modified``. Cuando el cliente envía
+``If-None-Match`` o ``If-Modified-Since``, el endpoint obtiene solo la fecha de
+modificación (una consulta liviana o la cache) y responde 304 sin cargar ni
+serializar el recurso si no cambió.
+"""
+
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: object) -> str:
+    """Arma un ETag débil a partir de los valores que identifican una versión.
+
+    Args:
+        *parts (object): Valores de la versión (se serializan con ``str``).
+
+    Returns:
+        str: ETag débil, p. ej. ``W/"3f2a..."``.
+    """
+    raw = "|".join(str(part) for part in parts).encode("utf-8")
+    digest = hashlib.sha1(raw, usedforsecurity=False).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+
+def timestamp_etag(last_modified: datetime) -> str:
+    """ETag débil derivado de la fecha de modificación de un recurso.
+
+    Args:
+        last_modified (datetime): Fecha de la última modificación.
+
+    Returns:
+        str: ETag débil.
+    """
+    return make_etag(_as_utc(last_modified).isoformat())
+
+
+def has_conditional_headers(request: Request) -> bool:
+    """Indica si la petición trae ``If-None-Match`` o ``If-Modified-Since``.
+
+    Args:
+        request (Request): La petición entrante.
+
+    Returns:
+        bool: True si la petición es condicional.
+    """
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: datetime | None = None
+) -> bool:
+    """Evalúa las precondiciones de la petición contra la versión actual.
+
+    ``If-None-Match`` tiene prioridad sobre ``If-Modified-Since`` (RFC 9110) y se
+    compara en forma débil: ``W/"x"`` y ``"x"`` son equivalentes.
+
+    Args:
+        request (Request): La petición entrante.
+        etag (str): ETag actual del recurso.
+        last_modified (datetime | None): Fecha de modificación actual, si existe.
+
+    Returns:
+        bool: True si se puede responder 304.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        candidates = {_opaque(tag) for tag in if_none_match.split(",")}
+        return _opaque(etag) in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    # Las fechas HTTP tienen resolución de segundos
+    return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+
+
+def validator_headers(
+    etag: str, last_modified: datetime | None = None
+) -> dict[str, str]:
+    """Cabeceras ``ETag`` y ``Last-Modified`` para una respuesta.
+
+    Args:
+        etag (str): ETag del recurso.
+        last_modified (datetime | None): Fecha de modificación, si existe.
+
+    Returns:
+        dict[str, str]: Cabeceras a agregar a la respuesta.
+    """
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+
+def not_modified(etag: str, last_modified: datetime | None = None) -> Response:
+    """Respuesta 304 sin cuerpo con los validadores actuales.
+
+    Args:
+        etag (str): ETag del recurso.
+        last_modified (datetime | None): Fecha de modificación, si existe.
+
+    Returns:
+        Response: Respuesta 304 Not Modified.
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=validator_headers(etag, last_modified),
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite devuelve fechas sin zona horaria: se guardan siempre en UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
@@ -0,0 +1,40 @@
+"""Respuesta JSON que serializa una sola vez.
+
+Con ``response_model`` FastAPI (>= 0.130) ya serializa el DTO directo a bytes con
+el serializador de pydantic-core, sin pasar por ``jsonable_encoder`` ni
+``json.dumps``. Por eso la aplicación no cambia ``default_response_class``: una
+clase propia (p. ej. ``ORJSONResponse``) desactiva ese camino y obliga a armar
+un dict intermedio.
+
+``JSONBytesResponse`` cubre los endpoints que devuelven la respuesta armada a
+mano (cuerpos cacheados, cabeceras de validación): acepta JSON ya serializado o
+un DTO ya validado y lo escribe sin volver a validarlo.
+"""
+
+from typing import Any
+
+from fastapi import Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+
+class JSONBytesResponse(Response):
+    """Respuesta ``application/json`` sin validación ni dict intermedio."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """Serializa el contenido a JSON.
+
+        Args:
+            content (Any): JSON ya serializado (``bytes``), un DTO o cualquier
+                valor que pydantic-core sepa serializar (dict, list, UUID, fechas).
+
+        Returns:
+            bytes: El cuerpo de la respuesta.
+        """
+        if isinstance(content, bytes):
+            return content
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return to_json(content)
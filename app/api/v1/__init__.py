@@ -1,10 +1,16 @@
 from fastapi import APIRouter
 
 from .categories import router as categories_router
+from .export import router as export_router
 from .ingredients import router as ingredients_router
+from .plan import router as plan_router
+from .recipes import router as recipes_router
 from .users import router as users_router
 
 v1_router = APIRouter(prefix="/v1", tags=["v1"])
 v1_router.include_router(users_router)
 v1_router.include_router(categories_router)
 v1_router.include_router(ingredients_router)
+v1_router.include_router(recipes_router)
+v1_router.include_router(plan_router)
+v1_router.include_router(export_router)
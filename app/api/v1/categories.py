@@ -2,12 +2,14 @@
 
 import uuid
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 
-from app.dependencies import get_db
+from app.api.conditional import is_not_modified, make_etag, not_modified
+from app.dependencies import get_db, get_read_db
 from app.models import CategorieSingleResponse, CategoriesListResponse, CategoryCreate
 from app.services import create_category, delete_category, get_categories, get_category
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 router = APIRouter(prefix="/categories", tags=["categories"])
 
@@ -35,39 +37,49 @@ async def create_new_category(
 @router.get("/{category_id}", response_model=CategorieSingleResponse)
 async def get_category_by_id(
     category_id: uuid.UUID,
-    db: Session = Depends(get_db),  # noqa: B008
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_read_db),  # noqa: B008
 ):
     """Obtiene una categoría por su ID.
 
+    Las categorías no tienen fecha de modificación: el ETag se deriva de su
+    contenido, que sale de la cache en memoria.
+
     Args:
         category_id (int): ID de la categoría a obtener.
-        db (Session): Sesión de la base de datos. Defaults to Depends(get_db).
+        request (Request): Petición entrante, para leer las precondiciones.
+        response (Response): Respuesta, para agregar el ETag.
+        db (Session): Sesión de la base de datos. Defaults to Depends(get_read_db).
 
     Returns:
-        CategoryDB: La categoría encontrada.
+        CategorieSingleResponse: La categoría encontrada.
     """
-
     category = await get_category(db, category_id)
-    return CategorieSingleResponse(category_id=category.category_id, name=category.name)
+    etag = make_etag(category.category_id, category.name)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return category
 
 
 @router.get("/", response_model=CategoriesListResponse)
-async def get_all_categories(db: Session = Depends(get_db)):  # noqa: B008
-    """Obtiene todas las categorías.
+async def get_all_categories(
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    db: Session = Depends(get_read_db),  # noqa: B008
+):
+    """Obtiene una página de categorías, servida desde la cache en memoria.
 
     Args:
-        db (Session): Sesión de la base de datos. Defaults to Depends(get_db).
+        limit (int): Cantidad máxima de categorías por página.
+        cursor (str | None): Cursor `next_cursor` de la página anterior.
+        db (Session): Sesión de la base de datos. Defaults to Depends(get_read_db).
 
     Returns:
-        CategoriesListResponse: Lista de categorías encontradas.
+        CategoriesListResponse: Página de categorías y cursor siguiente.
     """
-    categories = await get_categories(db)
-    return CategoriesListResponse(
-        categories=[
-            CategorieSingleResponse(category_id=cat.category_id, name=cat.name)
-            for cat in categories
-        ]
-    )
+    return await get_categories(db, limit=limit, cursor=cursor)
 
 
 @router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,67 @@
+"""Endpoints de exportación del catálogo en streaming."""
+
+from collections.abc import AsyncIterator, Callable
+
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession as Session
+
+from app.core import async_read_session
+from app.services import ExportFormat, export_ingredients, export_recipes
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+
+def _streaming_response(
+    exporter: Callable[[Session, ExportFormat], AsyncIterator[str]],
+    fmt: ExportFormat,
+    filename: str,
+) -> StreamingResponse:
+    """Envuelve un exportador en una respuesta en streaming.
+
+    La sesión se abre dentro del generador para que viva mientras se envía el
+    cuerpo, independientemente de cuándo se cierren las dependencias.
+    """
+
+    async def body() -> AsyncIterator[str]:
+        async with async_read_session() as db:
+            async for chunk in exporter(db, fmt):
+                yield chunk
+
+    return StreamingResponse(
+        body(),
+        media_type=fmt.media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{fmt.value}"'
+        },
+    )
+
+
+@router.get("/ingredients")
+async def export_all_ingredients(
+    fmt: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),  # noqa: B008
+):
+    """Exporta el catálogo completo de ingredientes.
+
+    Args:
+        fmt (ExportFormat): Formato de salida (`ndjson` o `csv`). Defaults to ndjson.
+
+    Returns:
+        StreamingResponse: Ingredientes emitidos a medida que se leen.
+    """
+    return _streaming_response(export_ingredients, fmt, "ingredients")
+
+
+@router.get("/recipes")
+async def export_all_recipes(
+    fmt: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),  # noqa: B008
+):
+    """Exporta todas las recetas con sus ingredientes.
+
+    Args:
+        fmt (ExportFormat): Formato de salida (`ndjson` o `csv`). Defaults to ndjson.
+
+    Returns:
+        StreamingResponse: Recetas emitidas a medida que se leen.
+    """
+    return _streaming_response(export_recipes, fmt, "recipes")
@@ -2,17 +2,43 @@
 
 import uuid
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 
-from app.dependencies import get_db
-from app.models import IngredientCreate, IngredientResponse, IngredientUpdate
+from app.api.conditional import (
+    has_conditional_headers,
+    is_not_modified,
+    not_modified,
+    timestamp_etag,
+    validator_headers,
+)
+from app.dependencies import get_db, get_read_db
+from app.models import (
+    BulkConflictMode,
+    IngredientAutocompleteResponse,
+    IngredientBulkResponse,
+    IngredientCreate,
+    IngredientPatch,
+    IngredientResponse,
+    IngredientsListResponse,
+    IngredientSort,
+    IngredientUpdate,
+)
 from app.services import (
+    autocomplete_ingredients,
+    build_ingredient_response,
+    bulk_upsert_ingredients,
     create_ingredient,
     delete_ingredient,
     get_ingredient,
+    get_ingredient_last_modified,
+    get_ingredients,
+    parse_bulk_payload,
+    patch_ingredient,
     update_ingredient,
 )
+from app.services.ingredient_autocomplete import TOP_K
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 router = APIRouter(prefix="/ingredients", tags=["ingredients"])
 
@@ -34,25 +60,110 @@ async def create_new_ingredient(
         IngredientResponse: El ingrediente creado.
     """
     new_ingredient = await create_ingredient(db, ingredient)
-    return IngredientResponse(**new_ingredient.model_dump())
+    return await build_ingredient_response(db, new_ingredient)
+
+
+@router.post("/bulk", response_model=IngredientBulkResponse)
+async def bulk_import_ingredients(
+    request: Request,
+    on_conflict: BulkConflictMode = BulkConflictMode.UPDATE,
+    db: Session = Depends(get_db),  # noqa: B008
+):
+    """Importa ingredientes en lote (JSON o NDJSON) con upsert por nombre.
+
+    El cuerpo es una lista JSON de `IngredientBulkItem` o, con Content-Type
+    `application/x-ndjson`, un objeto por línea.
+
+    Args:
+        request (Request): Petición con el lote en el cuerpo.
+        on_conflict (BulkConflictMode): `update` o `ignore` para nombres existentes.
+        db (Session): Sesión de la base de datos. Defaults to Depends(get_db).
+
+    Returns:
+        IngredientBulkResponse: Resumen y estado de cada fila.
+    """
+    rows = parse_bulk_payload(
+        await request.body(), request.headers.get("content-type", "")
+    )
+    return await bulk_upsert_ingredients(db, rows, on_conflict)
+
+
+@router.get("/", response_model=IngredientsListResponse)
+async def list_ingredients(
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    sort: IngredientSort = IngredientSort.NAME,
+    db: Session = Depends(get_read_db),  # noqa: B008
+):
+    """Obtiene una página de ingredientes ordenados por nombre o por popularidad.
+
+    Args:
+        limit (int): Cantidad máxima de ingredientes por página.
+        cursor (str | None): Cursor `next_cursor` de la página anterior.
+        sort (IngredientSort): `name` (alfabético) o `popular` (más usados primero).
+        db (Session): Sesión de la base de datos. Defaults to Depends(get_read_db).
+
+    Returns:
+        IngredientsListResponse: Página de ingredientes y cursor siguiente.
+    """
+    return await get_ingredients(db, limit=limit, cursor=cursor, sort=sort)
+
+
+@router.get("/autocomplete", response_model=IngredientAutocompleteResponse)
+async def autocomplete(
+    q: str = Query(min_length=1, max_length=100),
+    limit: int = Query(default=10, ge=1, le=TOP_K),
+    db: Session = Depends(get_read_db),  # noqa: B008
+):
+    """Sugiere ingredientes mientras el usuario escribe.
+
+    Coincide con el inicio del nombre o de cualquiera de sus palabras, sin
+    distinguir tildes ni mayúsculas, y ordena por uso en recetas.
+
+    Args:
+        q (str): Texto ingresado hasta el momento.
+        limit (int): Cantidad máxima de sugerencias.
+        db (Session): Sesión de la base de datos. Defaults to Depends(get_read_db).
+
+    Returns:
+        IngredientAutocompleteResponse: Ingredientes sugeridos.
+    """
+    return await autocomplete_ingredients(db, q, limit)
 
 
 @router.get("/{ingredient_id}", response_model=IngredientResponse)
 async def read_ingredient(
     ingredient_id: uuid.UUID,
-    db: Session = Depends(get_db),  # noqa: B008
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_read_db),  # noqa: B008
 ):
     """Obtiene un ingrediente por su ID.
 
+    Responde 304 si el cliente ya tiene la versión actual, consultando solo la
+    fecha de modificación.
+
     Args:
         ingredient_id (uuid.UUID): ID del ingrediente a obtener.
-        db (Session): Sesión de la base de datos. Defaults to Depends(get_db).
+        request (Request): Petición entrante, para leer las precondiciones.
+        response (Response): Respuesta, para agregar ETag y Last-Modified.
+        db (Session): Sesión de la base de datos. Defaults to Depends(get_read_db).
 
     Returns:
         IngredientResponse: El ingrediente encontrado.
     """
+    if has_conditional_headers(request):
+        last_modified = await get_ingredient_last_modified(db, ingredient_id)
+        etag = timestamp_etag(last_modified)
+        if is_not_modified(request, etag, last_modified):
+            return not_modified(etag, last_modified)
     db_ingredient = await get_ingredient(db, ingredient_id)
-    return IngredientResponse(**db_ingredient.model_dump())
+    response.headers.update(
+        validator_headers(
+            timestamp_etag(db_ingredient.updated_at), db_ingredient.updated_at
+        )
+    )
+    return await build_ingredient_response(db, db_ingredient)
 
 
 @router.put("/{ingredient_id}", response_model=IngredientResponse)
@@ -72,7 +183,27 @@ async def update_existing_ingredient(
         IngredientResponse: El ingrediente actualizado.
     """
     db_ingredient = await update_ingredient(db, ingredient_id, ingredient)
-    return IngredientResponse(**db_ingredient.model_dump())
+    return await build_ingredient_response(db, db_ingredient)
+
+
+@router.patch("/{ingredient_id}", response_model=IngredientResponse)
+async def patch_existing_ingredient(
+    ingredient_id: uuid.UUID,
+    patch: IngredientPatch,
+    db: Session = Depends(get_db),  # noqa: B008
+):
+    """Actualiza solo los campos enviados de un ingrediente.
+
+    Args:
+        ingredient_id (uuid.UUID): ID del ingrediente a actualizar.
+        patch (IngredientPatch): Campos a modificar.
+        db (Session): Sesión de la base de datos. Defaults to Depends(get_db).
+
+    Returns:
+        IngredientResponse: El ingrediente actualizado.
+    """
+    db_ingredient = await patch_ingredient(db, ingredient_id, patch)
+    return await build_ingredient_response(db, db_ingredient)
 
 
 @router.delete("/{ingredient_id}", status_code=status.HTTP_204_NO_CONTENT)
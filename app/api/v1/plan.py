@@ -0,0 +1,114 @@
+"""Endpoints del plan semanal de comidas y de la lista de compras."""
+
+import uuid
+from datetime import date, timedelta
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession as Session
+
+from app.dependencies import get_db, get_read_db
+from app.models import (
+    MealType,
+    PlanEntryCreate,
+    PlanEntryResponse,
+    PlanResponse,
+    ShoppingListResponse,
+)
+from app.services import (
+    delete_plan_entry,
+    get_plan,
+    get_shopping_list,
+    upsert_plan_entry,
+)
+
+router = APIRouter(prefix="/plan", tags=["plan"])
+
+
+def _week_range(start: date | None, end: date | None) -> tuple[date, date]:
+    # Por defecto: la semana que empieza hoy (o en ``start``)
+    start = start or date.today()
+    return start, end or start + timedelta(days=6)
+
+
+@router.get("/", response_model=PlanResponse)
+async def read_plan(
+    user_id: uuid.UUID,
+    start: date | None = None,
+    end: date | None = None,
+    db: Session = Depends(get_read_db),  # noqa: B008
+):
+    """Obtiene el plan de comidas de un usuario.
+
+    Args:
+        user_id (uuid.UUID): ID del usuario.
+        start (date | None): Primer día; por defecto hoy.
+        end (date | None): Último día; por defecto seis días después de ``start``.
+        db (Session): Sesión de la base de datos. Defaults to Depends(get_read_db).
+
+    Returns:
+        PlanResponse: Comidas planificadas del rango.
+    """
+    start, end = _week_range(start, end)
+    return await get_plan(db, user_id, start, end)
+
+
+@router.post(
+    "/", response_model=PlanEntryResponse, status_code=status.HTTP_201_CREATED
+)
+async def plan_meal(
+    entry: PlanEntryCreate,
+    db: Session = Depends(get_db),  # noqa: B008
+):
+    """Crea o reemplaza la comida planificada de un día.
+
+    Args:
+        entry (PlanEntryCreate): Usuario, día, comida, receta y porciones.
+        db (Session): Sesión de la base de datos. Defaults to Depends(get_db).
+
+    Returns:
+        PlanEntryResponse: La comida planificada.
+    """
+    return await upsert_plan_entry(db, entry)
+
+
+@router.delete("/{day}/{meal}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_planned_meal(
+    day: date,
+    meal: MealType,
+    user_id: uuid.UUID,
+    db: Session = Depends(get_db),  # noqa: B008
+):
+    """Borra la comida planificada de un día.
+
+    Args:
+        day (date): Día de la comida.
+        meal (MealType): Comida a borrar.
+        user_id (uuid.UUID): ID del usuario.
+        db (Session): Sesión de la base de datos. Defaults to Depends(get_db).
+    """
+    await delete_plan_entry(db, user_id, day, meal)
+    return None
+
+
+@router.get("/shopping-list", response_model=ShoppingListResponse)
+async def read_shopping_list(
+    user_id: uuid.UUID,
+    start: date | None = None,
+    end: date | None = None,
+    include_optional: bool = False,
+    db: Session = Depends(get_read_db),  # noqa: B008
+):
+    """Genera la lista de compras consolidada del plan de un usuario.
+
+    Args:
+        user_id (uuid.UUID): ID del usuario.
+        start (date | None): Primer día; por defecto hoy.
+        end (date | None): Último día; por defecto seis días después de ``start``.
+        include_optional (bool): Incluir ingredientes opcionales.
+        db (Session): Sesión de la base de datos. Defaults to Depends(get_read_db).
+
+    Returns:
+        ShoppingListResponse: Ingredientes y cantidades totales a comprar.
+    """
+    start, end = _week_range(start, end)
+    return await get_shopping_list(db, user_id, start, end, include_optional)
@@ -0,0 +1,167 @@
+"""Endpoints de recetas."""
+
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession as Session
+
+from app.api.conditional import (
+    has_conditional_headers,
+    is_not_modified,
+    not_modified,
+    timestamp_etag,
+    validator_headers,
+)
+from app.api.responses import JSONBytesResponse
+from app.dependencies import get_db, get_read_db
+from app.models import (
+    RecipeMatchRequest,
+    RecipeMatchResponse,
+    RecipeSearchResponse,
+    RecipesListResponse,
+    RecipeSort,
+    RecipesResponse,
+    RecipesUpdate,
+)
+from app.services import (
+    get_cached_recipe,
+    get_recipe_last_modified,
+    get_recipes_json,
+    match_recipes,
+    search_recipes,
+    update_recipe,
+)
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+router = APIRouter(prefix="/recipes", tags=["recipes"])
+
+
+@router.get("/", response_model=RecipesListResponse)
+async def list_recipes(
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    sort: RecipeSort = RecipeSort.CREATED,
+    db: Session = Depends(get_read_db),  # noqa: B008
+):
+    """Obtiene una página de recetas públicas.
+
+    El cuerpo se arma con el JSON ya serializado de cada receta (cache en memoria),
+    sin volver a validar los DTOs.
+
+    Args:
+        limit (int): Cantidad máxima de recetas por página.
+        cursor (str | None): Cursor `next_cursor` de la página anterior.
+        sort (RecipeSort): `created`, `ingredients` (menos primero) o `time`
+            (más rápidas primero).
+        db (Session): Sesión de la base de datos. Defaults to Depends(get_read_db).
+
+    Returns:
+        RecipesListResponse: Página de recetas y cursor siguiente.
+    """
+    data = await get_recipes_json(db, limit=limit, cursor=cursor, sort=sort)
+    return JSONBytesResponse(data)
+
+
+@router.post("/match", response_model=RecipeMatchResponse)
+async def match_recipes_by_ingredients(
+    request: RecipeMatchRequest,
+    db: Session = Depends(get_db),  # noqa: B008
+):
+    """Busca recetas que se pueden cocinar con los ingredientes disponibles.
+
+    Ordena por cobertura de ingredientes requeridos; los opcionales no cuentan.
+
+    Args:
+        request (RecipeMatchRequest): Ingredientes disponibles, límite y cobertura mínima.
+        db (Session): Sesión de la base de datos. Defaults to Depends(get_db).
+
+    Returns:
+        RecipeMatchResponse: Recetas ordenadas de mayor a menor cobertura.
+    """
+    return await match_recipes(db, request)
+
+
+@router.get("/search", response_model=RecipeSearchResponse)
+async def search_recipes_by_text(
+    q: str = Query(min_length=1, max_length=200),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_read_db),  # noqa: B008
+):
+    """Busca recetas públicas por texto en nombre, descripción, instrucciones e ingredientes.
+
+    Cada palabra se busca como prefijo ("tort" encuentra "tortilla") y los
+    resultados se ordenan por relevancia (bm25).
+
+    Args:
+        q (str): Texto a buscar.
+        limit (int): Cantidad máxima de resultados.
+        db (Session): Sesión de la base de datos. Defaults to Depends(get_read_db).
+
+    Returns:
+        RecipeSearchResponse: Recetas ordenadas de mayor a menor relevancia.
+    """
+    return await search_recipes(db, q, limit)
+
+
+@router.get("/{recipe_id}", response_model=RecipesResponse)
+async def get_recipe_by_id(
+    recipe_id: uuid.UUID,
+    request: Request,
+    db: Session = Depends(get_read_db),  # noqa: B008
+):
+    """Obtiene una receta pública por su ID, con ingredientes y categorías.
+
+    Responde 304 si el cliente ya tiene la versión actual; la fecha de
+    modificación sale de la cache o de una consulta agregada, sin cargar el árbol.
+
+    Args:
+        recipe_id (uuid.UUID): ID de la receta.
+        request (Request): Petición entrante, para leer las precondiciones.
+        db (Session): Sesión de la base de datos. Defaults to Depends(get_read_db).
+
+    Returns:
+        RecipesResponse: La receta encontrada.
+    """
+    if has_conditional_headers(request):
+        last_modified = await get_recipe_last_modified(db, recipe_id)
+        etag = timestamp_etag(last_modified)
+        if is_not_modified(request, etag, last_modified):
+            return not_modified(etag, last_modified)
+    entry = await get_cached_recipe(db, recipe_id)
+    return JSONBytesResponse(
+        entry.data,
+        headers=validator_headers(
+            timestamp_etag(entry.last_modified), entry.last_modified
+        ),
+    )
+
+
+@router.put("/{recipe_id}", response_model=RecipesResponse)
+async def update_existing_recipe(
+    recipe_id: uuid.UUID,
+    recipe: RecipesUpdate,
+    db: Session = Depends(get_db),  # noqa: B008
+):
+    """Actualiza una receta y reemplaza su lista de ingredientes.
+
+    Los ingredientes se reconcilian contra los actuales: solo se escriben las
+    filas que cambian. La receta sale de la cache y del índice por ingredientes
+    (o se reindexa si sigue siendo pública).
+
+    Args:
+        recipe_id (uuid.UUID): ID de la receta a actualizar.
+        recipe (RecipesUpdate): Campos a modificar y lista completa de ingredientes.
+        db (Session): Sesión de la base de datos. Defaults to Depends(get_db).
+
+    Returns:
+        RecipesResponse: La receta actualizada.
+
+    Raises:
+        HTTPException: Si el ID del cuerpo no coincide con el de la ruta.
+    """
+    if recipe.recipe_id != recipe_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="El ID de la receta no coincide con el de la ruta.",
+        )
+    return await update_recipe(db, recipe)
@@ -1,12 +1,24 @@
 """ "Endpoints para la gestión de usuarios."""
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
 from pydantic import EmailStr
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 
-from app.dependencies import get_db
+from app.api.conditional import (
+    has_conditional_headers,
+    is_not_modified,
+    not_modified,
+    timestamp_etag,
+    validator_headers,
+)
+from app.dependencies import get_db, get_read_db
 from app.models import UserCreate, UserResponse, UserUpdate
-from app.services import create_user, get_user_by_email, update_user
+from app.services import (
+    create_user,
+    get_user_by_email,
+    get_user_last_modified,
+    update_user,
+)
 
 # Configuración del router
 router = APIRouter(prefix="/users", tags=["users"])
@@ -27,14 +39,33 @@ async def register_user(user: UserCreate, db: Session = Depends(get_db)):  # noq
 @router.get(
     "/{user_email}", response_model=UserResponse, status_code=status.HTTP_200_OK
 )
-async def get_user(user_email: EmailStr, db: Session = Depends(get_db)):  # noqa: B008
+async def get_user(
+    user_email: EmailStr,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_read_db),  # noqa: B008
+):
     """Obtiene los detalles de un usuario por su email.
 
+    Responde 304 si el cliente ya tiene la versión actual (``If-None-Match`` o
+    ``If-Modified-Since``), consultando solo la fecha de modificación.
+
     Args:
         user_email (EmailStr): Email del usuario a obtener.
-        db (Session, optional): Sesión de la base de datos. Defaults to Depends(get_db).
+        request (Request): Petición entrante, para leer las precondiciones.
+        response (Response): Respuesta, para agregar ETag y Last-Modified.
+        db (Session, optional): Sesión de la base de datos. Defaults to Depends(get_read_db).
     """
-    return await get_user_by_email(db, user_email)
+    if has_conditional_headers(request):
+        last_modified = await get_user_last_modified(db, user_email)
+        etag = timestamp_etag(last_modified)
+        if is_not_modified(request, etag, last_modified):
+            return not_modified(etag, last_modified)
+    user = await get_user_by_email(db, user_email)
+    response.headers.update(
+        validator_headers(timestamp_etag(user.updated_at), user.updated_at)
+    )
+    return user
 
 
 @router.put(
@@ -53,3 +84,21 @@ async def update_user_by_email(
         db (Session, optional): Sesión de la base de datos. Defaults to Depends(get_db).
     """
     return await update_user(db, user_email, user_update)
+
+
+@router.patch(
+    "/{user_email}", response_model=UserResponse, status_code=status.HTTP_200_OK
+)
+async def patch_user_by_email(
+    user_email: EmailStr,
+    user_update: UserUpdate,
+    db: Session = Depends(get_db),  # noqa: B008
+):
+    """Modifica solo los campos enviados de un usuario.
+
+    Args:
+        user_email (EmailStr): Email del usuario a modificar.
+        user_update (UserUpdate): Campos a modificar.
+        db (Session, optional): Sesión de la base de datos. Defaults to Depends(get_db).
+    """
+    return await update_user(db, user_email, user_update)
@@ -0,0 +1,33 @@
+"""Recalcula las estadísticas materializadas de recetas e ingredientes.
+
+Sirve como backfill tras la migración y como reparación si los contadores se
+desviaron (por ejemplo, por escrituras directas en la base). Usa la base de
+``DATABASE_URL``::
+
+    python -m app.commands.recount_stats
+
+Los procesos de la API ya iniciados conservan su autocompletado en memoria
+hasta reiniciarse.
+"""
+
+import asyncio
+import sys
+
+from app.core.db import async_session, database
+from app.services.recipe_stats import recount_recipe_stats
+
+
+async def main() -> int:
+    """Ejecuta el recálculo e informa cuántas filas se corrigieron."""
+    async with async_session() as db:
+        fixed = await recount_recipe_stats(db)
+    await database.dispose()
+    print(
+        f"Ingredientes corregidos: {fixed['ingredients']}; "
+        f"recetas corregidas: {fixed['recipes']}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -1,7 +1,21 @@
 # app/core/__init__.py
 # Expone los módulos principales de la capa core.
 
-from .db import async_session  # noqa: F401
-from .security import get_hash_password, verify_password  # noqa: F401
+from .db import async_read_session, async_session  # noqa: F401
+from .security import (  # noqa: F401
+    get_hash_password,
+    get_hash_password_async,
+    password_hash_pool,
+    verify_password,
+    verify_password_async,
+)
 
-__all__ = ("async_session", "get_hash_password", "verify_password")
+__all__ = (
+    "async_read_session",
+    "async_session",
+    "get_hash_password",
+    "get_hash_password_async",
+    "password_hash_pool",
+    "verify_password",
+    "verify_password_async",
+)
@@ -1,21 +1,353 @@
 """ "Este modulo define la conexion a la base de datos y la configuración del ORM."""
 
 import os
+import uuid
+from contextlib import AsyncExitStack
+from typing import Any
 
-from dotenv import load_dotenv
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy import event, text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
-load_dotenv()  # Cargar variables de entorno desde un archivo .env
+from .metrics import instrument_engine
 
+# Los ajustes se leen del entorno al crear cada motor, no al importar el
+# módulo: así también toman los valores del archivo .env (ver ``Database``).
 
-# definimos la ubicacion de la DB
-DATABASE_URL = os.getenv("DATABASE_URL")
-# Verificamos que la variable de entorno esté definida
-if DATABASE_URL is None:
-    raise RuntimeError("La variable de entorno DATABASE_URL no está definida.")
 
-# Crear el motor de la base de datos
-engine = create_async_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+def _postgres_settings() -> dict[str, str]:
+    """Ajustes de las conexiones PostgreSQL (asyncpg).
 
-# creamos la sesion
-async_session = async_sessionmaker(engine, expire_on_commit=False)
+    Con PgBouncer en modo transacción, ``PG_STATEMENT_CACHE_SIZE=0``: no
+    conserva sentencias preparadas entre transacciones.
+
+    Returns:
+        dict[str, str]: Ajustes tomados de variables de entorno.
+    """
+    return {
+        "statement_cache_size": os.getenv("PG_STATEMENT_CACHE_SIZE", "100"),
+        "statement_timeout": os.getenv("PG_STATEMENT_TIMEOUT_MS", "30000"),
+        "connect_timeout": os.getenv("PG_CONNECT_TIMEOUT", "10"),
+        "application_name": os.getenv("PG_APPLICATION_NAME", "chequecomemos-api"),
+    }
+
+
+def normalize_database_url(database_url: str) -> URL:
+    """Interpreta la URL de conexión y fija el driver asíncrono de PostgreSQL.
+
+    Los proveedores suelen entregar ``postgres://`` o ``postgresql://``, que
+    SQLAlchemy resolvería con un driver síncrono: se usa asyncpg.
+
+    Args:
+        database_url (str): URL de conexión a la base de datos.
+
+    Returns:
+        URL: La URL lista para ``create_async_engine``.
+    """
+    url = make_url(database_url)
+    if url.drivername in ("postgres", "postgresql"):
+        url = url.set(drivername="postgresql+asyncpg")
+    return url
+
+
+def _is_sqlite_memory(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def _pool_options(url: URL) -> dict[str, Any]:
+    """Opciones del pool de conexiones tomadas de variables de entorno.
+
+    Args:
+        url (URL): URL de la base de datos.
+
+    Returns:
+        dict[str, Any]: Argumentos para ``create_async_engine``.
+    """
+    # SQLite en memoria usa un StaticPool, que no acepta opciones de tamaño
+    if _is_sqlite_memory(url):
+        return {}
+    options: dict[str, Any] = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+    }
+    # Un servidor remoto puede cortar conexiones ociosas: se verifican al tomarlas
+    if url.get_backend_name() != "sqlite":
+        options["pool_pre_ping"] = os.getenv("DB_POOL_PRE_PING", "1") == "1"
+    return options
+
+
+def _connect_args(url: URL, read_only: bool) -> dict[str, Any]:
+    """Argumentos del driver según el backend.
+
+    Args:
+        url (URL): URL de la base de datos.
+        read_only (bool): Si el motor es de solo lectura.
+
+    Returns:
+        dict[str, Any]: ``connect_args`` para ``create_async_engine``.
+    """
+    backend = url.get_backend_name()
+    if backend == "sqlite":
+        busy_timeout_s = int(_sqlite_pragmas(read_only)["busy_timeout"]) / 1000
+        return {"check_same_thread": False, "timeout": busy_timeout_s}
+    if backend != "postgresql":
+        return {}
+    settings = _postgres_settings()
+    server_settings = {
+        "statement_timeout": settings["statement_timeout"],
+        "application_name": settings["application_name"],
+    }
+    if read_only:
+        server_settings["default_transaction_read_only"] = "on"
+    cache_size = int(settings["statement_cache_size"])
+    connect_args: dict[str, Any] = {
+        "timeout": float(settings["connect_timeout"]),
+        "server_settings": server_settings,
+        # Cache de asyncpg y cache propia del dialecto de SQLAlchemy
+        "statement_cache_size": cache_size,
+        "prepared_statement_cache_size": cache_size,
+    }
+    if cache_size == 0:
+        # Nombres únicos: PgBouncer puede repetir una conexión del servidor
+        connect_args["prepared_statement_name_func"] = _prepared_statement_name
+    return connect_args
+
+
+def _prepared_statement_name() -> str:
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+def _sqlite_pragmas(read_only: bool) -> dict[str, str]:
+    """Pragmas para las conexiones SQLite de un motor.
+
+    WAL permite lectores concurrentes con un escritor, busy_timeout espera el
+    lock en vez de fallar con "database is locked" y mmap/cache reducen
+    lecturas al disco.
+
+    Args:
+        read_only (bool): Si el motor es de solo lectura.
+
+    Returns:
+        dict[str, str]: Pragmas en el orden en que se aplican.
+    """
+    pragmas = {
+        "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+        "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+        "busy_timeout": os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"),
+        "mmap_size": os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)),
+        # Valor negativo: tamaño en KiB (64 MiB)
+        "cache_size": os.getenv("SQLITE_CACHE_SIZE", "-64000"),
+    }
+    if read_only:
+        # El modo WAL persiste en el archivo (lo fija el motor de escritura) y
+        # cambiarlo es una escritura: el lector solo activa query_only
+        del pragmas["journal_mode"]
+        pragmas["query_only"] = "ON"
+    return pragmas
+
+
+def create_engine(database_url: str, read_only: bool = False) -> AsyncEngine:
+    """Crea el motor asíncrono con el pool y los ajustes propios del backend.
+
+    Args:
+        database_url (str): URL de conexión a la base de datos.
+        read_only (bool): Motor para lecturas; rechaza toda escritura
+            (``PRAGMA query_only`` en SQLite, ``default_transaction_read_only``
+            en PostgreSQL).
+
+    Returns:
+        AsyncEngine: El motor configurado, con las métricas por petición de
+        ``app.core.metrics``.
+    """
+    url = normalize_database_url(database_url)
+    new_engine = create_async_engine(
+        url, connect_args=_connect_args(url, read_only), **_pool_options(url)
+    )
+    if url.get_backend_name() == "sqlite":
+        pragmas = _sqlite_pragmas(read_only)
+
+        def set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+            # Se aplican a cada conexión nueva del pool
+            cursor = dbapi_connection.cursor()
+            try:
+                for pragma, value in pragmas.items():
+                    cursor.execute(f"PRAGMA {pragma}={value}")
+            finally:
+                cursor.close()
+
+        event.listen(new_engine.sync_engine, "connect", set_sqlite_pragmas)
+    # Cada motor se instrumenta al crearse, también los recreados tras dispose()
+    instrument_engine(new_engine)
+    return new_engine
+
+
+def create_read_engine(read_url: str | None, write_engine: AsyncEngine) -> AsyncEngine:
+    """Crea el motor de lecturas, o reutiliza el de escritura si no hay uno aparte.
+
+    Con ``DATABASE_READ_URL`` apuntando a una réplica (PostgreSQL) o al mismo
+    archivo SQLite, los GET usan su propio pool y no compiten con el escritor
+    por conexiones. SQLite en memoria no admite un segundo motor: cada conexión
+    nueva sería otra base vacía.
+
+    Args:
+        read_url (str | None): URL de la base para lecturas, si se configuró.
+        write_engine (AsyncEngine): Motor principal.
+
+    Returns:
+        AsyncEngine: El motor para las sesiones de solo lectura.
+    """
+    if not read_url or _is_sqlite_memory(normalize_database_url(read_url)):
+        return write_engine
+    return create_engine(read_url, read_only=True)
+
+
+def is_unique_violation(error: IntegrityError) -> bool:
+    """Indica si un ``IntegrityError`` proviene de una restricción UNIQUE.
+
+    Args:
+        error (IntegrityError): El error lanzado por el driver.
+
+    Returns:
+        bool: True si se violó una restricción de unicidad.
+    """
+    # PostgreSQL informa el SQLSTATE 23505; SQLite solo el mensaje
+    if getattr(error.orig, "sqlstate", None) == "23505":
+        return True
+    return "UNIQUE constraint failed" in str(error.orig)
+
+
+class Database:
+    """Motores y fábricas de sesiones de la aplicación, creados en el primer uso.
+
+    Importar la aplicación no lee ``DATABASE_URL`` ni crea motores: el primer
+    acceso carga el archivo .env, valida la URL y arma el motor principal y el
+    de lecturas (``DATABASE_READ_URL``). El lifespan llama a ``warm_up`` al
+    iniciar, para que la primera petición no pague la conexión, y a
+    ``dispose`` al cerrar; después de ``dispose`` los motores se recrean en el
+    próximo uso.
+
+    Se configura con variables de entorno: ``DATABASE_URL``,
+    ``DATABASE_READ_URL`` y ``DB_WARMUP_CONNECTIONS`` (conexiones abiertas por
+    motor al iniciar, por defecto 1).
+    """
+
+    def __init__(self, url: str | None = None, read_url: str | None = None) -> None:
+        self._url = url
+        self._read_url = read_url
+        self._engine: AsyncEngine | None = None
+        self._read_engine: AsyncEngine | None = None
+        self._session: async_sessionmaker[AsyncSession] | None = None
+        self._read_session: async_sessionmaker[AsyncSession] | None = None
+
+    def _configure(self) -> None:
+        if self._engine is not None:
+            return
+        # python-dotenv solo hace falta al configurar, no al importar
+        from dotenv import load_dotenv
+
+        load_dotenv()  # Cargar variables de entorno desde un archivo .env
+        url = self._url or os.getenv("DATABASE_URL")
+        if url is None:
+            raise RuntimeError("La variable de entorno DATABASE_URL no está definida.")
+        engine = create_engine(url)
+        read_url = self._read_url or os.getenv("DATABASE_READ_URL")
+        read_engine = create_read_engine(read_url, engine)
+        # Sin expirar tras el commit: los servicios devuelven los objetos recién
+        # escritos (IDs y fechas generados en el cliente) sin releerlos
+        self._session = async_sessionmaker(engine, expire_on_commit=False)
+        self._read_session = async_sessionmaker(
+            read_engine, expire_on_commit=False, autoflush=False
+        )
+        self._engine, self._read_engine = engine, read_engine
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """Motor principal (escrituras)."""
+        self._configure()
+        assert self._engine is not None
+        return self._engine
+
+    @property
+    def read_engine(self) -> AsyncEngine:
+        """Motor de lecturas; el principal si no hay ``DATABASE_READ_URL``."""
+        self._configure()
+        assert self._read_engine is not None
+        return self._read_engine
+
+    def session(self) -> AsyncSession:
+        """Abre una sesión sobre el motor principal."""
+        self._configure()
+        assert self._session is not None
+        return self._session()
+
+    def read_session(self) -> AsyncSession:
+        """Abre una sesión sobre el motor de lecturas."""
+        self._configure()
+        assert self._read_session is not None
+        return self._read_session()
+
+    def engines(self) -> list[AsyncEngine]:
+        """Motores ya creados, sin crearlos.
+
+        Returns:
+            list[AsyncEngine]: El principal y, si es otro, el de lecturas.
+        """
+        if self._engine is None:
+            return []
+        if self._read_engine is None or self._read_engine is self._engine:
+            return [self._engine]
+        return [self._engine, self._read_engine]
+
+    async def warm_up(self, connections: int | None = None) -> None:
+        """Crea los motores y abre conexiones en cada pool antes de la primera petición.
+
+        Args:
+            connections (int | None): Conexiones por motor; por defecto
+                ``DB_WARMUP_CONNECTIONS``.
+        """
+        self._configure()
+        if connections is None:
+            connections = int(os.getenv("DB_WARMUP_CONNECTIONS", "1"))
+        for engine in self.engines():
+            # Se mantienen abiertas juntas para que el pool no reutilice la misma
+            async with AsyncExitStack() as stack:
+                for _ in range(max(connections, 1)):
+                    conn = await stack.enter_async_context(engine.connect())
+                    await conn.execute(text("SELECT 1"))
+
+    async def dispose(self) -> None:
+        """Cierra las conexiones de los pools; los motores se recrean en el próximo uso."""
+        for engine in self.engines():
+            await engine.dispose()
+        self._engine = self._read_engine = None
+        self._session = self._read_session = None
+
+
+# Instancia única por proceso
+database = Database()
+
+
+def async_session() -> AsyncSession:
+    """Abre una sesión sobre el motor principal.
+
+    Returns:
+        AsyncSession: Sesión nueva; usarla con ``async with``.
+    """
+    return database.session()
+
+
+def async_read_session() -> AsyncSession:
+    """Abre una sesión sobre el motor de lecturas (ver ``get_read_db``).
+
+    Returns:
+        AsyncSession: Sesión nueva; usarla con ``async with``.
+    """
+    return database.read_session()
@@ -0,0 +1,255 @@
+"""Instrumentación de latencia y consultas a la base de datos por petición.
+
+Un middleware ASGI mide cada petición y, mediante los eventos
+``before_cursor_execute``/``after_cursor_execute`` de SQLAlchemy, cuenta las
+consultas y el tiempo total en la base de datos. Los resultados se publican
+como cabecera ``Server-Timing`` y como histogramas en formato Prometheus en
+``/metrics``, lo que permite detectar regresiones N+1 antes de producción.
+"""
+
+import time
+from collections.abc import Callable, Iterable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Límites (en segundos) de los histogramas de latencia
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Límites de los histogramas de consultas por petición
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@dataclass
+class RequestStats:
+    """Acumulador de consultas de la petición en curso."""
+
+    queries: int = 0
+    db_time: float = 0.0
+
+
+# Estadísticas de la petición en curso; None fuera de una petición
+_current_stats: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats", default=None
+)
+
+
+class Histogram:
+    """Histograma acumulativo con etiquetas, al estilo de Prometheus."""
+
+    def __init__(self, name: str, help_text: str, buckets: Iterable[float]) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        self._series: dict[tuple[tuple[str, str], ...], list[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Registra una observación para la combinación de etiquetas dada."""
+        key = tuple(sorted(labels.items()))
+        # Por cada serie: conteos por bucket, suma y cantidad total
+        series = self._series.setdefault(key, [0.0] * (len(self.buckets) + 2))
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[i] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self) -> list[str]:
+        """Devuelve las líneas de exposición en formato de texto de Prometheus."""
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for key, series in sorted(self._series.items()):
+            for bound, count in zip(self.buckets, series, strict=False):
+                lines.append(
+                    f"{self.name}_bucket{_labels(key, le=_number(bound))} {_number(count)}"
+                )
+            lines.append(
+                f"{self.name}_bucket{_labels(key, le='+Inf')} {_number(series[-1])}"
+            )
+            lines.append(f"{self.name}_sum{_labels(key)} {series[-2]}")
+            lines.append(f"{self.name}_count{_labels(key)} {_number(series[-1])}")
+        return lines
+
+
+class Counter:
+    """Contador monótono con etiquetas, al estilo de Prometheus."""
+
+    def __init__(self, name: str, help_text: str) -> None:
+        self.name = name
+        self.help_text = help_text
+        self._series: dict[tuple[tuple[str, str], ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """Incrementa la serie de la combinación de etiquetas dada."""
+        key = tuple(sorted(labels.items()))
+        self._series[key] = self._series.get(key, 0) + amount
+
+    def render(self) -> list[str]:
+        """Devuelve las líneas de exposición en formato de texto de Prometheus."""
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} counter",
+        ]
+        for key, value in sorted(self._series.items()):
+            lines.append(f"{self.name}{_labels(key)} {_number(value)}")
+        return lines
+
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Latencia de las peticiones HTTP por ruta.",
+    LATENCY_BUCKETS,
+)
+REQUESTS_TOTAL = Counter("http_requests_total", "Peticiones HTTP por ruta y estado.")
+DB_QUERIES = Histogram(
+    "db_queries_per_request",
+    "Consultas a la base de datos por petición.",
+    QUERY_COUNT_BUCKETS,
+)
+DB_TIME = Histogram(
+    "db_time_per_request_seconds",
+    "Tiempo total en la base de datos por petición.",
+    LATENCY_BUCKETS,
+)
+
+# Métricas puntuales (gauges) aportadas por otros módulos, p. ej. caches y pools
+_gauge_providers: list[Callable[[], dict[str, float]]] = []
+
+
+def register_gauges(provider: Callable[[], dict[str, float]]) -> None:
+    """Registra una función que devuelve gauges ``{nombre: valor}`` para /metrics.
+
+    Args:
+        provider (Callable[[], dict[str, float]]): Función invocada en cada lectura.
+    """
+    _gauge_providers.append(provider)
+
+
+def render_metrics() -> str:
+    """Genera el texto de exposición de Prometheus con todas las métricas.
+
+    Returns:
+        str: Métricas en formato de texto de Prometheus.
+    """
+    lines: list[str] = []
+    for metric in (REQUEST_LATENCY, REQUESTS_TOTAL, DB_QUERIES, DB_TIME):
+        lines.extend(metric.render())
+    for provider in _gauge_providers:
+        for name, value in provider().items():
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {_number(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Cuenta consultas y tiempo en la base de datos de la petición en curso.
+
+    Args:
+        engine (AsyncEngine): Motor a instrumentar.
+    """
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: Any,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: Any,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    started = conn.info["query_start_time"].pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_time += time.perf_counter() - started
+
+
+class MetricsMiddleware:
+    """Middleware ASGI que mide latencia, consultas y tiempo de DB por petición."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Any) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed = time.perf_counter() - started
+                header = (
+                    f'db;dur={stats.db_time * 1000:.2f};desc="{stats.queries} queries", '
+                    f"app;dur={elapsed * 1000:.2f}"
+                )
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", header.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_stats.reset(token)
+            elapsed = time.perf_counter() - started
+            route = _route_template(scope)
+            method = scope["method"]
+            REQUEST_LATENCY.observe(elapsed, method=method, route=route)
+            REQUESTS_TOTAL.inc(method=method, route=route, status=str(status_code))
+            DB_QUERIES.observe(stats.queries, method=method, route=route)
+            DB_TIME.observe(stats.db_time, method=method, route=route)
+
+
+def _route_template(scope: Any) -> str:
+    # Se etiqueta por plantilla de ruta (no por URL) para acotar la cardinalidad:
+    # cada segmento que es un parámetro de ruta se reemplaza por su nombre.
+    if scope.get("route") is None:
+        return "unmatched"
+    params = {str(value): name for name, value in scope.get("path_params", {}).items()}
+    segments = scope["path"].split("/")
+    return "/".join(
+        f"{{{params[segment]}}}" if segment in params else segment
+        for segment in segments
+    )
+
+
+def _labels(key: tuple[tuple[str, str], ...], **extra: str) -> str:
+    pairs = [*key, *extra.items()]
+    if not pairs:
+        return ""
+    body = ",".join(f'{name}="{_escape(value)}"' for name, value in pairs)
+    return "{" + body + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else str(value)
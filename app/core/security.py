@@ -1,7 +1,15 @@
 """Modulo de seguridad utilizando passlib para hashear contraseñas"""
 
+import asyncio
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, TypeVar
+
 import bcrypt
 
+T = TypeVar("T")
+
 
 def get_hash_password(password: str) -> str:
     """
@@ -33,3 +41,142 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     plain_bytes = plain_password.encode("utf-8")
     hashed_bytes = hashed_password.encode("utf-8")
     return bcrypt.checkpw(plain_bytes, hashed_bytes)
+
+
+class PasswordHashPool:
+    """Pool acotado para ejecutar bcrypt fuera del event loop.
+
+    bcrypt tarda cientos de milisegundos por llamada; ejecutarlo dentro de un
+    ``async def`` bloquea a todas las demás peticiones del worker. Este pool lo
+    delega a un ``ThreadPoolExecutor`` (bcrypt libera el GIL) o a un
+    ``ProcessPoolExecutor``, limita cuántas operaciones corren a la vez y expone
+    la profundidad de la cola.
+
+    Por defecto usa hilos, ``min(4, cpu_count)`` workers y tantas operaciones a
+    la vez como workers; el lifespan lo reconfigura con ``configure``.
+    """
+
+    def __init__(
+        self,
+        kind: str = "thread",
+        max_workers: int | None = None,
+        max_concurrency: int | None = None,
+    ) -> None:
+        self._executor: Executor | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        # Métricas: peticiones esperando turno, en ejecución y completadas
+        self.waiting = 0
+        self.running = 0
+        self.completed = 0
+        self.configure(kind, max_workers, max_concurrency)
+
+    def configure(
+        self,
+        kind: str = "thread",
+        max_workers: int | None = None,
+        max_concurrency: int | None = None,
+    ) -> None:
+        """
+        Cambia el tipo y el tamaño del pool; los workers se recrean en el próximo uso.
+
+        args:
+        kind (str) -- ``thread`` o ``process``.
+        max_workers (int | None) -- Workers del pool; por defecto ``min(4, cpu_count)``.
+        max_concurrency (int | None) -- Operaciones a la vez; por defecto los workers.
+        """
+        if kind not in ("thread", "process"):
+            raise RuntimeError(
+                f"PASSWORD_HASH_EXECUTOR inválido: {kind!r} (thread|process)."
+            )
+        self.shutdown()
+        self.kind = kind
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.max_concurrency = max_concurrency or self.max_workers
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="bcrypt"
+                )
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Ejecuta ``func(*args)`` en el pool respetando el límite de concurrencia.
+
+        args:
+        func (Callable[..., T]) -- Función bloqueante a ejecutar.
+        *args (Any) -- Argumentos de la función.
+
+        Return: El resultado de la función.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        semaphore = self._semaphore
+        self.waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self.running -= 1
+            self.completed += 1
+            semaphore.release()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Devuelve las métricas del pool.
+
+        Return: Profundidad de cola, operaciones en curso y completadas.
+        """
+        return {
+            "waiting": self.waiting,
+            "running": self.running,
+            "completed": self.completed,
+            "max_concurrency": self.max_concurrency,
+        }
+
+    def shutdown(self) -> None:
+        """Libera los workers del pool; se recrean en el próximo uso."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._semaphore = None
+
+
+# Pool único por proceso
+password_hash_pool = PasswordHashPool()
+
+
+async def get_hash_password_async(password: str) -> str:
+    """
+    Hashea una contraseña con bcrypt sin bloquear el event loop.
+
+    args:
+    password (str) -- La contraseña en texto plano a hashear.
+
+    Return: La contraseña hasheada.
+    """
+    return await password_hash_pool.run(get_hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verifica una contraseña con bcrypt sin bloquear el event loop.
+
+    args:
+    plain_password (str) -- La contraseña en texto plano a verificar.
+    hashed_password (str) -- La contraseña hasheada contra la que se verifica.
+
+    Return: True si las contraseñas coinciden, False en caso contrario.
+    """
+    return await password_hash_pool.run(
+        verify_password, plain_password, hashed_password
+    )
@@ -1,3 +1,3 @@
-from .get_db import get_db
+from .get_db import get_db, get_read_db
 
-__all__ = ["get_db"]
+__all__ = ["get_db", "get_read_db"]
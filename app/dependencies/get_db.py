@@ -1,9 +1,20 @@
 """dependencia para obtener la sesion de la DB en FastAPI"""
 
-from app.core import async_session
+from app.core import async_read_session, async_session
 
 
 async def get_db():
     """dependencias de FastAPI para obtener la sesion de la DB. Crea y cierra la sesion automaticamente"""
     async with async_session() as db:
         yield db
+
+
+async def get_read_db():
+    """dependencia de FastAPI para los endpoints de solo lectura (GET).
+
+    Usa el motor de lecturas (``DATABASE_READ_URL``): una réplica o un pool
+    aparte que no compite con las escrituras. Sin esa variable es igual a
+    ``get_db``.
+    """
+    async with async_read_session() as db:
+        yield db
@@ -1,8 +1,83 @@
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 
 from app.api import api_router
+from app.core import async_session, password_hash_pool
+from app.core.db import database
+from app.core.metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    MetricsMiddleware,
+    register_gauges,
+    render_metrics,
+)
+from app.services.category_cache import category_cache
+from app.services.ingredient_autocomplete import ingredient_autocomplete
+from app.services.recipe_cache import recipe_cache
+from app.services.recipe_index import recipe_index
+
+
+def configure_from_env() -> None:
+    """Aplica la configuración de la cache de recetas y del pool de bcrypt.
+
+    Se llama al iniciar, después de que ``Database`` cargó el archivo .env.
+    Variables: ``RECIPE_CACHE_SIZE`` (por defecto 2048), ``RECIPE_CACHE_TTL``
+    (segundos, por defecto 300), ``PASSWORD_HASH_EXECUTOR`` (``thread`` o
+    ``process``), ``PASSWORD_HASH_WORKERS`` (por defecto ``min(4, cpu_count)``)
+    y ``PASSWORD_HASH_MAX_CONCURRENCY`` (por defecto igual a los workers).
+    """
+    recipe_cache.configure(
+        max_size=int(os.getenv("RECIPE_CACHE_SIZE", "2048")),
+        ttl=float(os.getenv("RECIPE_CACHE_TTL", "300")),
+    )
+    workers = os.getenv("PASSWORD_HASH_WORKERS")
+    concurrency = os.getenv("PASSWORD_HASH_MAX_CONCURRENCY")
+    password_hash_pool.configure(
+        kind=os.getenv("PASSWORD_HASH_EXECUTOR", "thread"),
+        max_workers=int(workers) if workers else None,
+        max_concurrency=int(concurrency) if concurrency else None,
+    )
+
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Conecta la base y precarga las caches al iniciar; libera los pools al cerrar."""
+    # warm_up configura la base, que es quien carga el archivo .env
+    await database.warm_up()
+    configure_from_env()
+    async with async_session() as db:
+        await category_cache.load(db)
+        await recipe_index.load(db)
+        await ingredient_autocomplete.load(db)
+    yield
+    password_hash_pool.shutdown()
+    await database.dispose()
+
+
+app = FastAPI(lifespan=lifespan)
+
+app.add_middleware(MetricsMiddleware)
+register_gauges(
+    lambda: {f"category_cache_{k}": v for k, v in category_cache.stats().items()}
+)
+register_gauges(
+    lambda: {f"recipe_cache_{k}": v for k, v in recipe_cache.stats().items()}
+)
+register_gauges(
+    lambda: {f"recipe_index_{k}": v for k, v in recipe_index.stats().items()}
+)
+register_gauges(
+    lambda: {
+        f"ingredient_autocomplete_{k}": v
+        for k, v in ingredient_autocomplete.stats().items()
+    }
+)
+register_gauges(
+    lambda: {f"password_hash_{k}": v for k, v in password_hash_pool.stats().items()}
+)
 
 app.include_router(api_router)
 
@@ -10,3 +85,9 @@ app.include_router(api_router)
 @app.get("/")
 def read_root():
     return {"Hello": "World"}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Expone las métricas de la aplicación en formato Prometheus."""
+    return PlainTextResponse(render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -5,11 +5,30 @@ from .categories import (  # noqa: F401
     CategoryCreate,
 )
 from .ingredients import (  # noqa: F401
+    BulkConflictMode,
+    BulkRowStatus,
+    IngredientAutocompleteResponse,
+    IngredientBulkItem,
+    IngredientBulkResponse,
+    IngredientBulkResult,
     IngredientCreate,
+    IngredientPatch,
     IngredientResponse,
     Ingredients,
+    IngredientsListResponse,
+    IngredientSort,
+    IngredientSuggestion,
     IngredientUpdate,
 )
+from .plan_entries import (  # noqa: F401
+    MealType,
+    PlanEntries,
+    PlanEntryCreate,
+    PlanEntryResponse,
+    PlanResponse,
+    ShoppingListItem,
+    ShoppingListResponse,
+)
 from .recipe_ingredients import (  # noqa: F401
     RecipeIngredients,
     RecipeIngredientsCreate,
@@ -17,8 +36,15 @@ from .recipe_ingredients import (  # noqa: F401
     RecipeIngredientsUpdate,
 )
 from .recipes import (  # noqa: F401
+    RecipeMatch,
+    RecipeMatchRequest,
+    RecipeMatchResponse,
     Recipes,
     RecipesCreate,
+    RecipeSearchResponse,
+    RecipeSearchResult,
+    RecipesListResponse,
+    RecipeSort,
     RecipesResponse,
     RecipesUpdate,
 )
@@ -37,12 +63,36 @@ __all__ = [
     "IngredientCreate",
     "IngredientResponse",
     "IngredientUpdate",
+    "IngredientPatch",
+    "IngredientsListResponse",
+    "IngredientBulkItem",
+    "IngredientBulkResult",
+    "IngredientBulkResponse",
+    "IngredientSort",
+    "IngredientSuggestion",
+    "IngredientAutocompleteResponse",
+    "BulkConflictMode",
+    "BulkRowStatus",
     "Recipes",
     "RecipesCreate",
     "RecipesUpdate",
     "RecipesResponse",
+    "RecipesListResponse",
+    "RecipeMatch",
+    "RecipeMatchRequest",
+    "RecipeMatchResponse",
+    "RecipeSearchResponse",
+    "RecipeSearchResult",
+    "RecipeSort",
     "RecipeIngredients",
     "RecipeIngredientsCreate",
     "RecipeIngredientsUpdate",
     "RecipeIngredientsResponse",
+    "MealType",
+    "PlanEntries",
+    "PlanEntryCreate",
+    "PlanEntryResponse",
+    "PlanResponse",
+    "ShoppingListItem",
+    "ShoppingListResponse",
 ]
@@ -47,3 +47,5 @@ class CategoriesListResponse(SQLModel):
 
     # Respuesta para la lista de categorías.
     categories: list[CategorieSingleResponse]
+    # Cursor opaco para pedir la página siguiente; None si no hay más.
+    next_cursor: str | None = None
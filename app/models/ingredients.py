@@ -1,8 +1,11 @@
 """Modelo para la tabla ingredients y contrato para el cliente y la respuesta del servidor."""
 
 import uuid
+from datetime import datetime, timezone
+from enum import Enum
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Index
 from sqlmodel import (
     Field,  # pyright: ignore[reportUnknownVariableType]
     Relationship,
@@ -10,6 +13,7 @@ from sqlmodel import (
 )
 
 from .categories import Categories, CategorieSingleResponse
+from .types import UTCDateTime
 
 if TYPE_CHECKING:
     from app.models.recipe_ingredients import RecipeIngredients
@@ -27,14 +31,27 @@ class IngredientsBase(SQLModel):
 class Ingredients(IngredientsBase, table=True):
     """Modelo de la tabla ingredients en la base de datos."""
 
+    # Clave del listado por popularidad: (usage_count, ingredient_id)
+    __table_args__ = (
+        Index("ix_ingredients_usage_count", "usage_count", "ingredient_id"),
+    )
     ingredient_id: uuid.UUID = Field(
         default_factory=uuid.uuid4,
         primary_key=True,
         unique=True,
     )
+    # Único e indexado: clave de upsert y de orden del listado paginado.
+    name: str = Field(index=True, unique=True)
     category_id: uuid.UUID = Field(
         default_factory=uuid.uuid4, foreign_key="categories.category_id"
     )
+    # Fecha de la última modificación; validador de las peticiones condicionales.
+    updated_at: datetime = Field(  # type: ignore
+        default_factory=lambda: datetime.now(timezone.utc),  # noqa: UP017
+        sa_type=UTCDateTime,
+    )
+    # Recetas que usan el ingrediente; lo mantiene el servicio de recetas
+    usage_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
     category: "Categories" = Relationship(back_populates="ingredients")
     recipe_ingredients: list["RecipeIngredients"] = Relationship(
         back_populates="ingredient"
@@ -57,6 +74,16 @@ class IngredientUpdate(SQLModel):
     default_unit: str
 
 
+class IngredientPatch(SQLModel):
+    """
+    Modelo para actualizar parcialmente un ingrediente (PATCH).
+    Solo se modifican los campos enviados.
+    """
+
+    name: str | None = None
+    default_unit: str | None = None
+
+
 class IngredientResponse(IngredientsBase):
     """
     Modelo de respuesta para mostrar los datos completos de un ingrediente.
@@ -65,3 +92,83 @@ class IngredientResponse(IngredientsBase):
 
     ingredient_id: uuid.UUID
     category: "CategorieSingleResponse"
+
+
+class IngredientsListResponse(SQLModel):
+    """Modelo de respuesta para una página de ingredientes."""
+
+    ingredients: list[IngredientResponse]
+    # Cursor opaco para pedir la página siguiente; None si no hay más.
+    next_cursor: str | None = None
+
+
+class IngredientSuggestion(SQLModel):
+    """Ingrediente sugerido por el autocompletado."""
+
+    ingredient_id: uuid.UUID
+    name: str
+    # Cantidad de recetas que lo usan
+    usage_count: int
+
+
+class IngredientAutocompleteResponse(SQLModel):
+    """Modelo de respuesta del autocompletado de ingredientes."""
+
+    query: str
+    suggestions: list[IngredientSuggestion]
+
+
+class IngredientBulkItem(SQLModel):
+    """
+    Fila de una importación masiva de ingredientes.
+    La categoría se indica por ID o por nombre.
+    """
+
+    name: str
+    default_unit: str
+    category_id: uuid.UUID | None = None
+    category_name: str | None = None
+
+
+class IngredientSort(str, Enum):
+    """Orden del listado de ingredientes."""
+
+    NAME = "name"  # alfabético
+    POPULAR = "popular"  # más usados en recetas primero
+
+
+class BulkConflictMode(str, Enum):
+    """Qué hacer cuando ya existe un ingrediente con el mismo nombre."""
+
+    UPDATE = "update"
+    IGNORE = "ignore"
+
+
+class BulkRowStatus(str, Enum):
+    """Resultado de cada fila de una importación masiva."""
+
+    CREATED = "created"
+    UPDATED = "updated"
+    SKIPPED = "skipped"
+    ERROR = "error"
+
+
+class IngredientBulkResult(SQLModel):
+    """Estado de una fila de la importación masiva."""
+
+    # Posición de la fila en el lote recibido.
+    index: int
+    name: str | None = None
+    status: BulkRowStatus
+    ingredient_id: uuid.UUID | None = None
+    detail: str | None = None
+
+
+class IngredientBulkResponse(SQLModel):
+    """Resumen y estado por fila de una importación masiva de ingredientes."""
+
+    created: int = 0
+    updated: int = 0
+    skipped: int = 0
+    errors: int = 0
+    results: list[IngredientBulkResult]
@@ -0,0 +1,103 @@
+"""Modelo y contratos para la planificación semanal de comidas.
+
+Cada entrada asigna una receta a una comida (desayuno, almuerzo o cena) de un día
+para un usuario, con la cantidad de porciones planificadas. La lista de compras
+se calcula agregando los ingredientes de las recetas planificadas en un rango de
+fechas.
+"""
+
+import uuid
+from datetime import date, datetime, timezone
+from enum import Enum
+
+from sqlalchemy import UniqueConstraint
+from sqlmodel import (
+    Field,  # pyright: ignore[reportUnknownVariableType]
+    SQLModel,
+)
+
+from .types import UTCDateTime
+
+
+class MealType(str, Enum):
+    """Enum para las comidas del día."""
+
+    BREAKFAST = "breakfast"
+    LUNCH = "lunch"
+    DINNER = "dinner"
+
+
+class PlanEntriesBase(SQLModel):
+    """Modelo base para las entradas del plan."""
+
+    date: date
+    meal: MealType
+    recipe_id: uuid.UUID
+    servings: int = Field(default=1, ge=1)  # porciones planificadas
+    notes: str | None = None
+
+
+class PlanEntries(PlanEntriesBase, table=True):
+    """Modelo de tabla para las entradas del plan semanal."""
+
+    __tablename__: str = "plan_entries"  # type: ignore
+    # Una sola receta por usuario, día y comida; el índice también sirve para
+    # filtrar el plan de un usuario por rango de fechas.
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "date", "meal", name="uq_plan_entries_user_date_meal"
+        ),
+    )
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    user_id: uuid.UUID = Field(foreign_key="users.id")
+    recipe_id: uuid.UUID = Field(foreign_key="recipes.recipe_id", index=True)
+    created_at: datetime = Field(  # type: ignore
+        default_factory=lambda: datetime.now(timezone.utc),  # noqa: UP017
+        sa_type=UTCDateTime,
+    )
+    updated_at: datetime = Field(  # type: ignore
+        default_factory=lambda: datetime.now(timezone.utc),  # noqa: UP017
+        sa_type=UTCDateTime,
+    )
+
+
+class PlanEntryCreate(PlanEntriesBase):
+    """Contrato para crear o reemplazar la comida planificada de un día."""
+
+    user_id: uuid.UUID
+
+
+class PlanEntryResponse(PlanEntriesBase):
+    """Contrato de respuesta para una entrada del plan."""
+
+    id: uuid.UUID
+    user_id: uuid.UUID
+    created_at: datetime
+    updated_at: datetime
+
+
+class PlanResponse(SQLModel):
+    """Contrato de respuesta para el plan de un rango de fechas."""
+
+    entries: list[PlanEntryResponse]
+
+
+class ShoppingListItem(SQLModel):
+    """Cantidad total a comprar de un ingrediente en una unidad."""
+
+    ingredient_id: uuid.UUID
+    name: str
+    category_name: str
+    unit: str
+    quantity: float
+    # Cantidad de comidas planificadas que usan el ingrediente
+    recipes: int
+
+
+class ShoppingListResponse(SQLModel):
+    """Contrato de respuesta para la lista de compras de un rango de fechas."""
+
+    user_id: uuid.UUID
+    start: date
+    end: date
+    items: list[ShoppingListItem]
@@ -34,8 +34,12 @@ class RecipeIngredients(RecipeIngredientsBase, table=True):
     recipe_ingredient_id: uuid.UUID = Field(
         default_factory=uuid.uuid4, primary_key=True
     )
-    recipe_id: uuid.UUID = Field(foreign_key="recipes.recipe_id")
-    ingredient_id: uuid.UUID = Field(foreign_key="ingredients.ingredient_id")
+    # Indexado: cargar los ingredientes de una receta y agregar la lista de compras
+    recipe_id: uuid.UUID = Field(foreign_key="recipes.recipe_id", index=True)
+    # Indexado: recetas que usan un ingrediente (índice de búsqueda, invalidaciones)
+    ingredient_id: uuid.UUID = Field(
+        foreign_key="ingredients.ingredient_id", index=True
+    )
 
     ingredient: "Ingredients" = Relationship(back_populates="recipe_ingredients")
     recipe: "Recipes" = Relationship(back_populates="recipe_ingredients")
@@ -0,0 +1,131 @@
+"""Índice de búsqueda de texto completo de recetas (SQLite FTS5).
+
+``recipe_search`` guarda un documento por receta (nombre, descripción,
+instrucciones y nombres de sus ingredientes) con una clave entera estable, y
+``recipe_search_fts`` es la tabla virtual FTS5 que lo indexa como contenido
+externo. Los triggers mantienen ambos sincronizados con ``recipes``,
+``recipe_ingredients`` e ``ingredients``: la aplicación no escribe en ellas.
+
+La migración ``b8d4f2a6c0e1`` crea estos objetos en las bases existentes; las
+sentencias de este módulo los crean junto con ``SQLModel.metadata.create_all``
+(tests y benchmark). Ambas copias deben mantenerse iguales.
+"""
+
+from sqlalchemy import DDL, Integer, Uuid, column, event, table
+from sqlmodel import SQLModel
+
+# Prefijo de las tablas del índice, que no forman parte de los modelos
+SEARCH_TABLE_PREFIX = "recipe_search"
+
+# Pesos de bm25 por columna: name, description, instructions, ingredients
+SEARCH_COLUMN_WEIGHTS = (10.0, 2.0, 1.0, 5.0)
+
+recipe_search = table(
+    "recipe_search",
+    column("id", Integer),
+    column("recipe_id", Uuid),
+)
+recipe_search_fts = table("recipe_search_fts", column("rowid", Integer))
+
+# Nombres de los ingredientes de una receta, separados por espacios
+_INGREDIENT_NAMES = """(
+    SELECT coalesce(group_concat(i.name, ' '), '')
+    FROM recipe_ingredients AS ri
+    JOIN ingredients AS i ON i.ingredient_id = ri.ingredient_id
+    WHERE ri.recipe_id = recipe_search.recipe_id
+)"""
+
+RECIPE_SEARCH_DDL: tuple[str, ...] = (
+    """CREATE TABLE IF NOT EXISTS recipe_search (
+    id INTEGER PRIMARY KEY,
+    recipe_id CHAR(32) NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    instructions TEXT,
+    ingredients TEXT NOT NULL DEFAULT ''
+)""",
+    # remove_diacritics: "limon" encuentra "limón"; prefix: índices para 2 y 3 letras
+    """CREATE VIRTUAL TABLE IF NOT EXISTS recipe_search_fts USING fts5(
+    name, description, instructions, ingredients,
+    content='recipe_search', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+)""",
+    # recipe_search -> recipe_search_fts (patrón de contenido externo de FTS5)
+    """CREATE TRIGGER IF NOT EXISTS recipe_search_ai AFTER INSERT ON recipe_search
+BEGIN
+    INSERT INTO recipe_search_fts(rowid, name, description, instructions, ingredients)
+    VALUES (new.id, new.name, new.description, new.instructions, new.ingredients);
+END""",
+    """CREATE TRIGGER IF NOT EXISTS recipe_search_ad AFTER DELETE ON recipe_search
+BEGIN
+    INSERT INTO recipe_search_fts(
+        recipe_search_fts, rowid, name, description, instructions, ingredients
+    )
+    VALUES (
+        'delete', old.id, old.name, old.description, old.instructions, old.ingredients
+    );
+END""",
+    """CREATE TRIGGER IF NOT EXISTS recipe_search_au AFTER UPDATE ON recipe_search
+BEGIN
+    INSERT INTO recipe_search_fts(
+        recipe_search_fts, rowid, name, description, instructions, ingredients
+    )
+    VALUES (
+        'delete', old.id, old.name, old.description, old.instructions, old.ingredients
+    );
+    INSERT INTO recipe_search_fts(rowid, name, description, instructions, ingredients)
+    VALUES (new.id, new.name, new.description, new.instructions, new.ingredients);
+END""",
+    # recipes -> recipe_search
+    """CREATE TRIGGER IF NOT EXISTS recipes_search_ai AFTER INSERT ON recipes
+BEGIN
+    INSERT INTO recipe_search(recipe_id, name, description, instructions)
+    VALUES (new.recipe_id, new.name, new.description, new.instructions);
+END""",
+    """CREATE TRIGGER IF NOT EXISTS recipes_search_au
+AFTER UPDATE OF name, description, instructions ON recipes
+BEGIN
+    UPDATE recipe_search
+    SET name = new.name, description = new.description,
+        instructions = new.instructions
+    WHERE recipe_id = new.recipe_id;
+END""",
+    """CREATE TRIGGER IF NOT EXISTS recipes_search_ad AFTER DELETE ON recipes
+BEGIN
+    DELETE FROM recipe_search WHERE recipe_id = old.recipe_id;
+END""",
+    # recipe_ingredients / ingredients -> columna ingredients
+    f"""CREATE TRIGGER IF NOT EXISTS recipe_ingredients_search_ai
+AFTER INSERT ON recipe_ingredients
+BEGIN
+    UPDATE recipe_search SET ingredients = {_INGREDIENT_NAMES}
+    WHERE recipe_id = new.recipe_id;
+END""",
+    f"""CREATE TRIGGER IF NOT EXISTS recipe_ingredients_search_au
+AFTER UPDATE OF recipe_id, ingredient_id ON recipe_ingredients
+BEGIN
+    UPDATE recipe_search SET ingredients = {_INGREDIENT_NAMES}
+    WHERE recipe_id IN (old.recipe_id, new.recipe_id);
+END""",
+    f"""CREATE TRIGGER IF NOT EXISTS recipe_ingredients_search_ad
+AFTER DELETE ON recipe_ingredients
+BEGIN
+    UPDATE recipe_search SET ingredients = {_INGREDIENT_NAMES}
+    WHERE recipe_id = old.recipe_id;
+END""",
+    f"""CREATE TRIGGER IF NOT EXISTS ingredients_search_au
+AFTER UPDATE OF name ON ingredients
+BEGIN
+    UPDATE recipe_search SET ingredients = {_INGREDIENT_NAMES}
+    WHERE recipe_id IN (
+        SELECT recipe_id FROM recipe_ingredients WHERE ingredient_id = new.ingredient_id
+    );
+END""",
+)
+
+for _statement in RECIPE_SEARCH_DDL:
+    event.listen(
+        SQLModel.metadata,
+        "after_create",
+        DDL(_statement).execute_if(dialect="sqlite"),
+    )
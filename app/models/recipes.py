@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import TYPE_CHECKING  # <-- Importar List
 
+from sqlalchemy import Index
 from sqlmodel import (
     Field,  # pyright: ignore[reportUnknownVariableType]
     Relationship,
@@ -14,6 +15,7 @@ from sqlmodel import (
 
 from .ingredients import IngredientsBase
 from .recipe_ingredients import RecipeIngredientsBase, RecipeIngredientsResponse
+from .types import UTCDateTime
 
 # evitar importación circular en la comprobación de tipos
 if TYPE_CHECKING:
@@ -21,6 +23,14 @@ if TYPE_CHECKING:
     from .users import Users
 
 
+class RecipeSort(str, Enum):
+    """Orden del listado de recetas."""
+
+    CREATED = "created"  # por fecha de creación, las más antiguas primero
+    INGREDIENTS = "ingredients"  # menos ingredientes primero
+    TIME = "time"  # menos tiempo primero
+
+
 class RecipeVisibility(str, Enum):
     """Enum para la visibilidad de las recetas."""
 
@@ -43,12 +53,29 @@ class Recipes(RecipesBase, table=True):
     """Modelo de tabla para las recetas."""
 
     __tablename__: str = "recipes"  # type: ignore
+    # Claves de los listados ordenados por cantidad de ingredientes y por tiempo
+    __table_args__ = (
+        Index("ix_recipes_ingredient_count", "ingredient_count", "recipe_id"),
+        Index("ix_recipes_total_time", "total_time", "recipe_id"),
+    )
     recipe_id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     owner_id: uuid.UUID = Field(foreign_key="users.id")
     servings: int | None = Field(default=1)
     visibility: RecipeVisibility = Field(default=RecipeVisibility.PUBLIC)
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))  # type: ignore  # noqa: UP017
-    update_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))  # type: ignore  # noqa: UP017
+    # Indexado: clave de orden del listado paginado.
+    created_at: datetime = Field(  # type: ignore
+        default_factory=lambda: datetime.now(timezone.utc),  # noqa: UP017
+        sa_type=UTCDateTime,
+        index=True,
+    )
+    update_at: datetime = Field(  # type: ignore
+        default_factory=lambda: datetime.now(timezone.utc),  # noqa: UP017
+        sa_type=UTCDateTime,
+    )
+    # Estadísticas materializadas; las mantiene el servicio de recetas
+    ingredient_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    # Minutos totales (hoy solo preparación); 0 si no se indicó
+    total_time: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
 
     owner: "Users" = Relationship(back_populates="recipes")
     recipe_ingredients: list["RecipeIngredients"] = Relationship(
@@ -91,4 +118,55 @@ class RecipesResponse(RecipesBase):
     owner_id: uuid.UUID
     created_at: datetime
     update_at: datetime
+    ingredient_count: int = 0
+    total_time: int = 0
     recipe_ingredients: list["RecipeIngredientsResponse"]
+
+
+class RecipesListResponse(SQLModel):
+    """Contrato de respuesta para una página de recetas."""
+
+    recipes: list[RecipesResponse]
+    # Cursor opaco para pedir la página siguiente; None si no hay más.
+    next_cursor: str | None = None
+
+
+class RecipeMatchRequest(SQLModel):
+    """Contrato para buscar recetas según los ingredientes disponibles."""
+
+    ingredient_ids: list[uuid.UUID] = Field(min_length=1, max_length=500)
+    limit: int = Field(default=20, ge=1, le=100)
+    # Cobertura mínima de ingredientes requeridos, entre 0 y 1
+    min_coverage: float = Field(default=0.0, ge=0.0, le=1.0)
+
+
+class RecipeMatch(SQLModel):
+    """Receta candidata con la cobertura de sus ingredientes requeridos."""
+
+    recipe_id: uuid.UUID
+    name: str
+    matched: int  # ingredientes requeridos disponibles
+    required: int  # ingredientes requeridos (no opcionales)
+    coverage: float
+
+
+class RecipeMatchResponse(SQLModel):
+    """Contrato de respuesta para la búsqueda por ingredientes."""
+
+    matches: list[RecipeMatch]
+
+
+class RecipeSearchResult(SQLModel):
+    """Receta encontrada por la búsqueda de texto completo."""
+
+    recipe_id: uuid.UUID
+    name: str
+    description: str
+    rank: float  # bm25: más negativo es más relevante
+
+
+class RecipeSearchResponse(SQLModel):
+    """Contrato de respuesta para la búsqueda de texto completo."""
+
+    query: str
+    results: list[RecipeSearchResult]
@@ -0,0 +1,34 @@
+"""Tipos de columna compartidos por los modelos."""
+
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import DateTime
+from sqlalchemy.types import TypeDecorator
+
+
+class UTCDateTime(TypeDecorator[datetime]):
+    """Fecha y hora en UTC, guardada como ``TIMESTAMP WITH TIME ZONE``.
+
+    Los valores se escriben convertidos a UTC y se leen siempre con zona horaria:
+    PostgreSQL (asyncpg) rechaza fechas con zona en columnas sin zona, y SQLite no
+    guarda la zona, así que al leer se le vuelve a asignar UTC.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value: datetime | None, dialect: Any) -> Any:
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            # Una fecha sin zona se interpreta como UTC
+            return value.replace(tzinfo=UTC)
+        return value.astimezone(UTC)
+
+    def process_result_value(self, value: Any, dialect: Any) -> datetime | None:
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            return value.replace(tzinfo=UTC)
+        return value.astimezone(UTC)
@@ -13,6 +13,8 @@ from sqlmodel import (
     SQLModel,
 )
 
+from .types import UTCDateTime
+
 if TYPE_CHECKING:
     from app.models.recipes import Recipes
 
@@ -45,9 +47,15 @@ class Users(UserBase, table=True):
     # Contraseña cifrada del usuario.
     hashed_password: str = Field(default=None)
     # Fecha de creación del registro.
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))  # type: ignore  # noqa: UP017
+    created_at: datetime = Field(  # type: ignore
+        default_factory=lambda: datetime.now(timezone.utc),  # noqa: UP017
+        sa_type=UTCDateTime,
+    )
     # Fecha de actualización del registro.
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))  # type: ignore  # noqa: UP017
+    updated_at: datetime = Field(  # type: ignore
+        default_factory=lambda: datetime.now(timezone.utc),  # noqa: UP017
+        sa_type=UTCDateTime,
+    )
 
     recipes: list["Recipes"] = Relationship(back_populates="owner")
 
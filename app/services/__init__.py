@@ -4,24 +4,80 @@ from .categories_service import (
     get_categories,
     get_category,
 )
+from .export_service import ExportFormat, export_ingredients, export_recipes
+from .ingredient_autocomplete import ingredient_autocomplete
 from .ingredients_service import (
+    autocomplete_ingredients,
+    build_ingredient_response,
+    bulk_upsert_ingredients,
     create_ingredient,
     delete_ingredient,
     get_ingredient,
+    get_ingredient_last_modified,
+    get_ingredients,
+    parse_bulk_payload,
+    patch_ingredient,
     update_ingredient,
 )
-from .user_service import create_user, get_user_by_email, update_user
+from .plan_service import (
+    delete_plan_entry,
+    get_plan,
+    get_shopping_list,
+    upsert_plan_entry,
+)
+from .recipe_cache import recipe_cache
+from .recipe_index import recipe_index
+from .recipes_service import (
+    create_recipe,
+    get_cached_recipe,
+    get_recipe_last_modified,
+    get_recipes_json,
+    match_recipes,
+    update_recipe,
+)
+from .search_service import search_recipes
+from .user_service import (
+    create_user,
+    get_user_by_email,
+    get_user_last_modified,
+    update_user,
+)
 
 __all__ = [
     "create_user",
     "get_user_by_email",
+    "get_user_last_modified",
     "update_user",
     "create_category",
     "get_category",
     "get_categories",
     "delete_category",
+    "ingredient_autocomplete",
+    "autocomplete_ingredients",
     "create_ingredient",
     "get_ingredient",
+    "get_ingredient_last_modified",
+    "get_ingredients",
+    "build_ingredient_response",
+    "bulk_upsert_ingredients",
+    "parse_bulk_payload",
     "update_ingredient",
+    "patch_ingredient",
     "delete_ingredient",
+    "ExportFormat",
+    "export_ingredients",
+    "export_recipes",
+    "upsert_plan_entry",
+    "get_plan",
+    "delete_plan_entry",
+    "get_shopping_list",
+    "recipe_cache",
+    "recipe_index",
+    "create_recipe",
+    "get_cached_recipe",
+    "get_recipe_last_modified",
+    "get_recipes_json",
+    "update_recipe",
+    "match_recipes",
+    "search_recipes",
 ]
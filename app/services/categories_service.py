@@ -3,10 +3,20 @@
 import uuid
 
 from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 from sqlmodel import select
 
-from app.models import CategoryCreate, CategoryDB
+from app.core.db import is_unique_violation
+from app.models import (
+    CategorieSingleResponse,
+    CategoriesListResponse,
+    CategoryCreate,
+    CategoryDB,
+)
+
+from .category_cache import category_cache
+from .pagination import DEFAULT_PAGE_SIZE, decode_cursor, split_page
 
 
 async def create_category(db: Session, category: CategoryCreate) -> CategoryDB:
@@ -19,34 +29,39 @@ async def create_category(db: Session, category: CategoryCreate) -> CategoryDB:
     Returns:
         CategoryDB: La categoría creada.
     """
-    # Verifica si la categoria ya existe
-    statement = select(CategoryDB).where(CategoryDB.name == category.name)
-    db_category = await db.scalars(statement)
-    db_category = db_category.first()
-    if db_category:
+    # Crea la categoría; la restricción UNIQUE del nombre detecta duplicados
+    new_category = CategoryDB(name=category.name)
+    db.add(new_category)
+    try:
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        if not is_unique_violation(e):
+            raise
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="La categoría con este nombre ya existe.",
-        )
-    # Crea la categoría
-    new_category = CategoryDB(name=category.name)
-    db.add(new_category)
-    await db.commit()
-    await db.refresh(new_category)
+        ) from e
+    # Write-through: la cache queda al día sin volver a leer la tabla
+    category_cache.put(new_category)
     return new_category
 
 
-async def get_category(db: Session, category_id: uuid.UUID) -> CategoryDB:
-    """Busca una categoria por su ID.
+async def get_category(db: Session, category_id: uuid.UUID) -> CategorieSingleResponse:
+    """Busca una categoria por su ID, primero en la cache en memoria.
 
     Args:
         db (Session): La sesión de la base de datos.
         category_id (uuid.UUID): El ID de la categoría a buscar.
 
     Returns:
-        CategoryDB: la categoría encontrada.
+        CategorieSingleResponse: la categoría encontrada.
     """
-    # Busca la categoría por su ID
+    await category_cache.ensure_loaded(db)
+    cached = category_cache.get_by_id(category_id)
+    if cached is not None:
+        return cached
+    # Fallo de cache: puede haberla creado otro proceso, se consulta la DB
     statement = select(CategoryDB).where(CategoryDB.category_id == category_id)
     db_category = await db.scalars(statement)
     db_category = db_category.first()
@@ -55,22 +70,34 @@ async def get_category(db: Session, category_id: uuid.UUID) -> CategoryDB:
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Categoría no encontrada.",
         )
-    return db_category
+    category_cache.put(db_category)
+    return CategorieSingleResponse(
+        category_id=db_category.category_id, name=db_category.name
+    )
+
 
+async def get_categories(
+    db: Session, limit: int = DEFAULT_PAGE_SIZE, cursor: str | None = None
+) -> CategoriesListResponse:
+    """Obtiene una página de categorías desde la cache en memoria.
 
-async def get_categories(db: Session) -> list[CategoryDB]:
-    """Obtiene todas las categorías de la base de datos.
+    Las categorías se ordenan por (nombre, id) y se paginan por cursor.
 
     Args:
-        db (Session): La sesión de la base de datos.
+        db (Session): La sesión de la base de datos (solo si la cache no está cargada).
+        limit (int): Cantidad máxima de categorías a devolver.
+        cursor (str | None): Cursor devuelto por la página anterior.
 
     Returns:
-        list[CategoryDB]: Lista de categorías.
+        CategoriesListResponse: Página de categorías y cursor siguiente.
     """
-    statement = select(CategoryDB)
-    results = await db.scalars(statement)
-    categories = list(results.all())
-    return categories
+    await category_cache.ensure_loaded(db)
+    after = decode_cursor(cursor, str, uuid.UUID) if cursor else None
+    items = category_cache.page(after, limit + 1)  # type: ignore[arg-type]
+    page, next_cursor = split_page(
+        items, limit, lambda cat: (cat.name, cat.category_id)
+    )
+    return CategoriesListResponse(categories=page, next_cursor=next_cursor)
 
 
 async def delete_category(db: Session, category_id: uuid.UUID) -> None:
@@ -94,3 +121,4 @@ async def delete_category(db: Session, category_id: uuid.UUID) -> None:
         )
     await db.delete(db_category)
     await db.commit()
+    category_cache.remove(category_id)
@@ -0,0 +1,159 @@
+"""Cache en memoria de categorías, compartida por todo el proceso.
+
+Las categorías son una tabla chica y casi estática: se cargan completas al
+iniciar la aplicación y se mantienen al día con escritura directa (write-through)
+desde el servicio de categorías. Los valores cacheados son DTOs inmutables, nunca
+objetos ORM, para que puedan compartirse entre sesiones sin riesgo de lazy-loading.
+"""
+
+import bisect
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession as Session
+from sqlmodel import select
+
+from app.models import CategorieSingleResponse, CategoryDB
+
+
+class CategoryCache:
+    """Índices en memoria de categorías por ID y por nombre, con contadores."""
+
+    def __init__(self) -> None:
+        self._by_id: dict[uuid.UUID, CategorieSingleResponse] = {}
+        self._by_name: dict[str, CategorieSingleResponse] = {}
+        # Vista ordenada por (nombre, id) para paginar; se recalcula al cambiar
+        self._sorted: list[CategorieSingleResponse] | None = None
+        self.loaded = False
+        self.hits = 0
+        self.misses = 0
+
+    async def load(self, db: Session) -> None:
+        """Carga todas las categorías desde la base de datos, reemplazando el contenido.
+
+        Args:
+            db (Session): La sesión de la base de datos.
+        """
+        results = await db.scalars(select(CategoryDB))
+        self.clear()
+        for category in results:
+            self.put(category)
+        self.loaded = True
+
+    async def ensure_loaded(self, db: Session) -> None:
+        """Carga la cache si todavía no se cargó (por ejemplo, fuera del lifespan).
+
+        Args:
+            db (Session): La sesión de la base de datos.
+        """
+        if not self.loaded:
+            await self.load(db)
+
+    def get_by_id(self, category_id: uuid.UUID) -> CategorieSingleResponse | None:
+        """Busca una categoría por su ID, registrando acierto o fallo.
+
+        Args:
+            category_id (uuid.UUID): El ID de la categoría.
+
+        Returns:
+            CategorieSingleResponse | None: La categoría o None si no está cacheada.
+        """
+        return self._count(self._by_id.get(category_id))
+
+    def get_by_name(self, name: str) -> CategorieSingleResponse | None:
+        """Busca una categoría por su nombre, registrando acierto o fallo.
+
+        Args:
+            name (str): El nombre de la categoría.
+
+        Returns:
+            CategorieSingleResponse | None: La categoría o None si no está cacheada.
+        """
+        return self._count(self._by_name.get(name))
+
+    def all(self) -> list[CategorieSingleResponse]:
+        """Devuelve todas las categorías cacheadas.
+
+        Returns:
+            list[CategorieSingleResponse]: Lista de categorías.
+        """
+        self.hits += 1
+        return list(self._by_id.values())
+
+    def page(
+        self, after: tuple[str, uuid.UUID] | None, limit: int
+    ) -> list[CategorieSingleResponse]:
+        """Devuelve hasta ``limit`` categorías ordenadas por (nombre, id) tras ``after``.
+
+        Args:
+            after (tuple[str, uuid.UUID] | None): Clave del último elemento ya visto.
+            limit (int): Cantidad máxima de categorías.
+
+        Returns:
+            list[CategorieSingleResponse]: La porción pedida.
+        """
+        self.hits += 1
+        if self._sorted is None:
+            self._sorted = sorted(self._by_id.values(), key=_sort_key)
+        start = 0
+        if after is not None:
+            start = bisect.bisect_right(self._sorted, after, key=_sort_key)
+        return self._sorted[start : start + limit]
+
+    def put(self, category: CategoryDB | CategorieSingleResponse) -> None:
+        """Agrega o reemplaza una categoría en la cache.
+
+        Args:
+            category (CategoryDB | CategorieSingleResponse): La categoría a cachear.
+        """
+        previous = self._by_id.get(category.category_id)
+        if previous is not None:
+            self._by_name.pop(previous.name, None)
+        entry = CategorieSingleResponse(
+            category_id=category.category_id, name=category.name
+        )
+        self._by_id[entry.category_id] = entry
+        self._by_name[entry.name] = entry
+        self._sorted = None
+
+    def remove(self, category_id: uuid.UUID) -> None:
+        """Quita una categoría de la cache si existe.
+
+        Args:
+            category_id (uuid.UUID): El ID de la categoría a quitar.
+        """
+        entry = self._by_id.pop(category_id, None)
+        if entry is not None:
+            self._by_name.pop(entry.name, None)
+            self._sorted = None
+
+    def clear(self) -> None:
+        """Vacía la cache y la marca como no cargada."""
+        self._by_id.clear()
+        self._by_name.clear()
+        self._sorted = None
+        self.loaded = False
+
+    def stats(self) -> dict[str, int]:
+        """Devuelve los contadores de la cache.
+
+        Returns:
+            dict[str, int]: Tamaño, aciertos y fallos.
+        """
+        return {"size": len(self._by_id), "hits": self.hits, "misses": self.misses}
+
+    def _count(
+        self, entry: CategorieSingleResponse | None
+    ) -> CategorieSingleResponse | None:
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+
+def _sort_key(entry: CategorieSingleResponse) -> tuple[str, uuid.UUID]:
+    return (entry.name, entry.category_id)
+
+
+# Instancia única por proceso
+category_cache = CategoryCache()
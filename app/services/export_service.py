@@ -0,0 +1,150 @@
+"""Servicio de exportación del catálogo en streaming (NDJSON y CSV).
+
+Las filas se leen con cursores del lado del servidor (``stream``/``stream_scalars``
+con ``yield_per``) y se emiten por lotes a medida que llegan, de modo que el uso
+de memoria es constante sin importar el tamaño del catálogo.
+"""
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Iterable
+from enum import Enum
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession as Session
+from sqlmodel import col, select
+
+from app.models import CategoryDB, Ingredients, Recipes
+from app.models.recipes import RecipeVisibility
+
+from .recipes_service import build_recipe_response, recipe_eager_options
+
+# Filas por lote leídas del cursor y emitidas en cada chunk de la respuesta
+EXPORT_BATCH_SIZE = 500
+
+INGREDIENT_CSV_HEADER = [
+    "ingredient_id",
+    "name",
+    "default_unit",
+    "category_id",
+    "category_name",
+]
+RECIPE_CSV_HEADER = [
+    "recipe_id",
+    "recipe_name",
+    "visibility",
+    "servings",
+    "prep_time",
+    "ingredient_id",
+    "ingredient_name",
+    "quantity",
+    "default_unit",
+    "optional",
+]
+
+
+class ExportFormat(str, Enum):
+    """Formatos de exportación soportados."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        """Media type HTTP del formato."""
+        if self is ExportFormat.CSV:
+            return "text/csv; charset=utf-8"
+        return "application/x-ndjson"
+
+
+def _ndjson(rows: Iterable[dict[str, Any]]) -> str:
+    return "".join(
+        json.dumps(row, default=str, ensure_ascii=False) + "\n" for row in rows
+    )
+
+
+def _csv(rows: Iterable[Iterable[Any]]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+async def export_ingredients(db: Session, fmt: ExportFormat) -> AsyncIterator[str]:
+    """Exporta todos los ingredientes con el nombre de su categoría.
+
+    Args:
+        db (Session): La sesión de la base de datos.
+        fmt (ExportFormat): Formato de salida.
+
+    Yields:
+        str: Lotes de líneas NDJSON o CSV.
+    """
+    statement = (
+        select(
+            Ingredients.ingredient_id,
+            Ingredients.name,
+            Ingredients.default_unit,
+            Ingredients.category_id,
+            col(CategoryDB.name).label("category_name"),
+        )
+        .join(CategoryDB, col(CategoryDB.category_id) == Ingredients.category_id)
+        .order_by(col(Ingredients.name), col(Ingredients.ingredient_id))
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    if fmt is ExportFormat.CSV:
+        yield _csv([INGREDIENT_CSV_HEADER])
+    result = await db.stream(statement)
+    async for partition in result.partitions():
+        if fmt is ExportFormat.CSV:
+            yield _csv(partition)
+        else:
+            yield _ndjson(row._asdict() for row in partition)
+
+
+async def export_recipes(db: Session, fmt: ExportFormat) -> AsyncIterator[str]:
+    """Exporta todas las recetas públicas con sus ingredientes.
+
+    En NDJSON cada línea es un ``RecipesResponse`` completo; en CSV hay una fila por
+    ingrediente de receta.
+
+    Args:
+        db (Session): La sesión de la base de datos.
+        fmt (ExportFormat): Formato de salida.
+
+    Yields:
+        str: Lotes de líneas NDJSON o CSV.
+    """
+    statement = (
+        select(Recipes)
+        .where(Recipes.visibility == RecipeVisibility.PUBLIC)
+        .options(*recipe_eager_options())
+        .order_by(col(Recipes.created_at), col(Recipes.recipe_id))
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    if fmt is ExportFormat.CSV:
+        yield _csv([RECIPE_CSV_HEADER])
+    result = await db.stream_scalars(statement)
+    async for partition in result.partitions():
+        recipes = [build_recipe_response(recipe) for recipe in partition]
+        if fmt is ExportFormat.CSV:
+            yield _csv(
+                [
+                    recipe.recipe_id,
+                    recipe.name,
+                    recipe.visibility.value,
+                    recipe.servings,
+                    recipe.prep_time,
+                    ri.ingredient.ingredient_id,
+                    ri.ingredient.name,
+                    ri.quantity,
+                    ri.ingredient.default_unit,
+                    ri.optional,
+                ]
+                for recipe in recipes
+                for ri in recipe.recipe_ingredients
+            )
+        else:
+            yield "".join(recipe.model_dump_json() + "\n" for recipe in recipes)
+        # Libera los objetos del lote para mantener la memoria constante
+        db.expunge_all()
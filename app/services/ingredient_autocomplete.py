@@ -0,0 +1,255 @@
+"""Autocompletado de ingredientes en memoria, con un trie de prefijos.
+
+Las claves se normalizan sin tildes y en minúsculas ("Limón" -> "limon") y cada
+ingrediente se indexa por su nombre completo y por el resto del nombre desde
+cada palabra, así "oli" sugiere "Aceite de oliva". Cada nodo guarda, calculados
+a demanda, los ``TOP_K`` ingredientes más usados en recetas de su subárbol: una
+consulta baja por el trie (una vuelta por letra) y devuelve esa lista. Un
+ingrediente nuevo o más usado se inserta en las listas ya calculadas de su
+camino; renombrar o quitar uno descarta solo las listas donde figuraba.
+
+Las claves de un ingrediente se arman en ``_keys``: es el punto para sumar los
+alias por usuario (``user_ingredient_aliases`` en ``db.dbml``) cuando existan.
+
+Se carga al iniciar la aplicación y se actualiza en forma incremental desde los
+servicios de ingredientes y recetas. Cada proceso tiene su propio índice.
+"""
+
+import heapq
+import unicodedata
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from sqlalchemy.ext.asyncio import AsyncSession as Session
+from sqlmodel import col, select
+
+from app.models import Ingredients
+
+# Sugerencias precalculadas por nodo (máximo que acepta el endpoint)
+TOP_K = 20
+
+
+def normalize(text: str) -> str:
+    """Normaliza un texto para compararlo sin tildes, mayúsculas ni espacios extra.
+
+    Args:
+        text (str): Texto a normalizar.
+
+    Returns:
+        str: Texto normalizado.
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(stripped.casefold().split())
+
+
+@dataclass
+class Suggestion:
+    """Ingrediente sugerido y cantidad de recetas que lo usan."""
+
+    ingredient_id: uuid.UUID
+    name: str
+    usage_count: int
+    keys: tuple[str, ...] = field(default=(), repr=False)
+
+
+class _Node:
+    __slots__ = ("children", "ingredient_ids", "top")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        # Ingredientes con una clave que termina exactamente en este nodo
+        self.ingredient_ids: set[uuid.UUID] = set()
+        self.top: list[uuid.UUID] | None = None
+
+
+class IngredientAutocomplete:
+    """Trie de nombres de ingredientes ordenado por uso en recetas."""
+
+    def __init__(self) -> None:
+        self._root = _Node()
+        self._entries: dict[uuid.UUID, Suggestion] = {}
+        self.loaded = False
+
+    async def load(self, db: Session) -> None:
+        """Construye el índice con todos los ingredientes y su uso en recetas.
+
+        Args:
+            db (Session): La sesión de la base de datos.
+        """
+        # usage_count es la columna materializada: no hace falta contar
+        statement = select(
+            col(Ingredients.ingredient_id),
+            col(Ingredients.name),
+            col(Ingredients.usage_count),
+        )
+        rows = await db.execute(statement)
+        self.clear()
+        for ingredient_id, name, usage_count in rows:
+            self.put(ingredient_id, name, usage_count)
+        self.loaded = True
+
+    async def ensure_loaded(self, db: Session) -> None:
+        """Carga el índice si todavía no se cargó (por ejemplo, fuera del lifespan).
+
+        Args:
+            db (Session): La sesión de la base de datos.
+        """
+        if not self.loaded:
+            await self.load(db)
+
+    def put(
+        self, ingredient_id: uuid.UUID, name: str, usage_count: int | None = None
+    ) -> None:
+        """Agrega o renombra un ingrediente.
+
+        Args:
+            ingredient_id (uuid.UUID): El ID del ingrediente.
+            name (str): Nombre del ingrediente.
+            usage_count (int | None): Recetas que lo usan; None conserva el actual.
+        """
+        previous = self._entries.get(ingredient_id)
+        if usage_count is None:
+            usage_count = previous.usage_count if previous is not None else 0
+        entry = Suggestion(ingredient_id, name, usage_count, self._keys(name))
+        # Más uso con el mismo nombre solo puede subir en las listas: no se recalculan
+        if previous is not None and not (
+            previous.keys == entry.keys and usage_count >= previous.usage_count
+        ):
+            self._unlink(previous)
+        self._entries[ingredient_id] = entry
+        for key in entry.keys:
+            node = self._root
+            self._offer(node, ingredient_id)
+            for char in key:
+                node = node.children.setdefault(char, _Node())
+                self._offer(node, ingredient_id)
+            node.ingredient_ids.add(ingredient_id)
+
+    def remove(self, ingredient_id: uuid.UUID) -> None:
+        """Quita un ingrediente si existe.
+
+        Args:
+            ingredient_id (uuid.UUID): El ID del ingrediente.
+        """
+        entry = self._entries.pop(ingredient_id, None)
+        if entry is not None:
+            self._unlink(entry)
+
+    def record_usage(self, ingredients: Iterable[tuple[uuid.UUID, str]]) -> None:
+        """Suma una receta al uso de cada ingrediente, agregando los nuevos.
+
+        Args:
+            ingredients (Iterable[tuple[uuid.UUID, str]]): ID y nombre de los
+                ingredientes de una receta recién creada.
+        """
+        for ingredient_id, name in dict(ingredients).items():
+            entry = self._entries.get(ingredient_id)
+            usage_count = entry.usage_count + 1 if entry is not None else 1
+            self.put(ingredient_id, name, usage_count)
+
+    def release_usage(self, ingredient_ids: Iterable[uuid.UUID]) -> None:
+        """Resta una receta al uso de cada ingrediente.
+
+        Args:
+            ingredient_ids (Iterable[uuid.UUID]): Ingredientes que una receta
+                editada dejó de usar.
+        """
+        for ingredient_id in set(ingredient_ids):
+            entry = self._entries.get(ingredient_id)
+            if entry is not None:
+                self.put(ingredient_id, entry.name, max(entry.usage_count - 1, 0))
+
+    def search(self, prefix: str, limit: int = 10) -> list[Suggestion]:
+        """Devuelve los ingredientes más usados cuyo nombre (o una de sus palabras)
+        empieza con el prefijo.
+
+        Args:
+            prefix (str): Texto ingresado; se normaliza igual que los nombres.
+            limit (int): Cantidad máxima de sugerencias (hasta ``TOP_K``).
+
+        Returns:
+            list[Suggestion]: Ingredientes de mayor a menor uso.
+        """
+        key = normalize(prefix)
+        if not key:
+            return []
+        node = self._root
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                return []
+            node = child
+        if node.top is None:
+            node.top = self._top(node)
+        return [self._entries[ingredient_id] for ingredient_id in node.top[:limit]]
+
+    def _rank(self, ingredient_id: uuid.UUID) -> tuple[int, str]:
+        entry = self._entries[ingredient_id]
+        return -entry.usage_count, entry.name.casefold()
+
+    def _offer(self, node: _Node, ingredient_id: uuid.UUID) -> None:
+        # Mantiene al día una lista ya calculada con un ingrediente que sube o entra
+        top = node.top
+        if top is None:
+            return
+        if ingredient_id not in top:
+            if len(top) >= TOP_K and self._rank(ingredient_id) >= self._rank(top[-1]):
+                return
+            top.append(ingredient_id)
+        top.sort(key=self._rank)
+        del top[TOP_K:]
+
+    def _top(self, node: _Node) -> list[uuid.UUID]:
+        found: set[uuid.UUID] = set()
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            found.update(current.ingredient_ids)
+            stack.extend(current.children.values())
+        return heapq.nsmallest(TOP_K, found, key=self._rank)
+
+    def _unlink(self, entry: Suggestion) -> None:
+        for key in entry.keys:
+            path = [self._root]
+            for char in key:
+                child = path[-1].children.get(char)
+                if child is None:
+                    break
+                path.append(child)
+            else:
+                path[-1].ingredient_ids.discard(entry.ingredient_id)
+            # Solo cambia la lista de los nodos donde figuraba
+            for node in path:
+                if node.top is not None and entry.ingredient_id in node.top:
+                    node.top = None
+            # Poda los nodos que quedaron vacíos, desde la hoja hacia la raíz
+            for depth in range(len(path) - 1, 0, -1):
+                node = path[depth]
+                if node.children or node.ingredient_ids:
+                    break
+                del path[depth - 1].children[key[depth - 1]]
+
+    @staticmethod
+    def _keys(name: str) -> tuple[str, ...]:
+        words = normalize(name).split()
+        return tuple(dict.fromkeys(" ".join(words[i:]) for i in range(len(words))))
+
+    def clear(self) -> None:
+        """Vacía el índice y lo marca como no cargado."""
+        self._root = _Node()
+        self._entries.clear()
+        self.loaded = False
+
+    def stats(self) -> dict[str, int]:
+        """Devuelve el tamaño del índice.
+
+        Returns:
+            dict[str, int]: Ingredientes indexados.
+        """
+        return {"ingredients": len(self._entries)}
+
+
+# Instancia única por proceso
+ingredient_autocomplete = IngredientAutocomplete()
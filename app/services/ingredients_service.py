@@ -1,14 +1,44 @@
 """Servicio para ingredientes, maneja la lógica de negocio relacionada con los ingredientes. maneja el crud de ingredientes."""
 
+import json
 import uuid
+from datetime import UTC, datetime
+from typing import Any
 
 from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import or_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession as Session
-from sqlmodel import select
+from sqlmodel import col, select
 
-from app.models import IngredientCreate, Ingredients
+from app.core.db import is_unique_violation
+from app.models import (
+    BulkConflictMode,
+    BulkRowStatus,
+    CategorieSingleResponse,
+    CategoryDB,
+    IngredientAutocompleteResponse,
+    IngredientBulkItem,
+    IngredientBulkResponse,
+    IngredientBulkResult,
+    IngredientCreate,
+    IngredientPatch,
+    IngredientResponse,
+    Ingredients,
+    IngredientsListResponse,
+    IngredientSort,
+    IngredientSuggestion,
+)
 from app.models.ingredients import IngredientUpdate
 
+from .categories_service import get_category
+from .category_cache import category_cache
+from .ingredient_autocomplete import ingredient_autocomplete
+from .pagination import DEFAULT_PAGE_SIZE, decode_cursor, keyset_query, split_page
+from .recipe_cache import recipe_cache
+
 
 async def create_ingredient(db: Session, ingredient: IngredientCreate) -> Ingredients:
     """Crea un nuevo ingrediente en la base de datos.
@@ -19,21 +49,26 @@ async def create_ingredient(db: Session, ingredient: IngredientCreate) -> Ingred
 
     Returns:
         Ingredients: El ingrediente creado.
+
+    Raises:
+        HTTPException: Si la categoría no existe o el nombre ya está en uso.
     """
-    # Verifica si el ingrediente ya existe
-    statement = select(Ingredients).where(Ingredients.name == ingredient.name)
-    db_ingredient = await db.scalars(statement)
-    db_ingredient = db_ingredient.first()
-    if db_ingredient:
+    # La categoría se valida contra la cache en memoria (404 si no existe)
+    await get_category(db, ingredient.category_id)
+    # Crea el ingrediente; la restricción UNIQUE del nombre detecta duplicados
+    new_ingredient = Ingredients(**ingredient.model_dump())
+    db.add(new_ingredient)
+    try:
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        if not is_unique_violation(e):
+            raise
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="El ingrediente con este nombre ya existe.",
-        )
-    # Crea el ingrediente
-    new_ingredient = Ingredients(**ingredient.model_dump())
-    db.add(new_ingredient)
-    await db.commit()
-    await db.refresh(new_ingredient)
+        ) from e
+    ingredient_autocomplete.put(new_ingredient.ingredient_id, new_ingredient.name)
     return new_ingredient
 
 
@@ -59,6 +94,104 @@ async def get_ingredient(db: Session, ingredient_id: uuid.UUID) -> Ingredients:
     return db_ingredient
 
 
+async def get_ingredient_last_modified(
+    db: Session, ingredient_id: uuid.UUID
+) -> datetime:
+    """Obtiene la fecha de modificación de un ingrediente sin cargar el objeto.
+
+    Args:
+        db (Session): La sesión de la base de datos.
+        ingredient_id (uuid.UUID): El ID del ingrediente.
+
+    Returns:
+        datetime: Fecha de la última modificación.
+
+    Raises:
+        HTTPException: Si el ingrediente no existe.
+    """
+    statement = select(Ingredients.updated_at).where(
+        Ingredients.ingredient_id == ingredient_id
+    )
+    updated_at = await db.scalar(statement)
+    if updated_at is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Ingrediente no encontrado.",
+        )
+    return updated_at
+
+
+async def get_ingredients(
+    db: Session,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    sort: IngredientSort = IngredientSort.NAME,
+) -> IngredientsListResponse:
+    """Obtiene una página de ingredientes ordenados por (nombre, id) o por popularidad.
+
+    El orden por popularidad recorre al revés el índice
+    ``(usage_count, ingredient_id)``, sin contar ``recipe_ingredients``.
+
+    Args:
+        db (Session): La sesión de la base de datos.
+        limit (int): Cantidad máxima de ingredientes a devolver.
+        cursor (str | None): Cursor devuelto por la página anterior.
+        sort (IngredientSort): Orden del listado; el cursor vale solo para el mismo orden.
+
+    Returns:
+        IngredientsListResponse: Página de ingredientes y cursor siguiente.
+    """
+    if sort is IngredientSort.POPULAR:
+        after = decode_cursor(cursor, int, uuid.UUID) if cursor else None
+        statement = keyset_query(
+            select(Ingredients),
+            [Ingredients.usage_count, Ingredients.ingredient_id],
+            after,
+            limit,
+            descending=True,
+        )
+        key = lambda ing: (ing.usage_count, ing.ingredient_id)  # noqa: E731
+    else:
+        after = decode_cursor(cursor, str, uuid.UUID) if cursor else None
+        statement = keyset_query(
+            select(Ingredients),
+            [Ingredients.name, Ingredients.ingredient_id],
+            after,
+            limit,
+        )
+        key = lambda ing: (ing.name, ing.ingredient_id)  # noqa: E731
+    results = (await db.scalars(statement)).all()
+    page, next_cursor = split_page(results, limit, key)
+    return IngredientsListResponse(
+        ingredients=[await build_ingredient_response(db, ing) for ing in page],
+        next_cursor=next_cursor,
+    )
+
+
+async def build_ingredient_response(
+    db: Session, ingredient: Ingredients
+) -> IngredientResponse:
+    """Construye el DTO de un ingrediente con su categoría.
+
+    La categoría se toma de la cache en memoria, sin consultar la base de datos.
+
+    Args:
+        db (Session): La sesión de la base de datos (solo ante un fallo de cache).
+        ingredient (Ingredients): El ingrediente.
+
+    Returns:
+        IngredientResponse: El ingrediente con su categoría.
+    """
+    category = await get_category(db, ingredient.category_id)
+    return IngredientResponse(
+        ingredient_id=ingredient.ingredient_id,
+        name=ingredient.name,
+        category_id=ingredient.category_id,
+        default_unit=ingredient.default_unit,
+        category=category,
+    )
+
+
 async def update_ingredient(
     db: Session, ingredient_id: uuid.UUID, ingredient: IngredientUpdate
 ) -> Ingredients:
@@ -67,26 +200,87 @@ async def update_ingredient(
     Args:
         db (Session): La sesión de la base de datos.
         ingredient_id (uuid.UUID): El ID del ingrediente a actualizar.
-        ingredient (IngredientCreate): Los nuevos datos del ingrediente.
+        ingredient (IngredientUpdate): Los nuevos datos del ingrediente.
 
     Returns:
         Ingredients: El ingrediente actualizado.
+
+    Raises:
+        HTTPException: Si el ingrediente no existe o el nombre ya está en uso.
     """
-    # Busca el ingrediente por su ID
-    statement = select(Ingredients).where(Ingredients.ingredient_id == ingredient_id)
-    db_ingredient = await db.scalars(statement)
-    db_ingredient = db_ingredient.first()
-    if not db_ingredient:
+    return await _update_ingredient_values(db, ingredient_id, ingredient.model_dump())
+
+
+async def patch_ingredient(
+    db: Session, ingredient_id: uuid.UUID, patch: IngredientPatch
+) -> Ingredients:
+    """Actualiza solo los campos enviados de un ingrediente.
+
+    Los campos omitidos o enviados como ``null`` no se modifican. Sin cambios,
+    devuelve el ingrediente tal como está y no altera ``updated_at``.
+
+    Args:
+        db (Session): La sesión de la base de datos.
+        ingredient_id (uuid.UUID): El ID del ingrediente a actualizar.
+        patch (IngredientPatch): Los campos a modificar.
+
+    Returns:
+        Ingredients: El ingrediente actualizado.
+
+    Raises:
+        HTTPException: Si el ingrediente no existe o el nombre ya está en uso.
+    """
+    values = patch.model_dump(exclude_unset=True, exclude_none=True)
+    if not values:
+        return await get_ingredient(db, ingredient_id)
+    return await _update_ingredient_values(db, ingredient_id, values)
+
+
+async def _update_ingredient_values(
+    db: Session, ingredient_id: uuid.UUID, values: dict[str, Any]
+) -> Ingredients:
+    """Escribe los valores con un único ``UPDATE ... RETURNING`` y hace commit.
+
+    Args:
+        db (Session): La sesión de la base de datos.
+        ingredient_id (uuid.UUID): El ID del ingrediente a actualizar.
+        values (dict[str, Any]): Columnas a modificar y sus nuevos valores.
+
+    Returns:
+        Ingredients: El ingrediente actualizado.
+
+    Raises:
+        HTTPException: Si el ingrediente no existe o el nombre ya está en uso.
+    """
+    # Sin SELECT previo: la fila devuelta confirma que existía
+    statement = (
+        update(Ingredients)
+        .where(col(Ingredients.ingredient_id) == ingredient_id)
+        .values(**values, updated_at=datetime.now(UTC))
+        .returning(Ingredients)
+    )
+    try:
+        db_ingredient = (await db.scalars(statement)).first()
+    except IntegrityError as e:
+        await db.rollback()
+        if not is_unique_violation(e):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="El ingrediente con este nombre ya existe.",
+        ) from e
+    if db_ingredient is None:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Ingrediente no encontrado.",
         )
-    # Actualiza los campos del ingrediente
-    for key, value in ingredient.model_dump().items():
-        setattr(db_ingredient, key, value)
-    db.add(db_ingredient)
+    name = db_ingredient.name
     await db.commit()
-    await db.refresh(db_ingredient)
+    # Las recetas que lo usan incluyen su nombre y unidad en el JSON cacheado
+    recipe_cache.invalidate_ingredients([ingredient_id])
+    if "name" in values:
+        ingredient_autocomplete.put(ingredient_id, name)
     return db_ingredient
 
 
@@ -111,3 +305,259 @@ async def delete_ingredient(db: Session, ingredient_id: uuid.UUID) -> None:
         )
     await db.delete(db_ingredient)
     await db.commit()
+    recipe_cache.invalidate_ingredients([ingredient_id])
+    ingredient_autocomplete.remove(ingredient_id)
+
+
+async def autocomplete_ingredients(
+    db: Session, query: str, limit: int
+) -> IngredientAutocompleteResponse:
+    """Sugiere ingredientes cuyo nombre (o una de sus palabras) empieza con el texto.
+
+    Se resuelve con el trie en memoria, sin consultar la base de datos una vez
+    cargado. No distingue tildes ni mayúsculas.
+
+    Args:
+        db (Session): La sesión de la base de datos (solo para la carga inicial).
+        query (str): Texto ingresado por el usuario.
+        limit (int): Cantidad máxima de sugerencias.
+
+    Returns:
+        IngredientAutocompleteResponse: Ingredientes de mayor a menor uso en recetas.
+    """
+    await ingredient_autocomplete.ensure_loaded(db)
+    return IngredientAutocompleteResponse(
+        query=query,
+        suggestions=[
+            IngredientSuggestion(
+                ingredient_id=suggestion.ingredient_id,
+                name=suggestion.name,
+                usage_count=suggestion.usage_count,
+            )
+            for suggestion in ingredient_autocomplete.search(query, limit)
+        ],
+    )
+
+
+# Filas por sentencia executemany en la importación masiva
+BULK_CHUNK_SIZE = 1000
+
+
+def parse_bulk_payload(body: bytes, content_type: str) -> list[Any]:
+    """Decodifica el cuerpo de una importación masiva en JSON o NDJSON.
+
+    En NDJSON una línea inválida no invalida el lote: se devuelve ``None`` en su
+    posición y se informa como error de esa fila.
+
+    Args:
+        body (bytes): Cuerpo de la petición.
+        content_type (str): Cabecera Content-Type de la petición.
+
+    Returns:
+        list[Any]: Filas sin validar, en el orden recibido.
+
+    Raises:
+        HTTPException: Si el cuerpo JSON no es una lista de objetos.
+    """
+    if "ndjson" in content_type or "jsonl" in content_type:
+        rows: list[Any] = []
+        for line in body.splitlines():
+            if not line.strip():
+                continue
+            try:
+                rows.append(json.loads(line))
+            except ValueError:
+                rows.append(None)
+        return rows
+    try:
+        data = json.loads(body)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="El cuerpo no es JSON válido.",
+        ) from e
+    if isinstance(data, dict):
+        data = data.get("ingredients")
+    if not isinstance(data, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Se esperaba una lista de ingredientes.",
+        )
+    return data
+
+
+def _upsert_statement(db: Session, on_conflict: BulkConflictMode) -> Any:
+    """Arma el ``INSERT ... ON CONFLICT(name)`` propio del dialecto de la sesión."""
+    dialect = db.get_bind().dialect.name
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    statement = insert(Ingredients.__table__)  # type: ignore[attr-defined]
+    if on_conflict is BulkConflictMode.IGNORE:
+        return statement.on_conflict_do_nothing(index_elements=["name"])
+    return statement.on_conflict_do_update(
+        index_elements=["name"],
+        set_={
+            "default_unit": statement.excluded.default_unit,
+            "category_id": statement.excluded.category_id,
+            "updated_at": statement.excluded.updated_at,
+        },
+    )
+
+
+async def bulk_upsert_ingredients(
+    db: Session,
+    rows: list[Any],
+    on_conflict: BulkConflictMode = BulkConflictMode.UPDATE,
+) -> IngredientBulkResponse:
+    """Importa ingredientes en lote con semántica de upsert por nombre.
+
+    Las categorías, indicadas por ID o por nombre, se resuelven con la cache en
+    memoria; solo las que falten en ella se buscan con una consulta. Las que no
+    existen se informan como error en su fila. Los
+    ingredientes se escriben con ``INSERT ... ON CONFLICT(name)`` en lotes de
+    ``BULK_CHUNK_SIZE`` filas por executemany, todo en una única transacción.
+
+    Args:
+        db (Session): La sesión de la base de datos.
+        rows (list[Any]): Filas sin validar (ver ``parse_bulk_payload``).
+        on_conflict (BulkConflictMode): Actualizar o ignorar nombres existentes.
+
+    Returns:
+        IngredientBulkResponse: Resumen y estado de cada fila.
+    """
+    results: list[IngredientBulkResult | None] = [None] * len(rows)
+    items: dict[int, IngredientBulkItem] = {}
+    for index, raw in enumerate(rows):
+        try:
+            if raw is None:
+                raise ValueError("Línea JSON inválida.")
+            items[index] = IngredientBulkItem.model_validate(raw)
+        except (ValidationError, ValueError) as e:
+            name = raw.get("name") if isinstance(raw, dict) else None
+            results[index] = IngredientBulkResult(
+                index=index, name=name, status=BulkRowStatus.ERROR, detail=str(e)
+            )
+
+    # Resuelve las categorías (por ID o por nombre) con la cache en memoria
+    wanted_ids = {item.category_id for item in items.values() if item.category_id}
+    wanted_names = {
+        item.category_name
+        for item in items.values()
+        if item.category_id is None and item.category_name
+    }
+    await category_cache.ensure_loaded(db)
+    known_ids = {
+        category_id
+        for category_id in wanted_ids
+        if category_cache.get_by_id(category_id) is not None
+    }
+    ids_by_name = {
+        name: cached.category_id
+        for name in wanted_names
+        if (cached := category_cache.get_by_name(name)) is not None
+    }
+    # Las que faltan pueden haberse creado en otro proceso: una sola consulta
+    missing_ids = wanted_ids - known_ids
+    missing_names = wanted_names - ids_by_name.keys()
+    if missing_ids or missing_names:
+        statement = select(CategoryDB.category_id, CategoryDB.name).where(
+            or_(
+                col(CategoryDB.category_id).in_(missing_ids),
+                col(CategoryDB.name).in_(missing_names),
+            )
+        )
+        for category_id, name in await db.execute(statement):
+            category_cache.put(
+                CategorieSingleResponse(category_id=category_id, name=name)
+            )
+            known_ids.add(category_id)
+            ids_by_name[name] = category_id
+
+    # Un nombre repetido en el lote se queda con la última fila
+    pending: dict[str, tuple[int, dict[str, Any]]] = {}
+    now = datetime.now(UTC)
+    for index, item in items.items():
+        if item.category_id is not None:
+            category_id = item.category_id if item.category_id in known_ids else None
+        else:
+            category_id = ids_by_name.get(item.category_name or "")
+        if category_id is None:
+            results[index] = IngredientBulkResult(
+                index=index,
+                name=item.name,
+                status=BulkRowStatus.ERROR,
+                detail=f"Categoría no encontrada: {item.category_id or item.category_name}",
+            )
+            continue
+        if item.name in pending:
+            previous = pending[item.name][0]
+            results[previous] = IngredientBulkResult(
+                index=previous,
+                name=item.name,
+                status=BulkRowStatus.SKIPPED,
+                detail="Nombre repetido en el lote; se usa la última fila.",
+            )
+        pending[item.name] = (
+            index,
+            {
+                "ingredient_id": uuid.uuid4(),
+                "name": item.name,
+                "default_unit": item.default_unit,
+                "category_id": category_id,
+                "updated_at": now,
+            },
+        )
+
+    table = Ingredients.__table__  # type: ignore[attr-defined]
+    upsert = _upsert_statement(db, on_conflict).returning(
+        table.c.name, table.c.ingredient_id
+    )
+    entries = list(pending.values())
+    for start in range(0, len(entries), BULK_CHUNK_SIZE):
+        chunk = entries[start : start + BULK_CHUNK_SIZE]
+        # Cada fila escrita vuelve con su ID: si coincide con el generado acá fue
+        # una inserción; si no, el conflicto conservó el ID de la fila existente
+        written = {
+            name: ingredient_id
+            for name, ingredient_id in await db.execute(
+                upsert, [params for _, params in chunk]
+            )
+        }
+        # Con IGNORE los conflictos no devuelven fila; se buscan sólo esos IDs
+        ignored = [
+            params["name"] for _, params in chunk if params["name"] not in written
+        ]
+        existing: dict[str, uuid.UUID] = {}
+        if ignored:
+            statement = select(Ingredients.name, Ingredients.ingredient_id).where(
+                col(Ingredients.name).in_(ignored)
+            )
+            existing = dict((await db.execute(statement)).tuples().all())
+        for index, params in chunk:
+            name = params["name"]
+            if name not in written:
+                row_status, ingredient_id = BulkRowStatus.SKIPPED, existing.get(name)
+            elif written[name] == params["ingredient_id"]:
+                row_status, ingredient_id = BulkRowStatus.CREATED, written[name]
+            else:
+                row_status, ingredient_id = BulkRowStatus.UPDATED, written[name]
+            results[index] = IngredientBulkResult(
+                index=index, name=name, status=row_status, ingredient_id=ingredient_id
+            )
+    await db.commit()
+    recipe_cache.invalidate_ingredients(
+        result.ingredient_id
+        for result in results
+        if result is not None and result.status is BulkRowStatus.UPDATED
+    )
+    for result in results:
+        if result is not None and result.status is BulkRowStatus.CREATED:
+            ingredient_autocomplete.put(result.ingredient_id, result.name)  # type: ignore[arg-type]
+
+    final = [result for result in results if result is not None]
+    return IngredientBulkResponse(
+        created=sum(r.status is BulkRowStatus.CREATED for r in final),
+        updated=sum(r.status is BulkRowStatus.UPDATED for r in final),
+        skipped=sum(r.status is BulkRowStatus.SKIPPED for r in final),
+        errors=sum(r.status is BulkRowStatus.ERROR for r in final),
+        results=final,
+    )
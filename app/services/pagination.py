@@ -0,0 +1,112 @@
+"""Utilidades de paginación por cursor (keyset) para los listados de la API.
+
+El cursor es opaco para el cliente: codifica en base64 la clave de orden del
+último elemento de la página. La página siguiente se obtiene con
+``WHERE (clave) > (cursor) ORDER BY clave LIMIT n``, que usa el índice y cuesta
+O(página) sin importar el tamaño de la tabla.
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, tuple_
+
+# Tamaño de página por defecto y máximo permitido
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(*values: Any) -> str:
+    """Codifica la clave de orden de un elemento como cursor opaco.
+
+    Args:
+        *values (Any): Valores de la clave de orden (se serializan con ``str``).
+
+    Returns:
+        str: Cursor en base64 url-safe.
+    """
+    raw = json.dumps([str(value) for value in values]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: Callable[[str], Any]) -> tuple[Any, ...]:
+    """Decodifica un cursor y convierte cada valor con el tipo indicado.
+
+    Args:
+        cursor (str): Cursor recibido del cliente.
+        *types (Callable[[str], Any]): Conversores para cada valor de la clave.
+
+    Returns:
+        tuple[Any, ...]: Valores de la clave de orden.
+
+    Raises:
+        HTTPException: Si el cursor no es válido.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError(cursor)
+        return tuple(
+            convert(value) for convert, value in zip(types, values, strict=True)
+        )
+    except (ValueError, TypeError, binascii.Error) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor de paginación inválido.",
+        ) from e
+
+
+def keyset_query(
+    statement: Select[Any],
+    columns: Sequence[Any],
+    after: tuple[Any, ...] | None,
+    limit: int,
+    descending: bool = False,
+) -> Select[Any]:
+    """Aplica orden, filtro por cursor y límite a una consulta.
+
+    Pide un elemento extra para saber si existe una página siguiente.
+
+    Args:
+        statement (Select): Consulta base.
+        columns (Sequence): Columnas de la clave de orden (la última debe ser única).
+        after (tuple | None): Clave del último elemento de la página anterior.
+        limit (int): Tamaño de página.
+        descending (bool): Ordenar de mayor a menor; todas las columnas de la
+            clave van en el mismo sentido, así el índice se recorre al revés.
+
+    Returns:
+        Select: La consulta paginada.
+    """
+    if after is not None:
+        key, cursor = tuple_(*columns), tuple_(*after)
+        statement = statement.where(key < cursor if descending else key > cursor)
+    if descending:
+        return statement.order_by(*(column.desc() for column in columns)).limit(
+            limit + 1
+        )
+    return statement.order_by(*columns).limit(limit + 1)
+
+
+def split_page(
+    items: Sequence[Any], limit: int, key: Callable[[Any], tuple[Any, ...]]
+) -> tuple[list[Any], str | None]:
+    """Separa la página pedida del elemento extra y calcula el siguiente cursor.
+
+    Args:
+        items (Sequence): Resultados con hasta ``limit + 1`` elementos.
+        limit (int): Tamaño de página.
+        key (Callable[[T], tuple]): Devuelve la clave de orden de un elemento.
+
+    Returns:
+        tuple[list, str | None]: La página y el cursor siguiente (o None).
+    """
+    page = list(items[:limit])
+    if len(items) <= limit or not page:
+        return page, None
+    return page, encode_cursor(*key(page[-1]))
@@ -0,0 +1,239 @@
+"""Servicio del plan semanal de comidas y de la lista de compras.
+
+La lista de compras se calcula con una única consulta agregada (``GROUP BY``) que
+escala la cantidad de cada ingrediente por las porciones planificadas sobre las
+porciones de la receta, sin cargar objetos ORM.
+"""
+
+import uuid
+from datetime import UTC, date, datetime
+from typing import Any
+
+from fastapi import HTTPException, status
+from sqlalchemy import Float, case, cast, delete
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession as Session
+from sqlmodel import col, func, select
+
+from app.models import (
+    CategoryDB,
+    Ingredients,
+    MealType,
+    PlanEntries,
+    PlanEntryCreate,
+    PlanEntryResponse,
+    PlanResponse,
+    RecipeIngredients,
+    Recipes,
+    ShoppingListItem,
+    ShoppingListResponse,
+)
+
+# Orden cronológico de las comidas del día (no alfabético)
+_MEAL_ORDER = {MealType.BREAKFAST: 0, MealType.LUNCH: 1, MealType.DINNER: 2}
+
+
+def _meal_order() -> Any:
+    # Cada comparación liga el valor con el tipo Enum de la columna
+    return case(
+        *((col(PlanEntries.meal) == meal, rank) for meal, rank in _MEAL_ORDER.items())
+    )
+
+
+def _check_range(start: date, end: date) -> None:
+    if end < start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="La fecha de fin debe ser posterior a la de inicio.",
+        )
+
+
+def _insert(db: Session) -> Any:
+    """``insert`` del dialecto de la sesión, con soporte de ``ON CONFLICT``."""
+    dialect = db.get_bind().dialect.name
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    return insert(PlanEntries)
+
+
+async def upsert_plan_entry(db: Session, entry: PlanEntryCreate) -> PlanEntries:
+    """Crea o reemplaza la comida planificada de un usuario para un día.
+
+    Usa ``INSERT ... ON CONFLICT (user_id, date, meal) DO UPDATE ... RETURNING``:
+    una sola sentencia, sin consultar antes si la comida ya estaba planificada.
+
+    Args:
+        db (Session): La sesión de la base de datos.
+        entry (PlanEntryCreate): Datos de la comida planificada.
+
+    Returns:
+        PlanEntries: La entrada creada o actualizada.
+
+    Raises:
+        HTTPException: Si la receta no existe.
+    """
+    recipe = await db.scalar(
+        select(Recipes.recipe_id).where(Recipes.recipe_id == entry.recipe_id)
+    )
+    if recipe is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Receta no encontrada.",
+        )
+    now = datetime.now(UTC)
+    statement = _insert(db).values(
+        id=uuid.uuid4(),
+        created_at=now,
+        updated_at=now,
+        **entry.model_dump(),
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=["user_id", "date", "meal"],
+        set_={
+            "recipe_id": statement.excluded.recipe_id,
+            "servings": statement.excluded.servings,
+            "notes": statement.excluded.notes,
+            "updated_at": statement.excluded.updated_at,
+        },
+    ).returning(PlanEntries)
+    result = await db.scalars(statement, execution_options={"populate_existing": True})
+    plan_entry = result.one()
+    await db.commit()
+    return plan_entry
+
+
+async def get_plan(
+    db: Session, user_id: uuid.UUID, start: date, end: date
+) -> PlanResponse:
+    """Obtiene las comidas planificadas de un usuario en un rango de fechas.
+
+    Args:
+        db (Session): La sesión de la base de datos.
+        user_id (uuid.UUID): El ID del usuario.
+        start (date): Primer día del rango (inclusive).
+        end (date): Último día del rango (inclusive).
+
+    Returns:
+        PlanResponse: Entradas ordenadas por fecha y comida.
+    """
+    _check_range(start, end)
+    statement = (
+        select(PlanEntries)
+        .where(
+            PlanEntries.user_id == user_id,
+            col(PlanEntries.date).between(start, end),
+        )
+        .order_by(col(PlanEntries.date), _meal_order())
+    )
+    entries = await db.scalars(statement)
+    return PlanResponse(
+        entries=[PlanEntryResponse.model_validate(entry) for entry in entries]
+    )
+
+
+async def delete_plan_entry(
+    db: Session, user_id: uuid.UUID, day: date, meal: MealType
+) -> None:
+    """Borra la comida planificada de un usuario para un día.
+
+    Args:
+        db (Session): La sesión de la base de datos.
+        user_id (uuid.UUID): El ID del usuario.
+        day (date): El día de la comida.
+        meal (MealType): La comida a borrar.
+
+    Raises:
+        HTTPException: Si no había una comida planificada.
+    """
+    statement = delete(PlanEntries).where(
+        col(PlanEntries.user_id) == user_id,
+        col(PlanEntries.date) == day,
+        col(PlanEntries.meal) == meal,
+    )
+    result = await db.execute(statement)
+    await db.commit()
+    if result.rowcount == 0:  # type: ignore[attr-defined]
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Comida planificada no encontrada.",
+        )
+
+
+async def get_shopping_list(
+    db: Session,
+    user_id: uuid.UUID,
+    start: date,
+    end: date,
+    include_optional: bool = False,
+) -> ShoppingListResponse:
+    """Calcula la lista de compras del plan de un usuario en un rango de fechas.
+
+    Cada cantidad se escala por ``porciones planificadas / porciones de la receta``
+    (una receta sin porciones cuenta como 1) y se suma por ingrediente y unidad
+    en una única consulta agregada. La unidad es la unidad por defecto del
+    ingrediente, que es en la que se expresan las cantidades de las recetas.
+
+    Args:
+        db (Session): La sesión de la base de datos.
+        user_id (uuid.UUID): El ID del usuario.
+        start (date): Primer día del rango (inclusive).
+        end (date): Último día del rango (inclusive).
+        include_optional (bool): Incluir ingredientes opcionales de las recetas.
+
+    Returns:
+        ShoppingListResponse: Ingredientes a comprar, ordenados por categoría y nombre.
+    """
+    _check_range(start, end)
+    scale = cast(col(PlanEntries.servings), Float) / func.coalesce(
+        func.nullif(col(Recipes.servings), 0), 1
+    )
+    statement = (
+        select(
+            col(Ingredients.ingredient_id),
+            col(Ingredients.name),
+            col(CategoryDB.name).label("category_name"),
+            col(Ingredients.default_unit).label("unit"),
+            func.sum(col(RecipeIngredients.quantity) * scale).label("quantity"),
+            func.count(col(PlanEntries.id).distinct()).label("recipes"),
+        )
+        .select_from(PlanEntries)
+        .join(Recipes, col(Recipes.recipe_id) == col(PlanEntries.recipe_id))
+        .join(
+            RecipeIngredients,
+            col(RecipeIngredients.recipe_id) == col(PlanEntries.recipe_id),
+        )
+        .join(
+            Ingredients,
+            col(Ingredients.ingredient_id) == col(RecipeIngredients.ingredient_id),
+        )
+        .join(CategoryDB, col(CategoryDB.category_id) == col(Ingredients.category_id))
+        .where(
+            PlanEntries.user_id == user_id,
+            col(PlanEntries.date).between(start, end),
+        )
+        .group_by(
+            col(Ingredients.ingredient_id),
+            col(Ingredients.name),
+            col(CategoryDB.name),
+            col(Ingredients.default_unit),
+        )
+        .order_by(col(CategoryDB.name), col(Ingredients.name))
+    )
+    if not include_optional:
+        statement = statement.where(col(RecipeIngredients.optional).is_(False))
+    rows = await db.execute(statement)
+    return ShoppingListResponse(
+        user_id=user_id,
+        start=start,
+        end=end,
+        items=[
+            ShoppingListItem(
+                ingredient_id=row.ingredient_id,
+                name=row.name,
+                category_name=row.category_name,
+                unit=row.unit,
+                quantity=round(row.quantity, 3),
+                recipes=row.recipes,
+            )
+            for row in rows
+        ],
+    )
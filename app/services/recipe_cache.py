@@ -0,0 +1,158 @@
+"""Cache en memoria de recetas serializadas, compartida por todo el proceso.
+
+Guarda el JSON ya serializado de ``RecipesResponse`` (bytes) por ID de receta, con
+política LRU y expiración por TTL. Un acierto se responde sin tocar la base de
+datos ni volver a validar el DTO. Cualquier escritura sobre una receta o sobre uno
+de sus ingredientes invalida la entrada; el TTL acota la desactualización entre
+procesos distintos (cada worker tiene su propia cache).
+"""
+
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+
+# Cantidad máxima de recetas cacheadas y segundos de vida de cada entrada; el
+# lifespan los reemplaza con RECIPE_CACHE_SIZE y RECIPE_CACHE_TTL
+RECIPE_CACHE_SIZE = 2048
+RECIPE_CACHE_TTL = 300.0
+
+
+@dataclass(frozen=True)
+class CachedRecipe:
+    """Receta serializada junto a su fecha de modificación (validador HTTP)."""
+
+    data: bytes
+    last_modified: datetime
+    expires_at: float
+    ingredient_ids: frozenset[uuid.UUID]
+
+
+class RecipeCache:
+    """Cache LRU+TTL de recetas serializadas, con índice inverso por ingrediente."""
+
+    def __init__(
+        self, max_size: int = RECIPE_CACHE_SIZE, ttl: float = RECIPE_CACHE_TTL
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[uuid.UUID, CachedRecipe] = OrderedDict()
+        # ingrediente -> recetas cacheadas que lo usan, para invalidar en cascada
+        self._by_ingredient: dict[uuid.UUID, set[uuid.UUID]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, max_size: int, ttl: float) -> None:
+        """Cambia el tamaño y el TTL de la cache, vaciándola.
+
+        Args:
+            max_size (int): Cantidad máxima de recetas (0 desactiva la cache).
+            ttl (float): Segundos de vida de cada entrada.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clear()
+
+    def get(self, recipe_id: uuid.UUID) -> CachedRecipe | None:
+        """Devuelve la receta cacheada, registrando acierto o fallo.
+
+        Args:
+            recipe_id (uuid.UUID): El ID de la receta.
+
+        Returns:
+            CachedRecipe | None: La receta o None si no está o expiró.
+        """
+        entry = self._entries.get(recipe_id)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            self.invalidate(recipe_id)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(recipe_id)
+        self.hits += 1
+        return entry
+
+    def put(
+        self,
+        recipe_id: uuid.UUID,
+        data: bytes,
+        last_modified: datetime,
+        ingredient_ids: Iterable[uuid.UUID],
+    ) -> CachedRecipe:
+        """Agrega o reemplaza una receta serializada, desalojando la menos usada.
+
+        Args:
+            recipe_id (uuid.UUID): El ID de la receta.
+            data (bytes): JSON de ``RecipesResponse``.
+            last_modified (datetime): Última modificación de la receta o sus ingredientes.
+            ingredient_ids (Iterable[uuid.UUID]): Ingredientes de la receta.
+
+        Returns:
+            CachedRecipe: La entrada creada.
+        """
+        entry = CachedRecipe(
+            data, last_modified, time.monotonic() + self.ttl, frozenset(ingredient_ids)
+        )
+        if self.max_size <= 0:
+            return entry
+        self.invalidate(recipe_id)
+        self._entries[recipe_id] = entry
+        for ingredient_id in entry.ingredient_ids:
+            self._by_ingredient.setdefault(ingredient_id, set()).add(recipe_id)
+        while len(self._entries) > self.max_size:
+            oldest = next(iter(self._entries))
+            self.invalidate(oldest)
+            self.evictions += 1
+        return entry
+
+    def invalidate(self, recipe_id: uuid.UUID) -> None:
+        """Quita una receta de la cache si existe.
+
+        Args:
+            recipe_id (uuid.UUID): El ID de la receta a quitar.
+        """
+        entry = self._entries.pop(recipe_id, None)
+        if entry is None:
+            return
+        for ingredient_id in entry.ingredient_ids:
+            recipes = self._by_ingredient.get(ingredient_id)
+            if recipes is not None:
+                recipes.discard(recipe_id)
+                if not recipes:
+                    del self._by_ingredient[ingredient_id]
+
+    def invalidate_ingredients(self, ingredient_ids: Iterable[uuid.UUID]) -> None:
+        """Quita de la cache todas las recetas que usan alguno de los ingredientes.
+
+        Args:
+            ingredient_ids (Iterable[uuid.UUID]): Ingredientes modificados.
+        """
+        for ingredient_id in ingredient_ids:
+            for recipe_id in list(self._by_ingredient.get(ingredient_id, ())):
+                self.invalidate(recipe_id)
+
+    def clear(self) -> None:
+        """Vacía la cache."""
+        self._entries.clear()
+        self._by_ingredient.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Devuelve los contadores de la cache.
+
+        Returns:
+            dict[str, int]: Tamaño, aciertos, fallos y desalojos.
+        """
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+# Instancia única por proceso
+recipe_cache = RecipeCache()
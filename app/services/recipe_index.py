@@ -0,0 +1,198 @@
+"""Índice invertido en memoria de ingredientes → recetas para "¿qué puedo cocinar?".
+
+Cada receta pública recibe un número de alta creciente al indexarse. Para cada
+ingrediente se guarda la lista ordenada de números de alta de las recetas que
+lo requieren (los ``optional`` no cuentan).
+
+La búsqueda mezcla las listas de los ingredientes pedidos (``heapq.merge``): en
+el resultado, las apariciones de una misma receta quedan juntas y su cantidad
+es el número de coincidencias. Se conservan las ``limit`` recetas con mayor
+cobertura.
+
+Se carga completo al iniciar la aplicación y se actualiza en forma incremental
+desde el servicio de recetas. Cada proceso tiene su propio índice.
+"""
+
+import bisect
+import heapq
+import itertools
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession as Session
+from sqlmodel import col, select
+
+from app.models import RecipeIngredients, Recipes
+from app.models.recipes import RecipeVisibility
+
+# Filas leídas por lote al cargar el índice
+LOAD_BATCH_SIZE = 5000
+
+
+@dataclass(frozen=True)
+class IndexMatch:
+    """Receta candidata con su cobertura de ingredientes requeridos."""
+
+    recipe_id: uuid.UUID
+    matched: int
+    required: int
+
+    @property
+    def coverage(self) -> float:
+        """Fracción de ingredientes requeridos disponibles."""
+        return self.matched / self.required
+
+
+class RecipeIngredientIndex:
+    """Listas de recetas por ingrediente y ingredientes requeridos por receta.
+
+    Invariantes (las mantienen ``put`` y ``remove``):
+
+    - ``_seqs`` y ``_recipes`` son inversos: ``_recipes[_seqs[r]][0] == r``.
+    - Cada lista de ``_postings`` está ordenada, sin repetidos ni vacía, y
+      contiene exactamente los números de alta de las recetas que requieren
+      ese ingrediente.
+    - Los números de alta nunca se reutilizan: reemplazar una receta le da uno
+      nuevo al final, así que agregar al final mantiene las listas ordenadas.
+    """
+
+    def __init__(self) -> None:
+        # Número de alta <-> receta, con sus ingredientes requeridos
+        self._seqs: dict[uuid.UUID, int] = {}
+        self._recipes: dict[int, tuple[uuid.UUID, tuple[uuid.UUID, ...]]] = {}
+        self._postings: dict[uuid.UUID, list[int]] = {}
+        self._next_seq = 0
+        self.loaded = False
+
+    async def load(self, db: Session) -> None:
+        """Construye el índice desde ``recipe_ingredients``, reemplazando el contenido.
+
+        Args:
+            db (Session): La sesión de la base de datos.
+        """
+        self.clear()
+        statement = (
+            select(RecipeIngredients.recipe_id, RecipeIngredients.ingredient_id)
+            .join(Recipes, col(Recipes.recipe_id) == col(RecipeIngredients.recipe_id))
+            .where(
+                Recipes.visibility == RecipeVisibility.PUBLIC,
+                col(RecipeIngredients.optional).is_(False),
+            )
+            .order_by(col(RecipeIngredients.recipe_id))
+            .execution_options(yield_per=LOAD_BATCH_SIZE)
+        )
+        current: uuid.UUID | None = None
+        ingredients: set[uuid.UUID] = set()
+        result = await db.stream(statement)
+        async for recipe_id, ingredient_id in result:
+            if recipe_id != current:
+                if current is not None:
+                    self.put(current, ingredients)
+                current, ingredients = recipe_id, set()
+            ingredients.add(ingredient_id)
+        if current is not None:
+            self.put(current, ingredients)
+        self.loaded = True
+
+    async def ensure_loaded(self, db: Session) -> None:
+        """Carga el índice si todavía no se cargó (por ejemplo, fuera del lifespan).
+
+        Args:
+            db (Session): La sesión de la base de datos.
+        """
+        if not self.loaded:
+            await self.load(db)
+
+    def put(self, recipe_id: uuid.UUID, ingredient_ids: Iterable[uuid.UUID]) -> None:
+        """Agrega o reemplaza una receta con sus ingredientes requeridos.
+
+        Args:
+            recipe_id (uuid.UUID): El ID de la receta.
+            ingredient_ids (Iterable[uuid.UUID]): Ingredientes no opcionales.
+        """
+        self.remove(recipe_id)
+        required = tuple(set(ingredient_ids))
+        if not required:
+            return
+        seq = self._next_seq
+        self._next_seq += 1
+        self._seqs[recipe_id] = seq
+        self._recipes[seq] = (recipe_id, required)
+        for ingredient_id in required:
+            self._postings.setdefault(ingredient_id, []).append(seq)
+
+    def remove(self, recipe_id: uuid.UUID) -> None:
+        """Quita una receta del índice si existe.
+
+        Args:
+            recipe_id (uuid.UUID): El ID de la receta a quitar.
+        """
+        seq = self._seqs.pop(recipe_id, None)
+        if seq is None:
+            return
+        _, required = self._recipes.pop(seq)
+        for ingredient_id in required:
+            postings = self._postings[ingredient_id]
+            del postings[bisect.bisect_left(postings, seq)]
+            if not postings:
+                del self._postings[ingredient_id]
+
+    def search(
+        self,
+        ingredient_ids: Iterable[uuid.UUID],
+        limit: int,
+        min_coverage: float = 0.0,
+    ) -> list[IndexMatch]:
+        """Devuelve las ``limit`` recetas con mayor cobertura de los ingredientes dados.
+
+        Desempata por menos ingredientes faltantes, luego por más ingredientes
+        en común y por último por la receta indexada antes.
+
+        Args:
+            ingredient_ids (Iterable[uuid.UUID]): Ingredientes disponibles.
+            limit (int): Cantidad máxima de recetas.
+            min_coverage (float): Cobertura mínima (0 a 1) para incluir una receta.
+
+        Returns:
+            list[IndexMatch]: Recetas ordenadas de mayor a menor cobertura.
+        """
+        lists = [self._postings[i] for i in set(ingredient_ids) if i in self._postings]
+        if not lists or limit <= 0:
+            return []
+        candidates: list[tuple[float, int, int, int, IndexMatch]] = []
+        # La mezcla de listas ordenadas deja juntas las apariciones de cada receta
+        for seq, group in itertools.groupby(heapq.merge(*lists)):
+            matched = sum(1 for _ in group)
+            recipe_id, required = self._recipes[seq]
+            if matched < min_coverage * len(required):
+                continue
+            match = IndexMatch(recipe_id, matched, len(required))
+            candidates.append(
+                (match.coverage, matched - len(required), matched, -seq, match)
+            )
+        best = heapq.nlargest(limit, candidates, key=lambda c: c[:4])
+        return [candidate[-1] for candidate in best]
+
+    def clear(self) -> None:
+        """Vacía el índice y lo marca como no cargado."""
+        self._seqs.clear()
+        self._recipes.clear()
+        self._postings.clear()
+        self.loaded = False
+
+    def stats(self) -> dict[str, int]:
+        """Devuelve el tamaño del índice.
+
+        Returns:
+            dict[str, int]: Recetas, ingredientes y entradas de las listas.
+        """
+        return {
+            "recipes": len(self._seqs),
+            "ingredients": len(self._postings),
+            "postings": sum(len(postings) for postings in self._postings.values()),
+        }
+
+
+# Instancia única por proceso
+recipe_index = RecipeIngredientIndex()
@@ -0,0 +1,100 @@
+"""Estadísticas materializadas de recetas e ingredientes.
+
+``Ingredients.usage_count`` (recetas que usan el ingrediente) y
+``Recipes.ingredient_count`` / ``Recipes.total_time`` se guardan en columnas
+indexadas para ordenar listados sin ``COUNT`` sobre ``recipe_ingredients``. El
+servicio de recetas los actualiza en la misma transacción que cada escritura;
+``recount_recipe_stats`` los recalcula desde cero (backfill o reparación, ver
+``app.commands.recount_stats``).
+"""
+
+import uuid
+from collections.abc import Collection
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession as Session
+from sqlmodel import col, func, or_, select
+
+from app.models import Ingredients, RecipeIngredients, Recipes
+
+
+def total_time(prep_time: int | None) -> int:
+    """Minutos totales de una receta, para ordenar.
+
+    Args:
+        prep_time (int | None): Minutos de preparación, si se indicaron.
+
+    Returns:
+        int: Minutos totales (0 si no se indicaron).
+    """
+    return prep_time or 0
+
+
+async def adjust_usage_counts(
+    db: Session, ingredient_ids: Collection[uuid.UUID], delta: int
+) -> None:
+    """Suma ``delta`` al uso de los ingredientes, sin hacer commit.
+
+    Una única sentencia ``UPDATE ... SET usage_count = usage_count + delta``: el
+    incremento lo resuelve la base, sin leer el valor anterior.
+
+    Args:
+        db (Session): La sesión de la base de datos.
+        ingredient_ids (Collection[uuid.UUID]): Ingredientes distintos afectados.
+        delta (int): 1 al agregar una receta que los usa, -1 al quitarla.
+    """
+    if not ingredient_ids or not delta:
+        return
+    statement = (
+        update(Ingredients)
+        .where(col(Ingredients.ingredient_id).in_(ingredient_ids))
+        .values(usage_count=col(Ingredients.usage_count) + delta)
+    )
+    await db.execute(statement)
+
+
+async def recount_recipe_stats(db: Session) -> dict[str, int]:
+    """Recalcula todos los contadores desde ``recipe_ingredients`` y hace commit.
+
+    Solo escribe las filas cuyo valor difiere, así el resultado indica cuántas
+    estaban desactualizadas.
+
+    Args:
+        db (Session): La sesión de la base de datos.
+
+    Returns:
+        dict[str, int]: Ingredientes y recetas corregidos.
+    """
+    usage = (
+        select(func.count(col(RecipeIngredients.recipe_id).distinct()))
+        .where(col(RecipeIngredients.ingredient_id) == col(Ingredients.ingredient_id))
+        .scalar_subquery()
+    )
+    ingredients = await db.execute(
+        update(Ingredients)
+        .where(col(Ingredients.usage_count) != usage)
+        .values(usage_count=usage),
+        execution_options={"synchronize_session": False},
+    )
+    count = (
+        select(func.count(col(RecipeIngredients.ingredient_id).distinct()))
+        .where(col(RecipeIngredients.recipe_id) == col(Recipes.recipe_id))
+        .scalar_subquery()
+    )
+    minutes = func.coalesce(col(Recipes.prep_time), 0)
+    recipes = await db.execute(
+        update(Recipes)
+        .where(
+            or_(
+                col(Recipes.ingredient_count) != count,
+                col(Recipes.total_time) != minutes,
+            )
+        )
+        .values(ingredient_count=count, total_time=minutes),
+        execution_options={"synchronize_session": False},
+    )
+    await db.commit()
+    return {
+        "ingredients": ingredients.rowcount,  # type: ignore[attr-defined]
+        "recipes": recipes.rowcount,  # type: ignore[attr-defined]
+    }
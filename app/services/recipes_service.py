@@ -1,22 +1,463 @@
 """Servicio que maneja la logica de negocio de las recetas.  Maneja el crud de las recetas y la tabla intermedia recipes_ingredients entre recetas e ingredientes"""
 
+import json
 import uuid
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from typing import Any
 
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession as Session
-from sqlalchemy.orm import selectinload
-from sqlmodel import select
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+from sqlmodel import col, func, or_, select
 
 from app.models import (
     IngredientResponse,
     Ingredients,
     RecipeIngredients,
     RecipeIngredientsResponse,
+    RecipeMatch,
+    RecipeMatchRequest,
+    RecipeMatchResponse,
     Recipes,
     RecipesCreate,
     RecipesResponse,
+    RecipesUpdate,
 )
-from app.models.categories import Categories, CategorieSingleResponse
+from app.models.categories import CategorieSingleResponse
+from app.models.recipes import (
+    RecipeIngredientsCreateInput,
+    RecipeSort,
+    RecipeVisibility,
+)
+
+from .ingredient_autocomplete import ingredient_autocomplete
+from .ingredients_service import build_ingredient_response
+from .pagination import DEFAULT_PAGE_SIZE, decode_cursor, keyset_query, split_page
+from .recipe_cache import CachedRecipe, recipe_cache
+from .recipe_index import recipe_index
+from .recipe_stats import adjust_usage_counts, total_time
+
+
+async def _resolve_ingredients(
+    db: Session,
+    ingredients: list[RecipeIngredientsCreateInput],
+    known: Iterable[Ingredients] = (),
+) -> list[Ingredients]:
+    """Resuelve los ingredientes de una receta con una única consulta.
+
+    Busca todos los ingredientes por id o nombre con un solo ``IN (...)`` y agrega
+    a la sesión los que no existen, sin hacer commit. Un mismo nombre nuevo
+    repetido en la receta genera un único ingrediente.
+
+    Args:
+        db (Session): Sesión de base de datos asíncrona.
+        ingredients (list[RecipeIngredientsCreateInput]): Ingredientes de la receta.
+        known (Iterable[Ingredients]): Ingredientes ya cargados (p. ej. los de la
+            receta que se edita); solo se consultan los demás.
+
+    Returns:
+        list[Ingredients]: Ingredientes resueltos, en el mismo orden de entrada.
+
+    Raises:
+        HTTPException: Si falta información para crear un ingrediente nuevo.
+    """
+    by_id = {db_ingredient.ingredient_id: db_ingredient for db_ingredient in known}
+    by_name = {db_ingredient.name: db_ingredient for db_ingredient in by_id.values()}
+    ids = {
+        ing.ingredient_id
+        for ing in ingredients
+        if ing.ingredient_id and ing.ingredient_id not in by_id
+    }
+    names = {
+        ing.name
+        for ing in ingredients
+        if ing.name
+        and ing.name not in by_name
+        and not (ing.ingredient_id and ing.ingredient_id in by_id)
+    }
+    if ids or names:
+        stmt = select(Ingredients).where(
+            or_(
+                col(Ingredients.ingredient_id).in_(ids),
+                col(Ingredients.name).in_(names),
+            )
+        )
+        for db_ingredient in await db.scalars(stmt):
+            by_id[db_ingredient.ingredient_id] = db_ingredient
+            by_name[db_ingredient.name] = db_ingredient
+
+    resolved: list[Ingredients] = []
+    for ing in ingredients:
+        db_ingredient = None
+        if ing.ingredient_id:
+            db_ingredient = by_id.get(ing.ingredient_id)
+        if db_ingredient is None and ing.name:
+            db_ingredient = by_name.get(ing.name)
+        # Si no existe, crearlo (requiere datos mínimos)
+        if db_ingredient is None:
+            if not ing.name or not ing.category_id or not ing.default_unit:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Faltan datos para crear el ingrediente: {ing.name}",
+                )
+            db_ingredient = Ingredients(
+                name=ing.name,
+                category_id=ing.category_id,
+                default_unit=ing.default_unit,
+            )
+            db.add(db_ingredient)
+            by_id[db_ingredient.ingredient_id] = db_ingredient
+            by_name[db_ingredient.name] = db_ingredient
+        resolved.append(db_ingredient)
+    return resolved
+
+
+def recipe_eager_options() -> tuple[LoaderOption, ...]:
+    """Opciones de carga para el árbol receta → ingredientes → categoría.
+
+    Cada nivel se carga con un ``selectinload`` encadenado, de modo que leer una
+    receta cuesta un número fijo de consultas sin importar cuántos ingredientes
+    tenga.
+
+    Returns:
+        tuple[LoaderOption, ...]: Opciones para pasar a ``select(Recipes).options``.
+    """
+    return (
+        selectinload(Recipes.recipe_ingredients)  # type: ignore[arg-type]
+        .selectinload(RecipeIngredients.ingredient)  # type: ignore[arg-type]
+        .selectinload(Ingredients.category),  # type: ignore[arg-type]
+    )
+
+
+def build_recipe_response(recipe: Recipes) -> RecipesResponse:
+    """Construye el DTO de una receta a partir de un objeto ya cargado.
+
+    No realiza I/O: la receta debe haberse cargado con ``recipe_eager_options``.
+
+    Args:
+        recipe (Recipes): Receta con ingredientes y categorías cargados.
+
+    Returns:
+        RecipesResponse: DTO con la receta y sus ingredientes.
+    """
+    recipe_ingredients_responses: list[RecipeIngredientsResponse] = []
+    for ri in recipe.recipe_ingredients:
+        ingredient = ri.ingredient
+        category = ingredient.category
+        ingredient_response = IngredientResponse(
+            ingredient_id=ingredient.ingredient_id,
+            name=ingredient.name,
+            category_id=ingredient.category_id,
+            default_unit=ingredient.default_unit,
+            category=CategorieSingleResponse(
+                category_id=category.category_id, name=category.name
+            ),
+        )
+        recipe_ingredients_responses.append(
+            RecipeIngredientsResponse(
+                quantity=ri.quantity,
+                optional=ri.optional,
+                ingredient=ingredient_response,
+            )
+        )
+    return RecipesResponse(
+        recipe_id=recipe.recipe_id,
+        owner_id=recipe.owner_id,
+        name=recipe.name,
+        description=recipe.description,
+        instructions=recipe.instructions,
+        prep_time=recipe.prep_time,
+        servings=recipe.servings,
+        visibility=recipe.visibility,
+        created_at=recipe.created_at,
+        update_at=recipe.update_at,
+        ingredient_count=recipe.ingredient_count,
+        total_time=recipe.total_time,
+        recipe_ingredients=recipe_ingredients_responses,
+    )
+
+
+def _recipe_last_modified(recipe: Recipes) -> datetime:
+    # El JSON incluye datos de los ingredientes: cuenta la modificación más reciente
+    return max(
+        [
+            recipe.update_at,
+            *(ri.ingredient.updated_at for ri in recipe.recipe_ingredients),
+        ]
+    )
+
+
+def _cache_recipe(recipe: Recipes) -> CachedRecipe:
+    # Serializa una sola vez y guarda los bytes junto a sus ingredientes
+    data = build_recipe_response(recipe).model_dump_json().encode("utf-8")
+    return recipe_cache.put(
+        recipe.recipe_id,
+        data,
+        _recipe_last_modified(recipe),
+        (ri.ingredient_id for ri in recipe.recipe_ingredients),
+    )
+
+
+async def _load_public_recipes(
+    db: Session, recipe_ids: list[uuid.UUID]
+) -> dict[uuid.UUID, CachedRecipe]:
+    """Devuelve recetas públicas serializadas, cargando de la base solo los fallos.
+
+    Los fallos de cache se cargan todos juntos con ``recipe_eager_options`` (un
+    número fijo de consultas) y se guardan en la cache.
+
+    Args:
+        db (Session): Sesión de base de datos asíncrona.
+        recipe_ids (list[uuid.UUID]): IDs de las recetas.
+
+    Returns:
+        dict[uuid.UUID, CachedRecipe]: Recetas por ID; las inexistentes o privadas
+        no aparecen.
+    """
+    found: dict[uuid.UUID, CachedRecipe] = {}
+    missing: list[uuid.UUID] = []
+    for recipe_id in recipe_ids:
+        entry = recipe_cache.get(recipe_id)
+        if entry is None:
+            missing.append(recipe_id)
+        else:
+            found[recipe_id] = entry
+    if missing:
+        stmt = (
+            select(Recipes)
+            .where(
+                col(Recipes.recipe_id).in_(missing),
+                Recipes.visibility == RecipeVisibility.PUBLIC,
+            )
+            .options(*recipe_eager_options())
+            .execution_options(populate_existing=True)
+        )
+        for recipe in await db.scalars(stmt):
+            found[recipe.recipe_id] = _cache_recipe(recipe)
+    return found
+
+
+async def get_cached_recipe(db: Session, recipe_id: uuid.UUID) -> CachedRecipe:
+    """Obtiene una receta pública serializada, desde la cache si está disponible.
+
+    Un acierto no toca la base de datos; un fallo cuesta un número fijo de
+    consultas, sin importar cuántos ingredientes tenga la receta.
+
+    Args:
+        db (Session): Sesión de base de datos asíncrona.
+        recipe_id (uuid.UUID): ID de la receta.
+
+    Returns:
+        CachedRecipe: JSON de ``RecipesResponse`` y fecha de modificación.
+
+    Raises:
+        HTTPException: Si la receta no existe o no es pública.
+    """
+    entry = (await _load_public_recipes(db, [recipe_id])).get(recipe_id)
+    if entry is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Receta no encontrada.",
+        )
+    return entry
+
+
+async def get_recipe_last_modified(db: Session, recipe_id: uuid.UUID) -> datetime:
+    """Obtiene la fecha de modificación de una receta pública sin cargar el árbol.
+
+    Usa la cache si la receta está cacheada; si no, una consulta agregada sobre
+    ``update_at`` de la receta y ``updated_at`` de sus ingredientes.
+
+    Args:
+        db (Session): Sesión de base de datos asíncrona.
+        recipe_id (uuid.UUID): ID de la receta.
+
+    Returns:
+        datetime: Fecha de la última modificación de la receta o sus ingredientes.
+
+    Raises:
+        HTTPException: Si la receta no existe o no es pública.
+    """
+    entry = recipe_cache.get(recipe_id)
+    if entry is not None:
+        return entry.last_modified
+    stmt = (
+        select(Recipes.update_at, func.max(Ingredients.updated_at))
+        .select_from(Recipes)
+        .outerjoin(
+            RecipeIngredients,
+            col(RecipeIngredients.recipe_id) == col(Recipes.recipe_id),
+        )
+        .outerjoin(
+            Ingredients,
+            col(Ingredients.ingredient_id) == col(RecipeIngredients.ingredient_id),
+        )
+        .where(
+            Recipes.recipe_id == recipe_id,
+            Recipes.visibility == RecipeVisibility.PUBLIC,
+        )
+        .group_by(col(Recipes.recipe_id), col(Recipes.update_at))
+    )
+    row = (await db.execute(stmt)).first()
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Receta no encontrada.",
+        )
+    update_at, ingredients_updated_at = row
+    return max(update_at, ingredients_updated_at or update_at)
+
+
+# Columna de orden y conversor del cursor de cada orden del listado; con
+# recipe_id desempatan y cada par tiene su índice
+_RECIPE_SORT_KEYS: dict[RecipeSort, tuple[Any, Callable[[str], Any]]] = {
+    RecipeSort.CREATED: (Recipes.created_at, datetime.fromisoformat),
+    RecipeSort.INGREDIENTS: (Recipes.ingredient_count, int),
+    RecipeSort.TIME: (Recipes.total_time, int),
+}
+
+
+async def get_recipes_json(
+    db: Session,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    sort: RecipeSort = RecipeSort.CREATED,
+) -> bytes:
+    """Obtiene una página de recetas públicas como JSON de ``RecipesListResponse``.
+
+    Una consulta liviana obtiene solo las claves de la página; los cuerpos salen
+    de la cache y los fallos se cargan juntos con un número fijo de consultas. Los
+    órdenes por cantidad de ingredientes y por tiempo leen columnas
+    materializadas, sin contar ``recipe_ingredients``.
+
+    Args:
+        db (Session): Sesión de base de datos asíncrona.
+        limit (int): Cantidad máxima de recetas a devolver.
+        cursor (str | None): Cursor devuelto por la página anterior.
+        sort (RecipeSort): Orden del listado; el cursor vale solo para el mismo orden.
+
+    Returns:
+        bytes: JSON con las recetas de la página y el cursor siguiente.
+    """
+    column, convert = _RECIPE_SORT_KEYS[sort]
+    after = decode_cursor(cursor, convert, uuid.UUID) if cursor else None
+    stmt = keyset_query(
+        select(column, Recipes.recipe_id).where(
+            Recipes.visibility == RecipeVisibility.PUBLIC
+        ),
+        [column, Recipes.recipe_id],
+        after,
+        limit,
+    )
+    rows = (await db.execute(stmt)).all()
+    page, next_cursor = split_page(
+        rows,
+        limit,
+        lambda row: (
+            row[0].isoformat() if isinstance(row[0], datetime) else row[0],
+            row.recipe_id,
+        ),
+    )
+    entries = await _load_public_recipes(db, [row.recipe_id for row in page])
+    # Una receta puede borrarse entre ambas consultas: se omite
+    items = b",".join(
+        entries[row.recipe_id].data for row in page if row.recipe_id in entries
+    )
+    return (
+        b'{"recipes":['
+        + items
+        + b'],"next_cursor":'
+        + json.dumps(next_cursor).encode("utf-8")
+        + b"}"
+    )
+
+
+async def match_recipes(
+    db: Session, request: RecipeMatchRequest
+) -> RecipeMatchResponse:
+    """Busca las recetas públicas con mayor cobertura de los ingredientes dados.
+
+    La búsqueda usa el índice invertido en memoria; solo los nombres de las
+    recetas elegidas se leen de la base de datos, con una única consulta.
+
+    Args:
+        db (Session): Sesión de base de datos asíncrona.
+        request (RecipeMatchRequest): Ingredientes disponibles, límite y cobertura mínima.
+
+    Returns:
+        RecipeMatchResponse: Recetas ordenadas de mayor a menor cobertura.
+    """
+    await recipe_index.ensure_loaded(db)
+    found = recipe_index.search(
+        request.ingredient_ids, request.limit, request.min_coverage
+    )
+    if not found:
+        return RecipeMatchResponse(matches=[])
+    stmt = select(Recipes.recipe_id, Recipes.name).where(
+        col(Recipes.recipe_id).in_([match.recipe_id for match in found])
+    )
+    names = {recipe_id: name for recipe_id, name in await db.execute(stmt)}
+    return RecipeMatchResponse(
+        matches=[
+            RecipeMatch(
+                recipe_id=match.recipe_id,
+                name=names[match.recipe_id],
+                matched=match.matched,
+                required=match.required,
+                coverage=round(match.coverage, 4),
+            )
+            for match in found
+            # Una receta borrada en otro proceso puede seguir en el índice local
+            if match.recipe_id in names
+        ]
+    )
+
+
+async def _written_recipe_response(
+    db: Session,
+    recipe: Recipes,
+    ingredients: list[RecipeIngredientsCreateInput],
+    db_ingredients: list[Ingredients],
+) -> RecipesResponse:
+    """Construye el DTO de una receta recién escrita con los objetos en memoria.
+
+    Se llama después del flush y antes del commit: IDs, fechas y valores por
+    defecto ya están en los objetos y las categorías salen de la cache, así no
+    hace falta volver a leer la receta.
+
+    Args:
+        db (Session): Sesión de base de datos asíncrona (solo ante un fallo de cache).
+        recipe (Recipes): La receta escrita.
+        ingredients (list[RecipeIngredientsCreateInput]): Ingredientes recibidos.
+        db_ingredients (list[Ingredients]): Ingredientes resueltos, en el mismo orden.
+
+    Returns:
+        RecipesResponse: DTO con la receta y sus ingredientes.
+    """
+    return RecipesResponse(
+        recipe_id=recipe.recipe_id,
+        owner_id=recipe.owner_id,
+        name=recipe.name,
+        description=recipe.description,
+        instructions=recipe.instructions,
+        prep_time=recipe.prep_time,
+        servings=recipe.servings,
+        visibility=recipe.visibility,
+        created_at=recipe.created_at,
+        update_at=recipe.update_at,
+        ingredient_count=recipe.ingredient_count,
+        total_time=recipe.total_time,
+        recipe_ingredients=[
+            RecipeIngredientsResponse(
+                quantity=ing.quantity,
+                optional=ing.optional if ing.optional is not None else False,
+                ingredient=await build_ingredient_response(db, db_ingredient),
+            )
+            for ing, db_ingredient in zip(ingredients, db_ingredients, strict=True)
+        ],
+    )
 
 
 async def create_recipe(
@@ -24,8 +465,8 @@ async def create_recipe(
 ) -> RecipesResponse:
     """Crea una nueva receta en la base de datos con ingredientes asociados.
 
-    Garantiza que todas las relaciones necesarias se cargan eagerly dentro del contexto
-    async, evitando lazy-loading fuera de la sesión que causa MissingGreenlet.
+    El DTO se arma antes del commit con los objetos en memoria, sin volver a
+    leer la receta ni acceder a atributos expirados.
 
     Args:
         db (Session): Sesión de base de datos asíncrona.
@@ -40,7 +481,14 @@ async def create_recipe(
     """
     recipe_id_local: uuid.UUID | None = None
     try:
-        # 1. Crear la receta principal
+        # 1. Resolver todos los ingredientes en lote (antes de agregar la receta,
+        # así la consulta no dispara un flush y la receta se inserta completa)
+        db_ingredients = await _resolve_ingredients(db, recipe_data.ingredients)
+        ingredient_ids = {
+            db_ingredient.ingredient_id for db_ingredient in db_ingredients
+        }
+
+        # 2. Crear la receta y las relaciones (sin commit: una sola transacción)
         new_recipe = Recipes(
             name=recipe_data.name,
             description=recipe_data.description,
@@ -49,126 +497,189 @@ async def create_recipe(
             servings=recipe_data.servings,
             visibility=recipe_data.visibility,
             owner_id=owner_id,
+            ingredient_count=len(ingredient_ids),
+            total_time=total_time(recipe_data.prep_time),
         )
         db.add(new_recipe)
-        await db.commit()
-        await db.refresh(new_recipe)
         # Guardar el ID localmente para evitar acceso perezoso después
         recipe_id_local = new_recipe.recipe_id
-
-        # 2. Procesar ingredientes y crear relaciones
-        for ing in recipe_data.ingredients:
-            db_ingredient = None
-            # Buscar ingrediente por id o nombre
-            if ing.ingredient_id:
-                stmt = select(Ingredients).where(
-                    Ingredients.ingredient_id == ing.ingredient_id
-                )
-                result = await db.scalars(stmt)
-                db_ingredient = result.first()
-            elif ing.name:
-                stmt = select(Ingredients).where(Ingredients.name == ing.name)
-                result = await db.scalars(stmt)
-                db_ingredient = result.first()
-            # Si no existe, crearlo (requiere datos mínimos)
-            if not db_ingredient:
-                if not ing.name or not ing.category_id or not ing.default_unit:
-                    await db.rollback()
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail=f"Faltan datos para crear el ingrediente: {ing.name}",
-                    )
-                db_ingredient = Ingredients(
-                    name=ing.name,
-                    category_id=ing.category_id,
-                    default_unit=ing.default_unit,
-                )
-                db.add(db_ingredient)
-                await db.commit()
-                await db.refresh(db_ingredient)
-            # Crear relación en recipe_ingredients
-            recipe_ingredient = RecipeIngredients(
+        db.add_all(
+            RecipeIngredients(
                 recipe_id=recipe_id_local,
                 ingredient_id=db_ingredient.ingredient_id,
                 quantity=ing.quantity,
                 optional=ing.optional if ing.optional is not None else False,
             )
-            db.add(recipe_ingredient)
-            await db.commit()
-
-        # 3. Cargar la receta con relaciones eager (selectinload)
-        # Esto evita lazy-loading cuando accedemos a los atributos en el DTO
-        stmt = (
-            select(Recipes)
-            .where(Recipes.recipe_id == recipe_id_local)
-            .options(
-                selectinload(Recipes.recipe_ingredients).selectinload(
-                    RecipeIngredients.ingredient
-                )
+            for ing, db_ingredient in zip(
+                recipe_data.ingredients, db_ingredients, strict=True
             )
         )
-        result = await db.execute(stmt)
-        recipe_with_relations = result.scalar_one_or_none()
-        if recipe_with_relations is None:
-            await db.rollback()
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"No se pudo recuperar la receta creada con id {recipe_id_local}.",
+        # IDs leídos antes del commit, que puede expirar los objetos
+        required_ids = [
+            db_ingredient.ingredient_id
+            for ing, db_ingredient in zip(
+                recipe_data.ingredients, db_ingredients, strict=True
             )
+            if not ing.optional
+        ]
+        used = [(ing.ingredient_id, ing.name) for ing in db_ingredients]
+        # SQLAlchemy agrupa los INSERT de cada tabla en lote; el flush también
+        # completa en memoria los valores por defecto de las columnas
+        await db.flush()
+        # Contadores de uso en la misma transacción que la receta
+        await adjust_usage_counts(db, ingredient_ids, 1)
+        # 3. Construir el DTO con lo que ya está en memoria
+        response = await _written_recipe_response(
+            db, new_recipe, recipe_data.ingredients, db_ingredients
+        )
+        # Un único commit para toda la receta
+        await db.commit()
+        if recipe_data.visibility == RecipeVisibility.PUBLIC:
+            recipe_index.put(recipe_id_local, required_ids)
+        ingredient_autocomplete.record_usage(used)
+        return response
+    except HTTPException:
+        # Re-lanzar excepciones HTTP sin encapsular, descartando lo pendiente
+        await db.rollback()
+        raise
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Error al crear la receta: {str(e)}",
+        ) from e
 
-        # 4. Construir DTOs de ingredientes con categorías (eagerly loaded)
-        recipe_ingredients_responses: list[RecipeIngredientsResponse] = []
-        for ri in recipe_with_relations.recipe_ingredients:
-            ingredient = ri.ingredient
-            # Cargar categoría eagerly para evitar lazy-load
-            stmt_cat = select(Categories).where(
-                Categories.category_id == ingredient.category_id
-            )
-            result_cat = await db.execute(stmt_cat)
-            category_obj = result_cat.scalar_one_or_none()
-            if category_obj is None:
-                await db.rollback()
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"No se encontró la categoría con id {ingredient.category_id} para el ingrediente {ingredient.name}.",
-                )
-            category_dto = CategorieSingleResponse(
-                category_id=category_obj.category_id, name=category_obj.name
-            )
-            ingredient_response = IngredientResponse(
-                ingredient_id=ingredient.ingredient_id,
-                name=ingredient.name,
-                category_id=ingredient.category_id,
-                default_unit=ingredient.default_unit,
-                category=category_dto,
+
+# Columnas de la receta que no admiten null al actualizar
+_NOT_NULL = frozenset({"name", "description", "visibility"})
+
+
+async def update_recipe(db: Session, recipe_data: RecipesUpdate) -> RecipesResponse:
+    """Actualiza una receta y concilia sus ingredientes con los existentes.
+
+    Compara la lista recibida con las filas de ``recipe_ingredients`` y solo
+    inserta, actualiza o borra las que cambian, en una transacción: cambiar una
+    cantidad cuesta dos lecturas y dos ``UPDATE``. Los campos omitidos de la
+    receta se conservan y un ``null`` explícito vacía los opcionales
+    (instrucciones, tiempo y porciones). Mantiene los contadores materializados,
+    la cache, el índice por ingredientes y el autocompletado.
+
+    Args:
+        db (Session): Sesión de base de datos asíncrona.
+        recipe_data (RecipesUpdate): Campos a modificar y lista completa de ingredientes.
+
+    Returns:
+        RecipesResponse: DTO con la receta actualizada.
+
+    Raises:
+        HTTPException: Si la receta no existe, un campo obligatorio llega en
+            ``null`` o faltan datos de un ingrediente nuevo.
+    """
+    recipe_id = recipe_data.recipe_id
+    fields = recipe_data.model_dump(
+        exclude={"recipe_id", "ingredients"}, exclude_unset=True
+    )
+    cleared = sorted(
+        key for key, value in fields.items() if value is None and key in _NOT_NULL
+    )
+    if cleared:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Campos obligatorios sin valor: {', '.join(cleared)}.",
+        )
+    try:
+        recipe = await db.get(Recipes, recipe_id)
+        if recipe is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Receta no encontrada.",
             )
-            recipe_ingredients_responses.append(
-                RecipeIngredientsResponse(
-                    quantity=ri.quantity,
-                    optional=ri.optional,
-                    ingredient=ingredient_response,
+        # Filas actuales con su ingrediente, que no hace falta volver a buscar
+        stmt = (
+            select(RecipeIngredients)
+            .where(RecipeIngredients.recipe_id == recipe_id)
+            .options(joinedload(RecipeIngredients.ingredient))  # type: ignore[arg-type]
+        )
+        rows = list(await db.scalars(stmt))
+        old_ids = {row.ingredient_id for row in rows}
+        db_ingredients = await _resolve_ingredients(
+            db, recipe_data.ingredients, [row.ingredient for row in rows]
+        )
+        new_ids = {db_ingredient.ingredient_id for db_ingredient in db_ingredients}
+
+        # Cada ingrediente recibido reutiliza una fila del mismo ingrediente; las
+        # que sobran se borran y las que faltan se insertan
+        available: dict[uuid.UUID, list[RecipeIngredients]] = {}
+        for row in rows:
+            available.setdefault(row.ingredient_id, []).append(row)
+        for ing, db_ingredient in zip(
+            recipe_data.ingredients, db_ingredients, strict=True
+        ):
+            optional = ing.optional if ing.optional is not None else False
+            reusable = available.get(db_ingredient.ingredient_id)
+            if reusable:
+                row = reusable.pop(0)
+                # Asignar solo si cambia: el flush no emite UPDATE para filas intactas
+                if row.quantity != ing.quantity:
+                    row.quantity = ing.quantity
+                if row.optional != optional:
+                    row.optional = optional
+            else:
+                db.add(
+                    RecipeIngredients(
+                        recipe_id=recipe_id,
+                        ingredient_id=db_ingredient.ingredient_id,
+                        quantity=ing.quantity,
+                        optional=optional,
+                    )
                 )
+        for leftover in available.values():
+            for row in leftover:
+                await db.delete(row)
+
+        for key, value in fields.items():
+            setattr(recipe, key, value)
+        recipe.ingredient_count = len(new_ids)
+        recipe.total_time = total_time(recipe.prep_time)
+        recipe.update_at = datetime.now(UTC)
+
+        required_ids = [
+            db_ingredient.ingredient_id
+            for ing, db_ingredient in zip(
+                recipe_data.ingredients, db_ingredients, strict=True
             )
-        # 5. Construir y retornar respuesta (todo dentro del contexto async)
-        return RecipesResponse(
-            recipe_id=recipe_with_relations.recipe_id,
-            owner_id=recipe_with_relations.owner_id,
-            name=recipe_with_relations.name,
-            description=recipe_with_relations.description,
-            instructions=recipe_with_relations.instructions,
-            prep_time=recipe_with_relations.prep_time,
-            servings=recipe_with_relations.servings,
-            visibility=recipe_with_relations.visibility,
-            created_at=recipe_with_relations.created_at,
-            update_at=recipe_with_relations.update_at,
-            recipe_ingredients=recipe_ingredients_responses,
+            if not ing.optional
+        ]
+        added = [
+            (db_ingredient.ingredient_id, db_ingredient.name)
+            for db_ingredient in db_ingredients
+            if db_ingredient.ingredient_id not in old_ids
+        ]
+        removed = old_ids - new_ids
+        public = recipe.visibility == RecipeVisibility.PUBLIC
+        # SQLAlchemy agrupa cada tipo de sentencia por tabla en lote
+        await db.flush()
+        await adjust_usage_counts(db, new_ids - old_ids, 1)
+        await adjust_usage_counts(db, removed, -1)
+        response = await _written_recipe_response(
+            db, recipe, recipe_data.ingredients, db_ingredients
         )
+        await db.commit()
     except HTTPException:
-        # Re-lanzar excepciones HTTP sin encapsular
+        await db.rollback()
         raise
     except Exception as e:
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Error al crear la receta: {str(e)}",
+            detail=f"Error al actualizar la receta: {str(e)}",
         ) from e
+
+    recipe_cache.invalidate(recipe_id)
+    if public:
+        recipe_index.put(recipe_id, required_ids)
+    else:
+        recipe_index.remove(recipe_id)
+    ingredient_autocomplete.record_usage(added)
+    ingredient_autocomplete.release_usage(removed)
+    return response
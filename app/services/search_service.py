@@ -0,0 +1,96 @@
+"""Servicio de búsqueda de texto completo de recetas.
+
+Consulta la tabla FTS5 ``recipe_search_fts`` (ver ``app.models.recipe_search``),
+que indexa nombre, descripción, instrucciones y nombres de ingredientes de cada
+receta. Cada término del usuario se busca como prefijo y los resultados se
+ordenan por bm25, sin recorrer la tabla de recetas con ``LIKE '%x%'``.
+"""
+
+import re
+
+from fastapi import HTTPException, status
+from sqlalchemy import literal_column
+from sqlalchemy.ext.asyncio import AsyncSession as Session
+from sqlmodel import col, func, select
+
+from app.models import Recipes, RecipeSearchResponse, RecipeSearchResult
+from app.models.recipe_search import (
+    SEARCH_COLUMN_WEIGHTS,
+    recipe_search,
+    recipe_search_fts,
+)
+from app.models.recipes import RecipeVisibility
+
+# Términos considerados por búsqueda; el resto se ignora
+MAX_SEARCH_TERMS = 8
+
+_TERM = re.compile(r"\w+")
+
+
+def build_match_query(text: str) -> str:
+    """Convierte el texto del usuario en una consulta ``MATCH`` de FTS5.
+
+    Solo se conservan las palabras (letras, dígitos y ``_``), así los operadores
+    y comillas de FTS5 no llegan a la consulta. Cada palabra se busca como
+    prefijo y todas deben aparecer: ``"tor papa"`` -> ``"tor"* "papa"*``.
+
+    Args:
+        text (str): Texto ingresado por el usuario.
+
+    Returns:
+        str: Consulta FTS5.
+
+    Raises:
+        HTTPException: Si el texto no tiene ninguna palabra.
+    """
+    terms = _TERM.findall(text)[:MAX_SEARCH_TERMS]
+    if not terms:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="La búsqueda debe contener al menos una palabra.",
+        )
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+async def search_recipes(db: Session, text: str, limit: int) -> RecipeSearchResponse:
+    """Busca recetas públicas por nombre, descripción, instrucciones o ingredientes.
+
+    Args:
+        db (Session): La sesión de la base de datos.
+        text (str): Texto a buscar; cada palabra se trata como prefijo.
+        limit (int): Cantidad máxima de resultados.
+
+    Returns:
+        RecipeSearchResponse: Recetas ordenadas de mayor a menor relevancia.
+
+    Raises:
+        HTTPException: Si el texto no tiene palabras, o 501 si la base no es
+            SQLite (el índice FTS5 no existe en otros motores).
+    """
+    if db.get_bind().dialect.name != "sqlite":
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="La búsqueda de texto completo solo está disponible con SQLite.",
+        )
+    # MATCH y bm25 reciben la tabla FTS5 misma, no una columna
+    fts = literal_column(recipe_search_fts.name)
+    rank = func.bm25(fts, *SEARCH_COLUMN_WEIGHTS).label("rank")
+    statement = (
+        select(
+            col(Recipes.recipe_id), col(Recipes.name), col(Recipes.description), rank
+        )
+        .select_from(recipe_search_fts)
+        .join(recipe_search, recipe_search.c.id == recipe_search_fts.c.rowid)
+        .join(Recipes, col(Recipes.recipe_id) == recipe_search.c.recipe_id)
+        .where(
+            fts.op("MATCH")(build_match_query(text)),
+            Recipes.visibility == RecipeVisibility.PUBLIC,
+        )
+        .order_by(rank)
+        .limit(limit)
+    )
+    rows = await db.execute(statement)
+    return RecipeSearchResponse(
+        query=text,
+        results=[RecipeSearchResult.model_validate(row._mapping) for row in rows],
+    )
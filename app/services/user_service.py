@@ -1,12 +1,16 @@
 """Servicio de usuarios, maneja la lógica de negocio relacionada con los usuarios."""
 
+from datetime import UTC, datetime
+
 from fastapi import HTTPException, status
 from pydantic import EmailStr
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession as Session
-from sqlmodel import select
+from sqlmodel import col, select
 
-from app.core.security import get_hash_password
+from app.core.db import is_unique_violation
+from app.core.security import get_hash_password_async
 from app.models import UserCreate, UserUpdate
 from app.models import Users as UserBD
 
@@ -21,18 +25,8 @@ async def create_user(db: Session, user: UserCreate) -> UserBD:
     Returns:
         UserResponse: El usuario creado.
     """
-    # Verifica si el usuario ya existe
-    statement = select(UserBD).where(UserBD.email == user.email)
-    db_user = await db.scalars(statement)
-    db_user = db_user.first()
-    if db_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="El usuario con este correo ya existe.",
-        )
-
-    # hasheamos la contraseña
-    hashed_password = get_hash_password(user.password)
+    # hasheamos la contraseña en el pool de bcrypt para no bloquear el event loop
+    hashed_password = await get_hash_password_async(user.password)
 
     # creamos el usuario
     new_user = UserBD(
@@ -42,11 +36,19 @@ async def create_user(db: Session, user: UserCreate) -> UserBD:
         family_name=user.family_name,
     )
 
-    # Agrega el usuario a la sesión y confirma la transacción
+    # Agrega el usuario a la sesión y confirma la transacción; la restricción
+    # UNIQUE del email detecta duplicados sin una consulta previa
     db.add(new_user)
-
-    await db.commit()
-    await db.refresh(new_user)
+    try:
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        if not is_unique_violation(e):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="El usuario con este correo ya existe.",
+        ) from e
 
     # Retorna el usuario creado
     return new_user
@@ -73,40 +75,78 @@ async def get_user_by_email(db: Session, email: EmailStr) -> UserBD:
     return user
 
 
-async def update_user(db: Session, email: EmailStr, user_update: UserUpdate) -> UserBD:
-    """Actualiza los datos de un usuario existente.
+async def get_user_last_modified(db: Session, email: EmailStr) -> datetime:
+    """Obtiene la fecha de modificación de un usuario sin cargar el objeto.
 
     Args:
         db (Session): La sesión de la base de datos.
-        email (EmailStr): El correo electrónico del usuario a actualizar.
-        user_update (UserUpdate): Los datos a actualizar.
+        email (EmailStr): El correo electrónico del usuario.
 
     Returns:
-        UserResponse: El usuario actualizado.
+        datetime: Fecha de la última modificación.
+
+    Raises:
+        HTTPException: Si el usuario no existe.
     """
-    # Busca el usuario por su correo electrónico
-    statement = select(UserBD).where(UserBD.email == email)
-    result = await db.scalars(statement)
-    db_user = result.first()
-    if not db_user:
+    statement = select(UserBD.updated_at).where(UserBD.email == email)
+    updated_at = await db.scalar(statement)
+    if updated_at is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Usuario no encontrado.",
         )
+    return updated_at
+
+
+async def update_user(db: Session, email: EmailStr, user_update: UserUpdate) -> UserBD:
+    """Actualiza los datos de un usuario existente.
 
-    # Actualiza los campos proporcionados
-    if user_update.email is not None:
-        db_user.email = user_update.email
-    if user_update.full_name is not None:
-        db_user.full_name = user_update.full_name
-    if user_update.family_name is not None:
-        db_user.family_name = user_update.family_name
+    Solo se modifican los campos enviados con un valor; los omitidos o ``null``
+    se conservan. Sirve tanto para PUT como para PATCH.
+
+    Args:
+        db (Session): La sesión de la base de datos.
+        email (EmailStr): El correo electrónico del usuario a actualizar.
+        user_update (UserUpdate): Los datos a actualizar.
 
-    # Confirma la transacción
-    db.add(db_user)
+    Returns:
+        UserResponse: El usuario actualizado.
+
+    Raises:
+        HTTPException: Si el usuario no existe o el correo ya está en uso.
+    """
+    values = user_update.model_dump(exclude_unset=True, exclude_none=True)
+    if not values:
+        # Nada que cambiar: no se altera updated_at
+        return await get_user_by_email(db, email)
+
+    # Un único UPDATE ... RETURNING: la fila devuelta confirma que existía
+    statement = (
+        update(UserBD)
+        .where(col(UserBD.email) == email)
+        .values(**values, updated_at=datetime.now(UTC))
+        .returning(UserBD)
+    )
     try:
+        db_user = (await db.scalars(statement)).first()
+        if db_user is None:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Usuario no encontrado.",
+            )
         await db.commit()
-        await db.refresh(db_user)
+    except IntegrityError as e:
+        await db.rollback()
+        if not is_unique_violation(e):
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Error al actualizar el usuario.",
+            ) from e
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="El usuario con este correo ya existe.",
+        ) from e
     except SQLAlchemyError as e:
         await db.rollback()
         raise HTTPException(
@@ -0,0 +1,430 @@
+"""Benchmark reproducible de la API.
+
+Crea un archivo SQLite temporal, lo puebla con un dataset sintético (usuarios,
+categorías, miles de ingredientes y recetas de 5 a 40 ingredientes) y ejecuta la
+aplicación FastAPI real en el mismo proceso con el transporte ASGI de httpx.
+Por cada escenario reporta throughput, latencias p50/p95/p99 y consultas a la base
+de datos por llamada (leídas de la cabecera ``Server-Timing``).
+
+Uso::
+
+    python -m benchmarks.api_benchmark --output bench.json
+    python -m benchmarks.api_benchmark --baseline bench.json --max-regression 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import re
+import sys
+import tempfile
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+# Categorías del dataset sintético
+CATEGORY_NAMES = [
+    "Verduras",
+    "Frutas",
+    "Carnes",
+    "Pescados",
+    "Lácteos",
+    "Cereales",
+    "Legumbres",
+    "Especias",
+    "Aceites",
+    "Bebidas",
+    "Panificados",
+    "Congelados",
+]
+
+SERVER_TIMING_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+@dataclass
+class Dataset:
+    """IDs del dataset sintético, usados para armar las peticiones."""
+
+    user_emails: list[str]
+    category_ids: list[uuid.UUID]
+    ingredient_ids: list[uuid.UUID]
+    recipe_ids: list[uuid.UUID]
+    # Usuario con una semana completa planificada (21 comidas)
+    plan_user_id: uuid.UUID
+    plan_start: date
+
+
+@dataclass
+class Scenario:
+    """Un endpoint a medir: método, ruta y cuerpo generados por llamada."""
+
+    name: str
+    method: str
+    path: Callable[[Dataset, random.Random], str]
+    body: Callable[[Dataset, random.Random], Any] | None = None
+    # Escenarios costosos (p. ej. bcrypt) se ejecutan menos veces
+    weight: float = 1.0
+
+
+SCENARIOS: list[Scenario] = [
+    Scenario("GET /", "GET", lambda ds, rnd: "/"),
+    Scenario("GET /categories/", "GET", lambda ds, rnd: "/api/v1/categories/?limit=50"),
+    Scenario(
+        "GET /categories/{id}",
+        "GET",
+        lambda ds, rnd: f"/api/v1/categories/{rnd.choice(ds.category_ids)}",
+    ),
+    Scenario(
+        "GET /ingredients/", "GET", lambda ds, rnd: "/api/v1/ingredients/?limit=50"
+    ),
+    Scenario(
+        "GET /ingredients/{id}",
+        "GET",
+        lambda ds, rnd: f"/api/v1/ingredients/{rnd.choice(ds.ingredient_ids)}",
+    ),
+    Scenario("GET /recipes/", "GET", lambda ds, rnd: "/api/v1/recipes/?limit=20"),
+    Scenario(
+        "GET /recipes/{id}",
+        "GET",
+        lambda ds, rnd: f"/api/v1/recipes/{rnd.choice(ds.recipe_ids)}",
+    ),
+    Scenario(
+        "GET /recipes/search",
+        "GET",
+        # Prefijo de 5 dígitos: coincide con hasta 10 recetas "Receta NNNNNx"
+        lambda ds, rnd: (
+            f"/api/v1/recipes/search?q={rnd.randrange(len(ds.recipe_ids)) // 10:05d}"
+        ),
+    ),
+    Scenario(
+        "GET /plan/shopping-list",
+        "GET",
+        lambda ds, rnd: (
+            f"/api/v1/plan/shopping-list?user_id={ds.plan_user_id}"
+            f"&start={ds.plan_start}"
+        ),
+    ),
+    Scenario(
+        "GET /users/{email}",
+        "GET",
+        lambda ds, rnd: f"/api/v1/users/{rnd.choice(ds.user_emails)}",
+    ),
+    Scenario(
+        "POST /ingredients/bulk",
+        "POST",
+        lambda ds, rnd: "/api/v1/ingredients/bulk",
+        lambda ds, rnd: [
+            {
+                "name": f"bulk-{rnd.randrange(10**9)}",
+                "default_unit": "g",
+                "category_id": str(rnd.choice(ds.category_ids)),
+            }
+            for _ in range(100)
+        ],
+        weight=0.2,
+    ),
+    Scenario(
+        "POST /users/",
+        "POST",
+        lambda ds, rnd: "/api/v1/users/",
+        lambda ds, rnd: {
+            "email": f"bench-{uuid.uuid4().hex}@example.com",
+            "full_name": "Bench User",
+            "family_name": "Bench",
+            "password": "secreta",  # nosec
+        },
+        weight=0.1,
+    ),
+]
+
+
+async def seed(
+    rnd: random.Random, users: int, ingredients: int, recipes: int
+) -> Dataset:
+    """Crea el esquema y puebla la base con el dataset sintético.
+
+    Args:
+        rnd (random.Random): Generador con semilla fija para reproducibilidad.
+        users (int): Cantidad de usuarios.
+        ingredients (int): Cantidad de ingredientes.
+        recipes (int): Cantidad de recetas (cada una con 5 a 40 ingredientes).
+
+    Returns:
+        Dataset: IDs generados.
+    """
+    from sqlmodel import SQLModel
+
+    from app.core import async_session
+    from app.core.db import database
+    from app.models import (
+        CategoryDB,
+        Ingredients,
+        MealType,
+        PlanEntries,
+        RecipeIngredients,
+        Recipes,
+        Users,
+        recipe_search,  # noqa: F401  (registra el DDL de FTS5 para create_all)
+    )
+
+    async with database.engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    async with async_session() as db:
+        user_rows = [
+            Users(
+                email=f"user{i}@example.com",
+                full_name=f"Usuario {i}",
+                family_name=f"Familia {i % 50}",
+                hashed_password="x",  # nosec
+            )
+            for i in range(users)
+        ]
+        categories = [CategoryDB(name=name) for name in CATEGORY_NAMES]
+        ingredient_rows = [
+            Ingredients(
+                name=f"Ingrediente {i:06d}",
+                category_id=rnd.choice(categories).category_id,
+                default_unit=rnd.choice(["g", "kg", "ml", "l", "u"]),
+            )
+            for i in range(ingredients)
+        ]
+        db.add_all([*user_rows, *categories, *ingredient_rows])
+        recipe_rows: list[Recipes] = []
+        for i in range(recipes):
+            recipe = Recipes(
+                name=f"Receta {i:06d}",
+                description="Receta sintética para benchmark",
+                instructions="Mezclar todo. " * 20,
+                prep_time=rnd.randint(5, 120),
+                servings=rnd.randint(1, 8),
+                owner_id=rnd.choice(user_rows).id,
+            )
+            recipe_rows.append(recipe)
+            for ingredient in rnd.sample(ingredient_rows, rnd.randint(5, 40)):
+                db.add(
+                    RecipeIngredients(
+                        recipe_id=recipe.recipe_id,
+                        ingredient_id=ingredient.ingredient_id,
+                        quantity=round(rnd.uniform(1, 500), 1),
+                        optional=rnd.random() < 0.1,
+                    )
+                )
+        db.add_all(recipe_rows)
+        plan_start = date(2026, 1, 5)
+        db.add_all(
+            PlanEntries(
+                user_id=user_rows[0].id,
+                date=plan_start + timedelta(days=day),
+                meal=meal,
+                recipe_id=rnd.choice(recipe_rows).recipe_id,
+                servings=rnd.randint(1, 6),
+            )
+            for day in range(7)
+            for meal in MealType
+        )
+        await db.commit()
+
+    return Dataset(
+        user_emails=[user.email for user in user_rows],
+        category_ids=[category.category_id for category in categories],
+        ingredient_ids=[ingredient.ingredient_id for ingredient in ingredient_rows],
+        recipe_ids=[recipe.recipe_id for recipe in recipe_rows],
+        plan_user_id=user_rows[0].id,
+        plan_start=plan_start,
+    )
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Percentil por rango más cercano sobre una lista ya ordenada."""
+    if not sorted_values:
+        return 0.0
+    rank = max(
+        0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1)
+    )
+    return sorted_values[rank]
+
+
+async def run_scenario(
+    client: Any,
+    scenario: Scenario,
+    dataset: Dataset,
+    rnd: random.Random,
+    requests: int,
+    concurrency: int,
+) -> dict[str, Any]:
+    """Ejecuta un escenario y devuelve sus estadísticas.
+
+    Args:
+        client (httpx.AsyncClient): Cliente conectado a la app por ASGI.
+        scenario (Scenario): Escenario a medir.
+        dataset (Dataset): IDs del dataset sintético.
+        rnd (random.Random): Generador con semilla fija.
+        requests (int): Cantidad de peticiones.
+        concurrency (int): Peticiones simultáneas.
+
+    Returns:
+        dict[str, Any]: Throughput, percentiles, consultas por llamada y errores.
+    """
+    calls = [
+        (
+            scenario.path(dataset, rnd),
+            scenario.body(dataset, rnd) if scenario.body else None,
+        )
+        for _ in range(requests)
+    ]
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    queries: list[int] = []
+    errors = 0
+
+    async def call(path: str, body: Any) -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.request(scenario.method, path, json=body)
+            latencies.append(time.perf_counter() - started)
+        if response.status_code >= 400:
+            errors += 1
+        match = SERVER_TIMING_QUERIES.search(response.headers.get("server-timing", ""))
+        if match:
+            queries.append(int(match.group(1)))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(call(path, body) for path, body in calls))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": errors,
+        "throughput_rps": round(requests / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "queries_per_call": round(sum(queries) / len(queries), 2) if queries else None,
+    }
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], max_regression: float
+) -> list[str]:
+    """Compara p95 y consultas por llamada contra una ejecución previa.
+
+    Args:
+        results (dict[str, Any]): Resultados actuales.
+        baseline (dict[str, Any]): Resultados de referencia.
+        max_regression (float): Aumento relativo de p95 tolerado (0.2 = 20 %).
+
+    Returns:
+        list[str]: Descripción de cada regresión encontrada.
+    """
+    regressions: list[str] = []
+    for name, current in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if previous is None:
+            continue
+        if previous["p95_ms"] and current["p95_ms"] > previous["p95_ms"] * (
+            1 + max_regression
+        ):
+            regressions.append(
+                f"{name}: p95 {previous['p95_ms']} ms -> {current['p95_ms']} ms"
+            )
+        if (current["queries_per_call"] or 0) > (previous["queries_per_call"] or 0):
+            regressions.append(
+                f"{name}: consultas/llamada {previous['queries_per_call']} -> "
+                f"{current['queries_per_call']}"
+            )
+    return regressions
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Prepara la base, ejecuta los escenarios y escribe el reporte JSON."""
+    import httpx
+
+    from app.main import app, lifespan
+
+    rnd = random.Random(args.seed)
+    seed_started = time.perf_counter()
+    dataset = await seed(rnd, args.users, args.ingredients, args.recipes)
+    seed_seconds = time.perf_counter() - seed_started
+
+    results: dict[str, Any] = {
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "seed": args.seed,
+            "users": args.users,
+            "ingredients": args.ingredients,
+            "recipes": args.recipes,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+        },
+        "seed_seconds": round(seed_seconds, 3),
+        "scenarios": {},
+    }
+    selected = [s for s in SCENARIOS if not args.only or args.only in s.name]
+    transport = httpx.ASGITransport(app=app)
+    async with lifespan(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            for scenario in selected:
+                requests = max(1, int(args.requests * scenario.weight))
+                # Calentamiento: caches y pool de conexiones
+                await run_scenario(client, scenario, dataset, rnd, 5, 1)
+                stats = await run_scenario(
+                    client, scenario, dataset, rnd, requests, args.concurrency
+                )
+                results["scenarios"][scenario.name] = stats
+                print(
+                    f"{scenario.name:<28} {stats['throughput_rps']:>9.1f} req/s  "
+                    f"p50 {stats['p50_ms']:>8.2f} ms  p95 {stats['p95_ms']:>8.2f} ms  "
+                    f"p99 {stats['p99_ms']:>8.2f} ms  queries {stats['queries_per_call']}"
+                )
+
+    Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+    print(f"Resultados escritos en {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare(results, baseline, args.max_regression)
+        for regression in regressions:
+            print(f"REGRESIÓN {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Argumentos de línea de comandos del benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--ingredients", type=int, default=5000)
+    parser.add_argument("--recipes", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument(
+        "--only", help="Ejecuta solo los escenarios que contienen el texto"
+    )
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline", help="JSON de una ejecución previa para comparar")
+    parser.add_argument("--max-regression", type=float, default=0.2)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        # El motor se crea en el primer uso: la URL debe definirse antes
+        os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"
+        sys.exit(asyncio.run(main(arguments)))
@@ -0,0 +1,227 @@
+"""Benchmark de serialización de respuestas grandes.
+
+Arma en memoria una receta grande y una página de recetas (DTOs ya validados) y
+los devuelve desde una app FastAPI mínima con cada estrategia de serialización,
+medida de punta a punta con el transporte ASGI de httpx:
+
+* ``stdlib``: ``jsonable_encoder`` + ``json.dumps``, lo que hace ``JSONResponse``.
+* ``orjson``: ``default_response_class=ORJSONResponse`` (dict intermedio + orjson);
+  se omite si orjson no está instalado.
+* ``response_model``: el camino por defecto de FastAPI >= 0.130 (pydantic-core
+  serializa el DTO directo a bytes).
+* ``dto_once``: ``JSONBytesResponse(dto)``, sin validación de respuesta.
+* ``cached_bytes``: ``JSONBytesResponse`` con el JSON ya serializado (cache de recetas).
+
+Uso::
+
+    python -m benchmarks.serialization_benchmark --output serialization.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+import uuid
+import warnings
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from benchmarks.api_benchmark import percentile
+
+
+def build_recipe(ingredients: int) -> Any:
+    """Arma el DTO de una receta con la cantidad de ingredientes indicada."""
+    from app.models import (
+        CategorieSingleResponse,
+        IngredientResponse,
+        RecipeIngredientsResponse,
+        RecipesResponse,
+    )
+    from app.models.recipes import RecipeVisibility
+
+    category = CategorieSingleResponse(category_id=uuid.uuid4(), name="Verduras")
+    now = datetime.now(UTC)
+    return RecipesResponse(
+        recipe_id=uuid.uuid4(),
+        owner_id=uuid.uuid4(),
+        name="Guiso de lentejas",
+        description="Receta de invierno " * 10,
+        instructions="Picar, rehogar y cocinar a fuego lento. " * 20,
+        prep_time=45,
+        servings=4,
+        visibility=RecipeVisibility.PUBLIC,
+        created_at=now,
+        update_at=now,
+        ingredient_count=ingredients,
+        total_time=45,
+        recipe_ingredients=[
+            RecipeIngredientsResponse(
+                quantity=1.5,
+                optional=i % 5 == 0,
+                ingredient=IngredientResponse(
+                    ingredient_id=uuid.uuid4(),
+                    name=f"Ingrediente {i}",
+                    category_id=category.category_id,
+                    default_unit="g",
+                    category=category,
+                ),
+            )
+            for i in range(ingredients)
+        ],
+    )
+
+
+def build_app(payloads: dict[str, Any]) -> tuple[Any, list[str]]:
+    """App con un endpoint por carga y estrategia: ``/{estrategia}/{carga}``.
+
+    Returns:
+        tuple[Any, list[str]]: La app y las estrategias disponibles.
+    """
+    from fastapi import FastAPI
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+
+    from app.api.responses import JSONBytesResponse
+
+    try:
+        import orjson  # noqa: F401
+        from fastapi.responses import ORJSONResponse
+    except ImportError:
+        ORJSONResponse = None  # noqa: N806
+
+    app = FastAPI()
+    strategies = ["stdlib", "response_model", "dto_once", "cached_bytes"]
+    if ORJSONResponse is not None:
+        strategies.insert(1, "orjson")
+    for name, dto in payloads.items():
+        endpoints = _endpoints(dto, jsonable_encoder, JSONResponse, JSONBytesResponse)
+        model = type(dto)
+        app.get(f"/stdlib/{name}")(endpoints["stdlib"])
+        app.get(f"/response_model/{name}", response_model=model)(
+            endpoints["response_model"]
+        )
+        app.get(f"/dto_once/{name}")(endpoints["dto_once"])
+        app.get(f"/cached_bytes/{name}")(endpoints["cached_bytes"])
+        if ORJSONResponse is not None:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", DeprecationWarning)
+                app.get(
+                    f"/orjson/{name}",
+                    response_model=model,
+                    response_class=ORJSONResponse,
+                )(endpoints["response_model"])
+    return app, strategies
+
+
+def _endpoints(
+    dto: Any, jsonable_encoder: Any, json_response: Any, bytes_response: Any
+) -> dict[str, Any]:
+    # Endpoints sin parámetros: la carga queda en el cierre, no como valor por
+    # defecto (FastAPI copiaría el DTO en cada petición)
+    cached = dto.model_dump_json().encode("utf-8")
+
+    async def stdlib() -> Any:
+        return json_response(jsonable_encoder(dto))
+
+    async def response_model() -> Any:
+        return dto
+
+    async def dto_once() -> Any:
+        return bytes_response(dto)
+
+    async def cached_bytes() -> Any:
+        return bytes_response(cached)
+
+    return {
+        "stdlib": stdlib,
+        "response_model": response_model,
+        "dto_once": dto_once,
+        "cached_bytes": cached_bytes,
+    }
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Ejecuta cada estrategia sobre cada carga y escribe el reporte JSON."""
+    import httpx
+
+    from app.models import RecipesListResponse
+
+    payloads = {
+        "recipe": build_recipe(args.ingredients),
+        "list": RecipesListResponse(
+            recipes=[build_recipe(args.ingredients) for _ in range(args.page_size)],
+            next_cursor="abc",
+        ),
+    }
+    app, strategies = build_app(payloads)
+
+    results: dict[str, Any] = {
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "ingredients": args.ingredients,
+            "page_size": args.page_size,
+            "requests": args.requests,
+        },
+        "payloads": {},
+    }
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        for name in payloads:
+            stats: dict[str, Any] = {}
+            bodies: set[bytes] = set()
+            for strategy in strategies:
+                path = f"/{strategy}/{name}"
+                # Calentamiento
+                for _ in range(3):
+                    await client.get(path)
+                latencies: list[float] = []
+                for _ in range(args.requests):
+                    started = time.perf_counter()
+                    response = await client.get(path)
+                    latencies.append(time.perf_counter() - started)
+                response.raise_for_status()
+                bodies.add(json.dumps(response.json(), sort_keys=True).encode())
+                latencies.sort()
+                stats[strategy] = {
+                    "bytes": len(response.content),
+                    "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+                    "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+                }
+            if len(bodies) != 1:
+                print(f"{name}: las estrategias devuelven cuerpos distintos")
+                return 1
+            baseline = stats["stdlib"]["p50_ms"]
+            for strategy, row in stats.items():
+                row["speedup"] = round(baseline / row["p50_ms"], 2)
+                print(
+                    f"{name:<7} {strategy:<15} {row['bytes']:>9} B  "
+                    f"p50 {row['p50_ms']:>8.2f} ms  p95 {row['p95_ms']:>8.2f} ms  "
+                    f"x{row['speedup']:.2f}"
+                )
+            results["payloads"][name] = stats
+
+    Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+    print(f"Resultados escritos en {args.output}")
+    return 0
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Argumentos de línea de comandos del benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ingredients", type=int, default=40)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--output", default="serialization_results.json")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    sys.exit(asyncio.run(main(arguments)))
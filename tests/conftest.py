@@ -0,0 +1,89 @@
+"""Fixtures compartidas de las pruebas.
+
+La base de cada prueba la arma ``tests.database`` (SQLite en memoria o
+``TEST_DATABASE_URL``). Las caches e índices en memoria son únicos por
+proceso: se vacían antes y después de cada prueba que usa la base.
+"""
+
+from collections.abc import AsyncGenerator
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies import get_db, get_read_db
+from app.main import app
+from app.models import CategoryDB, Users
+from app.services.category_cache import category_cache
+from app.services.ingredient_autocomplete import ingredient_autocomplete
+from app.services.recipe_cache import recipe_cache
+from app.services.recipe_index import recipe_index
+from tests.database import QueryCounter, create_test_engine
+
+
+def _clear_caches() -> None:
+    category_cache.clear()
+    recipe_cache.clear()
+    recipe_index.clear()
+    ingredient_autocomplete.clear()
+
+
+@pytest_asyncio.fixture
+async def db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Sesión sobre una base vacía, sin expirar tras el commit (como la app)."""
+    engine = await create_test_engine()
+    _clear_caches()
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    _clear_caches()
+    await engine.dispose()
+
+
+@pytest.fixture
+def count_queries(db_session: AsyncSession) -> QueryCounter:
+    """Cuenta las sentencias SQL sobre la base de la prueba (ver ``QueryCounter``)."""
+    return QueryCounter(db_session.bind)  # type: ignore[arg-type]
+
+
+@pytest_asyncio.fixture
+async def client(db_session: AsyncSession) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Cliente HTTP de la API (``/api/v1``) sobre la base de la prueba."""
+
+    async def override_db() -> AsyncGenerator[AsyncSession, None]:
+        async with AsyncSession(db_session.bind, expire_on_commit=False) as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_read_db] = override_db
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://t/api/v1"
+        ) as client:
+            yield client
+    finally:
+        app.dependency_overrides.clear()
+
+
+@pytest_asyncio.fixture
+async def category(db_session: AsyncSession) -> CategoryDB:
+    """Categoría "Verduras" ya guardada."""
+    cat = CategoryDB(name="Verduras")
+    db_session.add(cat)
+    await db_session.commit()
+    return cat
+
+
+@pytest_asyncio.fixture
+async def user(db_session: AsyncSession) -> Users:
+    """Usuario ya guardado, dueño de las recetas y del plan de las pruebas."""
+    owner = Users(
+        email="ana@example.com",
+        full_name="Ana",
+        family_name="Pérez",
+        hashed_password="x",
+    )
+    db_session.add(owner)
+    await db_session.commit()
+    return owner
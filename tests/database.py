@@ -0,0 +1,75 @@
+"""Base de datos de las pruebas.
+
+Por defecto cada prueba usa su propia base SQLite en memoria. Con
+``TEST_DATABASE_URL`` (por ejemplo
+``postgresql+asyncpg://postgres@localhost/chequecomemos_test``) la suite corre
+contra esa base: el esquema se recrea en cada prueba. PostgreSQL verifica las
+claves foráneas, así que las pruebas guardan antes las filas a las que apuntan
+(usuarios, recetas, categorías).
+"""
+
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+
+# Registra el DDL del índice FTS5 para create_all
+from app.models import recipe_search  # noqa: F401
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+TEST_BACKEND = make_url(TEST_DATABASE_URL).get_backend_name()
+
+# Pruebas de objetos propios de SQLite (FTS5, PRAGMA)
+requires_sqlite = pytest.mark.skipif(
+    TEST_BACKEND != "sqlite", reason="usa objetos propios de SQLite"
+)
+
+# Pruebas que necesitan un servidor PostgreSQL real
+requires_postgres = pytest.mark.skipif(
+    TEST_BACKEND != "postgresql", reason="requiere TEST_DATABASE_URL de PostgreSQL"
+)
+
+
+async def create_test_engine() -> AsyncEngine:
+    """Crea el motor de la prueba con el esquema vacío.
+
+    Returns:
+        AsyncEngine: Motor sobre ``TEST_DATABASE_URL``.
+    """
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.begin() as conn:
+        # Una base compartida puede tener tablas de la prueba anterior
+        if TEST_BACKEND != "sqlite":
+            await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+class QueryCounter:
+    """Registra las sentencias SQL que un motor ejecuta dentro de un bloque ``with``.
+
+    Uso: ``with count_queries() as statements: ...``; ``statements`` es la lista
+    de sentencias en el orden en que se enviaron a la base.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine.sync_engine
+
+    @contextmanager
+    def __call__(self) -> Iterator[list[str]]:
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(self._engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(self._engine, "before_cursor_execute", record)
@@ -0,0 +1,108 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import CategoryCreate, CategoryDB
+from app.services import categories_service
+from app.services.category_cache import category_cache
+from tests.database import QueryCounter
+
+
+@pytest.mark.asyncio
+async def test_categories_are_served_from_cache(
+    db_session: AsyncSession, count_queries: QueryCounter
+) -> None:
+    created = await categories_service.create_category(
+        db_session, CategoryCreate(name="Lácteos")
+    )
+    await categories_service.get_categories(db_session)
+
+    with count_queries() as statements:
+        categories = await categories_service.get_categories(db_session)
+        category = await categories_service.get_category(
+            db_session, created.category_id
+        )
+
+    assert [c.name for c in categories.categories] == ["Lácteos"]
+    assert category.name == "Lácteos"
+    assert category_cache.get_by_name("Lácteos") == category
+    assert statements == []
+    assert category_cache.stats()["hits"] >= 2
+
+
+@pytest.mark.asyncio
+async def test_create_category_issues_only_the_insert(
+    db_session: AsyncSession,
+    count_queries: QueryCounter,
+) -> None:
+    with count_queries() as statements:
+        created = await categories_service.create_category(
+            db_session, CategoryCreate(name="Frutas")
+        )
+
+    # El ID se genera en el cliente: no hace falta releer la fila
+    assert [s.split()[0] for s in statements] == ["INSERT"]
+    assert created.name == "Frutas" and created.category_id is not None
+
+
+@pytest.mark.asyncio
+async def test_delete_category_invalidates_cache(db_session: AsyncSession) -> None:
+    created = await categories_service.create_category(
+        db_session, CategoryCreate(name="Carnes")
+    )
+    await categories_service.delete_category(db_session, created.category_id)
+
+    page = await categories_service.get_categories(db_session)
+    assert page.categories == []
+    assert category_cache.get_by_id(created.category_id) is None
+    assert category_cache.get_by_name("Carnes") is None
+
+
+def test_cache_keeps_name_index_in_sync() -> None:
+    category = CategoryDB(name="Carnes")
+    category_cache.put(category)
+    category_cache.put(CategoryDB(category_id=category.category_id, name="Aves"))
+
+    assert category_cache.get_by_name("Carnes") is None
+    cached = category_cache.get_by_name("Aves")
+    assert cached is not None and cached.category_id == category.category_id
+    assert [c.name for c in category_cache.all()] == ["Aves"]
+
+    category_cache.remove(category.category_id)
+    assert category_cache.get_by_name("Aves") is None
+    category_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_categories_paginates_by_name(db_session: AsyncSession) -> None:
+    for name in ["Frutas", "Bebidas", "Especias", "Aceites", "Cereales"]:
+        await categories_service.create_category(db_session, CategoryCreate(name=name))
+
+    names: list[str] = []
+    cursor = None
+    while True:
+        page = await categories_service.get_categories(
+            db_session, limit=2, cursor=cursor
+        )
+        names.extend(c.name for c in page.categories)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert names == ["Aceites", "Bebidas", "Cereales", "Especias", "Frutas"]
+
+
+@pytest.mark.asyncio
+async def test_create_category_duplicate_uses_unique_constraint(
+    db_session: AsyncSession,
+) -> None:
+    await categories_service.create_category(
+        db_session, CategoryCreate(name="Pescados")
+    )
+    with pytest.raises(HTTPException) as exc:
+        await categories_service.create_category(
+            db_session, CategoryCreate(name="Pescados")
+        )
+    assert exc.value.status_code == 400
+    page = await categories_service.get_categories(db_session)
+    assert [c.name for c in page.categories] == ["Pescados"]
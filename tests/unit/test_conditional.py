@@ -0,0 +1,73 @@
+from datetime import UTC, datetime
+
+from fastapi import Request
+
+from app.api.conditional import (
+    has_conditional_headers,
+    is_not_modified,
+    make_etag,
+    not_modified,
+    timestamp_etag,
+    validator_headers,
+)
+
+LAST_MODIFIED = datetime(2026, 5, 1, 12, 30, 15, 123456, tzinfo=UTC)
+
+
+def _request(**headers: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [
+                (name.replace("_", "-").encode(), value.encode())
+                for name, value in headers.items()
+            ],
+        }
+    )
+
+
+def test_timestamp_etag_ignores_timezone_representation() -> None:
+    naive = LAST_MODIFIED.replace(tzinfo=None)
+    assert timestamp_etag(naive) == timestamp_etag(LAST_MODIFIED)
+    assert timestamp_etag(LAST_MODIFIED).startswith('W/"')
+    assert make_etag("a", 1) != make_etag("a", 2)
+
+
+def test_if_none_match_uses_weak_comparison() -> None:
+    etag = timestamp_etag(LAST_MODIFIED)
+    strong = etag.removeprefix("W/")
+
+    assert is_not_modified(_request(if_none_match=etag), etag)
+    assert is_not_modified(_request(if_none_match=f'"otro", {strong}'), etag)
+    assert is_not_modified(_request(if_none_match="*"), etag)
+    assert not is_not_modified(_request(if_none_match='W/"otro"'), etag)
+    # If-None-Match tiene prioridad sobre If-Modified-Since
+    request = _request(
+        if_none_match='W/"otro"', if_modified_since="Sat, 01 May 2027 00:00:00 GMT"
+    )
+    assert not is_not_modified(request, etag, LAST_MODIFIED)
+
+
+def test_if_modified_since_has_second_resolution() -> None:
+    etag = timestamp_etag(LAST_MODIFIED)
+    header = validator_headers(etag, LAST_MODIFIED)["Last-Modified"]
+
+    assert header == "Fri, 01 May 2026 12:30:15 GMT"
+    assert is_not_modified(_request(if_modified_since=header), etag, LAST_MODIFIED)
+    assert not is_not_modified(
+        _request(if_modified_since="Fri, 01 May 2026 12:30:14 GMT"), etag, LAST_MODIFIED
+    )
+    assert not is_not_modified(
+        _request(if_modified_since="basura"), etag, LAST_MODIFIED
+    )
+    assert not has_conditional_headers(_request())
+
+
+def test_not_modified_response_has_no_body() -> None:
+    response = not_modified(make_etag("x"), LAST_MODIFIED)
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == make_etag("x")
+    assert "last-modified" in response.headers
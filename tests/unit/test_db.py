@@ -0,0 +1,130 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+
+from app.core.db import (
+    Database,
+    create_engine,
+    create_read_engine,
+    normalize_database_url,
+)
+from app.core.metrics import _before_cursor_execute
+from tests.database import TEST_DATABASE_URL, requires_postgres
+
+
+@pytest.mark.asyncio
+async def test_sqlite_engine_applies_pragmas_and_pool(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    try:
+        async with engine.connect() as conn:
+            journal_mode = await conn.scalar(text("PRAGMA journal_mode"))
+            synchronous = await conn.scalar(text("PRAGMA synchronous"))
+            busy_timeout = await conn.scalar(text("PRAGMA busy_timeout"))
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+        assert busy_timeout == 5000
+        assert engine.pool.size() == 5  # type: ignore[attr-defined]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_memory_engine_skips_pool_options() -> None:
+    engine = create_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.connect() as conn:
+            assert await conn.scalar(text("SELECT 1")) == 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_read_engine_uses_own_pool_and_rejects_writes(tmp_path: Path) -> None:
+    url = f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+    engine = create_engine(url)
+    read_engine = create_read_engine(url, engine)
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE t (x INTEGER)"))
+            await conn.execute(text("INSERT INTO t VALUES (1)"))
+        assert read_engine is not engine
+        async with read_engine.connect() as conn:
+            assert await conn.scalar(text("SELECT x FROM t")) == 1
+            assert await conn.scalar(text("PRAGMA journal_mode")) == "wal"
+            with pytest.raises(OperationalError, match="readonly"):
+                await conn.execute(text("INSERT INTO t VALUES (2)"))
+    finally:
+        await read_engine.dispose()
+        await engine.dispose()
+
+
+def test_read_engine_falls_back_to_write_engine() -> None:
+    engine = create_engine("sqlite+aiosqlite:///:memory:")
+    assert create_read_engine(None, engine) is engine
+    # Otro motor en memoria sería una base vacía
+    assert create_read_engine("sqlite+aiosqlite:///:memory:", engine) is engine
+
+
+def test_normalize_database_url_uses_asyncpg_for_postgres() -> None:
+    for scheme in ("postgres", "postgresql", "postgresql+asyncpg"):
+        url = normalize_database_url(f"{scheme}://app:secreto@db:5432/comidas")
+        assert url.drivername == "postgresql+asyncpg"
+        assert (url.host, url.database) == ("db", "comidas")
+    sqlite_url = "sqlite+aiosqlite:///./app.db"
+    assert normalize_database_url(sqlite_url).drivername == "sqlite+aiosqlite"
+
+
+@requires_postgres
+@pytest.mark.asyncio
+async def test_postgres_engine_applies_timeouts_and_read_only() -> None:
+    engine = create_engine(TEST_DATABASE_URL)
+    read_engine = create_read_engine(TEST_DATABASE_URL, engine)
+    try:
+        assert engine.pool._pre_ping  # type: ignore[attr-defined]
+        async with engine.connect() as conn:
+            assert await conn.scalar(text("SHOW statement_timeout")) == "30s"
+            assert await conn.scalar(text("SHOW application_name")) == (
+                "chequecomemos-api"
+            )
+            assert await conn.scalar(text("SHOW transaction_read_only")) == "off"
+        async with read_engine.connect() as conn:
+            assert await conn.scalar(text("SHOW transaction_read_only")) == "on"
+    finally:
+        await read_engine.dispose()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_database_is_lazy_warms_up_and_recreates_after_dispose(
+    tmp_path: Path,
+) -> None:
+    url = f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+    database = Database(url=url, read_url=url)
+    assert database.engines() == []
+
+    await database.warm_up(connections=2)
+    engine, read_engine = database.engines()
+    assert engine.pool.checkedin() == 2  # type: ignore[attr-defined]
+    assert read_engine.pool.checkedin() == 2  # type: ignore[attr-defined]
+    async with database.read_session() as db:
+        assert await db.scalar(text("SELECT 1")) == 1
+
+    await database.dispose()
+    assert database.engines() == []
+    async with database.session() as db:
+        assert await db.scalar(text("SELECT 1")) == 1
+    assert database.engine is not engine
+    # El motor recreado también cuenta consultas para las métricas
+    assert event.contains(
+        database.engine.sync_engine, "before_cursor_execute", _before_cursor_execute
+    )
+    await database.dispose()
+
+
+def test_database_requires_url_on_first_use(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    database = Database()
+    with pytest.raises(RuntimeError, match="DATABASE_URL"):
+        database.session()
@@ -0,0 +1,113 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import CategoryDB, Ingredients, Users
+from app.models.recipes import (
+    RecipeIngredientsCreateInput,
+    RecipesCreate,
+    RecipeVisibility,
+)
+from app.services.export_service import (
+    ExportFormat,
+    export_ingredients,
+    export_recipes,
+)
+from app.services.recipes_service import create_recipe
+
+
+async def collect(chunks: AsyncIterator[str]) -> str:
+    return "".join([chunk async for chunk in chunks])
+
+
+@pytest.mark.asyncio
+async def test_export_ingredients_ndjson_and_csv(
+    db_session: AsyncSession, category: CategoryDB
+) -> None:
+    db_session.add_all(
+        Ingredients(name=name, category_id=category.category_id, default_unit="g")
+        for name in ["Zanahoria", "Apio", "Puerro"]
+    )
+    await db_session.commit()
+
+    ndjson = await collect(export_ingredients(db_session, ExportFormat.NDJSON))
+    rows = [json.loads(line) for line in ndjson.splitlines()]
+    assert [row["name"] for row in rows] == ["Apio", "Puerro", "Zanahoria"]
+    assert rows[0]["category_name"] == "Verduras"
+
+    text = await collect(export_ingredients(db_session, ExportFormat.CSV))
+    records = list(csv.DictReader(io.StringIO(text)))
+    assert len(records) == 3
+    assert records[2]["name"] == "Zanahoria"
+
+
+@pytest.mark.asyncio
+async def test_export_recipes_ndjson_includes_ingredients(
+    db_session: AsyncSession, category: CategoryDB, user: Users
+) -> None:
+    await create_recipe(
+        db_session,
+        RecipesCreate(
+            name="Sopa",
+            description="Sopa de verduras",
+            visibility=RecipeVisibility.PUBLIC,
+            ingredients=[
+                RecipeIngredientsCreateInput(
+                    name=name,
+                    category_id=category.category_id,
+                    default_unit="g",
+                    quantity=100,
+                    optional=False,
+                )
+                for name in ["Apio", "Puerro"]
+            ],
+        ),
+        user.id,
+    )
+
+    ndjson = await collect(export_recipes(db_session, ExportFormat.NDJSON))
+    (recipe,) = [json.loads(line) for line in ndjson.splitlines()]
+    assert recipe["name"] == "Sopa"
+    assert len(recipe["recipe_ingredients"]) == 2
+
+    text = await collect(export_recipes(db_session, ExportFormat.CSV))
+    assert len(list(csv.DictReader(io.StringIO(text)))) == 2
+
+
+@pytest.mark.asyncio
+async def test_export_recipes_skips_private_recipes(
+    db_session: AsyncSession, category: CategoryDB, user: Users
+) -> None:
+    for name, visibility in [
+        ("Pública", RecipeVisibility.PUBLIC),
+        ("Privada", RecipeVisibility.PRIVATE),
+    ]:
+        await create_recipe(
+            db_session,
+            RecipesCreate(
+                name=name,
+                description=f"Receta {name.lower()}",
+                visibility=visibility,
+                ingredients=[
+                    RecipeIngredientsCreateInput(
+                        name="Apio",
+                        category_id=category.category_id,
+                        default_unit="g",
+                        quantity=100,
+                        optional=False,
+                    )
+                ],
+            ),
+            user.id,
+        )
+
+    ndjson = await collect(export_recipes(db_session, ExportFormat.NDJSON))
+    assert [json.loads(line)["name"] for line in ndjson.splitlines()] == ["Pública"]
+
+    text = await collect(export_recipes(db_session, ExportFormat.CSV))
+    records = list(csv.DictReader(io.StringIO(text)))
+    assert [record["recipe_name"] for record in records] == ["Pública"]
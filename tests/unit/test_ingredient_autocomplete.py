@@ -0,0 +1,140 @@
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import CategoryDB, IngredientCreate, IngredientUpdate, Users
+from app.models.recipes import (
+    RecipeIngredientsCreateInput,
+    RecipesCreate,
+    RecipeVisibility,
+)
+from app.services.ingredient_autocomplete import (
+    TOP_K,
+    IngredientAutocomplete,
+    ingredient_autocomplete,
+    normalize,
+)
+from app.services.ingredients_service import (
+    autocomplete_ingredients,
+    create_ingredient,
+    delete_ingredient,
+    update_ingredient,
+)
+from app.services.recipes_service import create_recipe
+
+
+def test_normalize_strips_accents_case_and_spaces() -> None:
+    assert normalize("  Limón   SUTIL ") == "limon sutil"
+    assert normalize("Ñandú") == "nandu"
+
+
+def test_search_by_word_prefix_ranked_by_usage() -> None:
+    index = IngredientAutocomplete()
+    oliva, papa, pimienta = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    index.put(oliva, "Aceite de oliva", usage_count=3)
+    index.put(papa, "Papa", usage_count=10)
+    index.put(pimienta, "Pimienta", usage_count=1)
+
+    assert [s.name for s in index.search("p")] == ["Papa", "Pimienta"]
+    assert [s.name for s in index.search("OLI")] == ["Aceite de oliva"]
+    assert [s.name for s in index.search("aceite de o")] == ["Aceite de oliva"]
+    assert index.search("x") == [] and index.search("  ") == []
+
+    # Las listas ya calculadas se actualizan al crecer el uso
+    for _ in range(10):
+        index.record_usage([(pimienta, "Pimienta")])
+    assert [s.name for s in index.search("p")] == ["Pimienta", "Papa"]
+    assert index.search("p", limit=1)[0].usage_count == 11
+
+    # Renombrar y quitar descartan las claves anteriores
+    index.put(papa, "Patata")
+    assert [s.name for s in index.search("pat")] == ["Patata"]
+    assert index.search("papa") == []
+    index.remove(papa)
+    assert [s.name for s in index.search("p")] == ["Pimienta"]
+    # Los nodos que quedaron vacíos se podan
+    assert "a" not in index._root.children["p"].children
+
+
+def test_top_k_keeps_most_used() -> None:
+    index = IngredientAutocomplete()
+    ids = [uuid.uuid4() for _ in range(TOP_K + 5)]
+    for usage, ingredient_id in enumerate(ids):
+        index.put(ingredient_id, f"Sal {usage:02d}", usage_count=usage)
+    top = index.search("sal", limit=TOP_K)
+    assert [s.usage_count for s in top] == list(range(TOP_K + 4, 4, -1))
+    # Un ingrediente nuevo muy usado entra en la lista ya calculada
+    new = uuid.uuid4()
+    index.put(new, "Sal gruesa", usage_count=100)
+    assert index.search("sal", limit=1)[0].ingredient_id == new
+
+
+@pytest.mark.asyncio
+async def test_service_keeps_trie_in_sync(
+    db_session: AsyncSession, user: Users
+) -> None:
+    category = CategoryDB(name="Verduras")
+    db_session.add(category)
+    await db_session.commit()
+    cebolla = await create_ingredient(
+        db_session,
+        IngredientCreate(
+            name="Cebolla", category_id=category.category_id, default_unit="u"
+        ),
+    )
+    await create_recipe(
+        db_session,
+        RecipesCreate(
+            name="Salsa",
+            description="",
+            visibility=RecipeVisibility.PUBLIC,
+            ingredients=[
+                RecipeIngredientsCreateInput(
+                    ingredient_id=cebolla.ingredient_id,
+                    category_id=category.category_id,
+                    default_unit="u",
+                    quantity=1,
+                    optional=False,
+                ),
+                RecipeIngredientsCreateInput(
+                    name="Cebollín",
+                    category_id=category.category_id,
+                    default_unit="u",
+                    quantity=1,
+                    optional=True,
+                ),
+            ],
+        ),
+        user.id,
+    )
+    ingredient_autocomplete.loaded = True
+
+    response = await autocomplete_ingredients(db_session, "ceb", 10)
+    assert [(s.name, s.usage_count) for s in response.suggestions] == [
+        ("Cebolla", 1),
+        ("Cebollín", 1),
+    ]
+    # Recargar desde la base da el mismo resultado
+    await ingredient_autocomplete.load(db_session)
+    reloaded = await autocomplete_ingredients(db_session, "ceb", 10)
+    assert reloaded == response
+
+    await update_ingredient(
+        db_session,
+        cebolla.ingredient_id,
+        IngredientUpdate(name="Cebolla morada", default_unit="u"),
+    )
+    assert [
+        s.name
+        for s in (await autocomplete_ingredients(db_session, "mor", 10)).suggestions
+    ] == ["Cebolla morada"]
+
+    fresh = await create_ingredient(
+        db_session,
+        IngredientCreate(
+            name="Puerro", category_id=category.category_id, default_unit="u"
+        ),
+    )
+    await delete_ingredient(db_session, fresh.ingredient_id)
+    assert (await autocomplete_ingredients(db_session, "pue", 10)).suggestions == []
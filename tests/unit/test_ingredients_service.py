@@ -0,0 +1,288 @@
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.models import (
+    BulkConflictMode,
+    CategoryDB,
+    IngredientCreate,
+    IngredientPatch,
+    Ingredients,
+    IngredientSort,
+)
+from app.models.ingredients import IngredientUpdate
+from app.services import ingredients_service
+from app.services.category_cache import category_cache
+from tests.database import QueryCounter
+
+
+@pytest.mark.asyncio
+async def test_writes_do_not_reload_the_row(
+    db_session: AsyncSession, category: CategoryDB, count_queries: QueryCounter
+) -> None:
+    # La categoría se valida contra la cache, cargada al iniciar la app
+    await category_cache.load(db_session)
+    with count_queries() as statements:
+        created = await ingredients_service.create_ingredient(
+            db_session,
+            IngredientCreate(
+                name="Ajo", category_id=category.category_id, default_unit="g"
+            ),
+        )
+        after_create = len(statements)
+        updated = await ingredients_service.update_ingredient(
+            db_session,
+            created.ingredient_id,
+            IngredientUpdate(name="Ajo negro", default_unit="u"),
+        )
+
+    verbs = [statement.split()[0] for statement in statements]
+    assert verbs[:after_create] == ["INSERT"]
+    # UPDATE ... RETURNING: sin SELECT previo ni posterior
+    assert verbs[after_create:] == ["UPDATE"]
+    assert (updated.name, updated.default_unit) == ("Ajo negro", "u")
+    assert updated.updated_at >= created.updated_at
+
+
+@pytest.mark.asyncio
+async def test_create_ingredient_rejects_unknown_category(
+    db_session: AsyncSession,
+) -> None:
+    with pytest.raises(HTTPException) as exc:
+        await ingredients_service.create_ingredient(
+            db_session,
+            IngredientCreate(name="Ajo", category_id=uuid.uuid4(), default_unit="g"),
+        )
+    assert exc.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_patch_ingredient_updates_only_sent_fields(
+    db_session: AsyncSession, category: CategoryDB, count_queries: QueryCounter
+) -> None:
+    created = await ingredients_service.create_ingredient(
+        db_session,
+        IngredientCreate(
+            name="Sal", category_id=category.category_id, default_unit="g"
+        ),
+    )
+    await ingredients_service.create_ingredient(
+        db_session,
+        IngredientCreate(
+            name="Pimienta", category_id=category.category_id, default_unit="g"
+        ),
+    )
+    ingredient_id, created_at = created.ingredient_id, created.updated_at
+    with count_queries() as statements:
+        patched = await ingredients_service.patch_ingredient(
+            db_session,
+            created.ingredient_id,
+            IngredientPatch.model_validate({"default_unit": "kg"}),
+        )
+
+    assert len(statements) == 1
+    assert statements[0].startswith("UPDATE") and "RETURNING" in statements[0]
+    # Solo la columna enviada y la fecha de modificación
+    assert "name" not in statements[0].split("WHERE")[0]
+    assert (patched.name, patched.default_unit) == ("Sal", "kg")
+    assert patched.updated_at > created_at
+
+    # Sin campos no se escribe nada
+    unchanged = await ingredients_service.patch_ingredient(
+        db_session, created.ingredient_id, IngredientPatch()
+    )
+    assert unchanged.updated_at == patched.updated_at
+
+    with pytest.raises(HTTPException) as missing:
+        await ingredients_service.patch_ingredient(
+            db_session, uuid.uuid4(), IngredientPatch(name="Comino")
+        )
+    assert missing.value.status_code == 404
+    with pytest.raises(HTTPException) as duplicate:
+        await ingredients_service.patch_ingredient(
+            db_session, ingredient_id, IngredientPatch(name="Pimienta")
+        )
+    assert duplicate.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_ingredients_walks_all_pages(
+    db_session: AsyncSession, category: CategoryDB
+) -> None:
+    names = [f"Ingrediente {i:02d}" for i in range(7)]
+    db_session.add_all(
+        Ingredients(name=name, category_id=category.category_id, default_unit="g")
+        for name in reversed(names)
+    )
+    await db_session.commit()
+
+    seen: list[str] = []
+    cursor = None
+    pages = 0
+    while True:
+        page = await ingredients_service.get_ingredients(
+            db_session, limit=3, cursor=cursor
+        )
+        pages += 1
+        seen.extend(ing.name for ing in page.ingredients)
+        assert all(ing.category.name == "Verduras" for ing in page.ingredients)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == names
+    assert pages == 3
+
+
+@pytest.mark.asyncio
+async def test_get_ingredients_sorted_by_popularity(
+    db_session: AsyncSession, category: CategoryDB
+) -> None:
+    usage = {"Ajo": 3, "Sal": 7, "Perejil": 0, "Aceite": 3, "Papa": 5}
+    db_session.add_all(
+        Ingredients(
+            name=name,
+            category_id=category.category_id,
+            default_unit="g",
+            usage_count=count,
+        )
+        for name, count in usage.items()
+    )
+    await db_session.commit()
+
+    first = await ingredients_service.get_ingredients(
+        db_session, limit=3, sort=IngredientSort.POPULAR
+    )
+    second = await ingredients_service.get_ingredients(
+        db_session,
+        limit=3,
+        cursor=first.next_cursor,
+        sort=IngredientSort.POPULAR,
+    )
+
+    seen = [ing.name for ing in first.ingredients + second.ingredients]
+    assert seen[:2] == ["Sal", "Papa"]
+    # Los empates se recorren por id, sin repetir ni saltear
+    assert sorted(seen[2:4]) == ["Aceite", "Ajo"]
+    assert seen[4] == "Perejil"
+    assert second.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_ingredients_rejects_invalid_cursor(
+    db_session: AsyncSession,
+) -> None:
+    with pytest.raises(HTTPException) as exc:
+        await ingredients_service.get_ingredients(db_session, cursor="no-válido")
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_reports_status_per_row(
+    db_session: AsyncSession, category: CategoryDB
+) -> None:
+    db_session.add(
+        Ingredients(name="Papa", category_id=category.category_id, default_unit="kg")
+    )
+    await db_session.commit()
+
+    payload = b"\n".join(
+        [
+            b'{"name": "Papa", "default_unit": "g", "category_name": "Verduras"}',
+            b'{"name": "Cebolla", "default_unit": "u", "category_name": "Verduras"}',
+            b'{"name": "Sal", "default_unit": "g", "category_name": "Condimentos"}',
+            b"esto no es json",
+            b'{"default_unit": "g"}',
+        ]
+    )
+    rows = ingredients_service.parse_bulk_payload(payload, "application/x-ndjson")
+    result = await ingredients_service.bulk_upsert_ingredients(db_session, rows)
+
+    statuses = [(r.index, r.status.value) for r in result.results]
+    assert statuses == [
+        (0, "updated"),
+        (1, "created"),
+        (2, "error"),
+        (3, "error"),
+        (4, "error"),
+    ]
+    assert (result.created, result.updated, result.errors) == (1, 1, 3)
+    papa = (
+        await db_session.scalars(
+            select(Ingredients)
+            .where(Ingredients.name == "Papa")
+            .execution_options(populate_existing=True)
+        )
+    ).one()
+    assert papa.default_unit == "g"
+    assert result.results[0].ingredient_id == papa.ingredient_id
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_ignore_keeps_existing_rows(
+    db_session: AsyncSession, category: CategoryDB
+) -> None:
+    db_session.add(
+        Ingredients(name="Papa", category_id=category.category_id, default_unit="kg")
+    )
+    await db_session.commit()
+
+    rows = [
+        {"name": "Papa", "default_unit": "g", "category_id": str(category.category_id)},
+        {"name": "Ajo", "default_unit": "u", "category_id": str(category.category_id)},
+        {"name": "Ajo", "default_unit": "g", "category_id": str(category.category_id)},
+    ]
+    result = await ingredients_service.bulk_upsert_ingredients(
+        db_session, rows, BulkConflictMode.IGNORE
+    )
+
+    assert [r.status.value for r in result.results] == ["skipped", "skipped", "created"]
+    names = (await db_session.scalars(select(Ingredients.name))).all()
+    assert sorted(names) == ["Ajo", "Papa"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_rejects_unknown_category_id(
+    db_session: AsyncSession, category: CategoryDB
+) -> None:
+    rows = [
+        {"name": "Ajo", "default_unit": "u", "category_id": str(category.category_id)},
+        {"name": "Sal", "default_unit": "g", "category_id": str(uuid.uuid4())},
+    ]
+    result = await ingredients_service.bulk_upsert_ingredients(db_session, rows)
+
+    assert [r.status.value for r in result.results] == ["created", "error"]
+    assert "Categoría no encontrada" in (result.results[1].detail or "")
+    names = (await db_session.scalars(select(Ingredients.name))).all()
+    assert names == ["Ajo"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_resolves_categories_from_cache(
+    db_session: AsyncSession, category: CategoryDB, count_queries: QueryCounter
+) -> None:
+    await category_cache.load(db_session)
+    # Creada "por otro proceso": no está en la cache hasta la primera consulta
+    fruits = CategoryDB(name="Frutas")
+    db_session.add(fruits)
+    await db_session.commit()
+    rows = [
+        {"name": "Ajo", "default_unit": "u", "category_name": "Verduras"},
+        {"name": "Pera", "default_unit": "u", "category_name": "Frutas"},
+    ]
+    with count_queries() as statements:
+        first = await ingredients_service.bulk_upsert_ingredients(db_session, rows)
+        after_first = len(statements)
+        second = await ingredients_service.bulk_upsert_ingredients(db_session, rows)
+
+    assert [r.status.value for r in first.results] == ["created", "created"]
+    assert [r.status.value for r in second.results] == ["updated", "updated"]
+    # Solo "Frutas" se buscó en la base; la segunda vez ya estaba cacheada
+    category_selects = [s for s in statements if "FROM categories" in s]
+    assert len(category_selects) == 1
+    assert all("FROM categories" not in s for s in statements[after_first:])
+    cached = category_cache.get_by_name("Frutas")
+    assert cached is not None and cached.category_id == fruits.category_id
@@ -0,0 +1,43 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.metrics import MetricsMiddleware, instrument_engine, render_metrics
+
+
+@pytest.mark.asyncio
+async def test_middleware_counts_queries_and_exposes_metrics() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrument_engine(engine)
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: str):
+        async with engine.connect() as conn:
+            for _ in range(3):
+                await conn.execute(text("SELECT 1"))
+        return {"item_id": item_id}
+
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://t"
+        ) as client:
+            response = await client.get("/items/abc123")
+    finally:
+        await engine.dispose()
+
+    assert response.status_code == 200
+    assert 'desc="3 queries"' in response.headers["server-timing"]
+    exposition = render_metrics()
+    assert (
+        'http_requests_total{method="GET",route="/items/{item_id}",status="200"} 1'
+        in exposition
+    )
+    assert (
+        'db_queries_per_request_bucket{method="GET",route="/items/{item_id}",le="3"} 1'
+        in exposition
+    )
@@ -0,0 +1,75 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import select
+
+from app.core.db import Database, create_engine
+from app.models import CategoryDB, Ingredients
+from tests.database import TEST_DATABASE_URL, requires_postgres
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def migrate(url: str, *args: str) -> None:
+    env = {**os.environ, "DATABASE_MIGRATION_URL": url}
+    subprocess.run(
+        [sys.executable, "-m", "alembic", *args],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        check=True,
+    )
+
+
+def test_migrations_upgrade_downgrade_and_upgrade_again(tmp_path: Path) -> None:
+    url = f"sqlite+aiosqlite:///{tmp_path / 'migraciones.db'}"
+    migrate(url, "upgrade", "head")
+    # Cada downgrade deshace su upgrade: la base vuelve a quedar vacía
+    migrate(url, "downgrade", "base")
+    migrate(url, "upgrade", "head")
+
+
+async def reset_postgres_schema() -> None:
+    engine = create_engine(TEST_DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP SCHEMA public CASCADE"))
+        await conn.execute(text("CREATE SCHEMA public"))
+    await engine.dispose()
+
+
+@requires_postgres
+@pytest.mark.asyncio
+async def test_migrated_postgres_schema_stores_aware_timestamps() -> None:
+    await reset_postgres_schema()
+    database = Database(url=TEST_DATABASE_URL)
+    try:
+        migrate(TEST_DATABASE_URL, "upgrade", "head")
+        async with database.session() as db:
+            category = CategoryDB(name="Verduras")
+            db.add(category)
+            await db.commit()
+            ingredient = Ingredients(
+                name="Apio", category_id=category.category_id, default_unit="g"
+            )
+            db.add(ingredient)
+            await db.commit()
+            stored = await db.scalar(select(Ingredients.updated_at))
+            types = set(
+                await db.scalars(
+                    text(
+                        "SELECT DISTINCT data_type FROM information_schema.columns"
+                        " WHERE table_schema = 'public'"
+                        " AND data_type LIKE 'timestamp%'"
+                    )
+                )
+            )
+        assert types == {"timestamp with time zone"}
+        assert stored == ingredient.updated_at
+        assert stored is not None and stored.tzinfo is not None
+    finally:
+        await database.dispose()
+        await reset_postgres_schema()
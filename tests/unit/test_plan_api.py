@@ -0,0 +1,28 @@
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Recipes, Users
+
+
+@pytest.mark.asyncio
+async def test_post_plan_returns_created_and_replaces_the_meal(
+    client: httpx.AsyncClient, db_session: AsyncSession, user: Users
+) -> None:
+    recipe = Recipes(name="Sopa", description="", owner_id=user.id)
+    db_session.add(recipe)
+    await db_session.commit()
+    entry = {
+        "user_id": str(user.id),
+        "date": "2026-10-19",
+        "meal": "lunch",
+        "recipe_id": str(recipe.recipe_id),
+    }
+
+    created = await client.post("/plan/", json=entry)
+    replaced = await client.post("/plan/", json={**entry, "servings": 3})
+
+    # Crear y reemplazar responden igual: es un upsert por (usuario, día, comida)
+    assert (created.status_code, replaced.status_code) == (201, 201)
+    assert replaced.json()["id"] == created.json()["id"]
+    assert replaced.json()["servings"] == 3
@@ -0,0 +1,182 @@
+import uuid
+from datetime import date, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import (
+    CategoryDB,
+    Ingredients,
+    MealType,
+    PlanEntryCreate,
+    RecipeIngredients,
+    Recipes,
+    Users,
+)
+from app.services.plan_service import (
+    delete_plan_entry,
+    get_plan,
+    get_shopping_list,
+    upsert_plan_entry,
+)
+from tests.database import QueryCounter
+
+MONDAY = date(2026, 10, 19)
+
+
+async def _recipe(
+    db: AsyncSession,
+    owner: Users,
+    servings: int | None,
+    ingredients: list[tuple[Ingredients, float, bool]],
+) -> Recipes:
+    recipe = Recipes(
+        name=f"Receta {uuid.uuid4().hex[:6]}",
+        description="",
+        servings=servings,
+        owner_id=owner.id,
+    )
+    db.add(recipe)
+    db.add_all(
+        RecipeIngredients(
+            recipe_id=recipe.recipe_id,
+            ingredient_id=ingredient.ingredient_id,
+            quantity=quantity,
+            optional=optional,
+        )
+        for ingredient, quantity, optional in ingredients
+    )
+    await db.commit()
+    return recipe
+
+
+@pytest.mark.asyncio
+async def test_shopping_list_scales_and_groups_by_ingredient(
+    db_session: AsyncSession, user: Users, count_queries: QueryCounter
+) -> None:
+    category = CategoryDB(name="Verduras")
+    papa = Ingredients(name="Papa", category_id=category.category_id, default_unit="g")
+    sal = Ingredients(name="Sal", category_id=category.category_id, default_unit="g")
+    db_session.add_all([category, papa, sal])
+    # Receta para 4 porciones y receta sin porciones (cuenta como 1)
+    tortilla = await _recipe(db_session, user, 4, [(papa, 400, False), (sal, 10, True)])
+    pure = await _recipe(db_session, user, None, [(papa, 100, False)])
+    user_id = user.id
+
+    for day, meal, recipe, servings in [
+        (MONDAY, MealType.LUNCH, tortilla, 2),
+        (MONDAY, MealType.DINNER, pure, 3),
+        (MONDAY + timedelta(days=1), MealType.LUNCH, tortilla, 4),
+        # Fuera del rango pedido
+        (MONDAY + timedelta(days=7), MealType.LUNCH, tortilla, 4),
+    ]:
+        await upsert_plan_entry(
+            db_session,
+            PlanEntryCreate(
+                user_id=user_id,
+                date=day,
+                meal=meal,
+                recipe_id=recipe.recipe_id,
+                servings=servings,
+            ),
+        )
+
+    with count_queries() as statements:
+        result = await get_shopping_list(
+            db_session, user_id, MONDAY, MONDAY + timedelta(days=6)
+        )
+
+    assert len(statements) == 1
+    # 400*2/4 + 100*3/1 + 400*4/4
+    assert [(i.name, i.quantity, i.recipes) for i in result.items] == [
+        ("Papa", 900.0, 3)
+    ]
+
+    with_optional = await get_shopping_list(
+        db_session, user_id, MONDAY, MONDAY + timedelta(days=6), True
+    )
+    sal_item = next(i for i in with_optional.items if i.name == "Sal")
+    assert sal_item.quantity == pytest.approx(10 * 2 / 4 + 10 * 4 / 4)
+    assert sal_item.category_name == "Verduras"
+
+
+@pytest.mark.asyncio
+async def test_upsert_replaces_the_meal_and_delete_removes_it(
+    db_session: AsyncSession, user: Users
+) -> None:
+    first = await _recipe(db_session, user, 2, [])
+    second = await _recipe(db_session, user, 2, [])
+    user_id = user.id
+    entry = PlanEntryCreate(
+        user_id=user_id, date=MONDAY, meal=MealType.DINNER, recipe_id=first.recipe_id
+    )
+
+    created = await upsert_plan_entry(db_session, entry)
+    replaced = await upsert_plan_entry(
+        db_session,
+        entry.model_copy(update={"recipe_id": second.recipe_id, "servings": 5}),
+    )
+
+    assert replaced.id == created.id
+    plan = await get_plan(db_session, user_id, MONDAY, MONDAY)
+    assert [(e.recipe_id, e.servings) for e in plan.entries] == [(second.recipe_id, 5)]
+
+    await delete_plan_entry(db_session, user_id, MONDAY, MealType.DINNER)
+    assert (await get_plan(db_session, user_id, MONDAY, MONDAY)).entries == []
+    with pytest.raises(HTTPException) as exc:
+        await delete_plan_entry(db_session, user_id, MONDAY, MealType.DINNER)
+    assert exc.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_plan_orders_meals_chronologically(
+    db_session: AsyncSession, user: Users
+) -> None:
+    recipe = await _recipe(db_session, user, 2, [])
+    user_id = user.id
+    tuesday = MONDAY + timedelta(days=1)
+    for day, meal in [
+        (tuesday, MealType.BREAKFAST),
+        (MONDAY, MealType.LUNCH),
+        (MONDAY, MealType.DINNER),
+        (MONDAY, MealType.BREAKFAST),
+    ]:
+        await upsert_plan_entry(
+            db_session,
+            PlanEntryCreate(
+                user_id=user_id, date=day, meal=meal, recipe_id=recipe.recipe_id
+            ),
+        )
+
+    plan = await get_plan(db_session, user_id, MONDAY, tuesday)
+
+    assert [(e.date, e.meal) for e in plan.entries] == [
+        (MONDAY, MealType.BREAKFAST),
+        (MONDAY, MealType.LUNCH),
+        (MONDAY, MealType.DINNER),
+        (tuesday, MealType.BREAKFAST),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_plan_rejects_unknown_recipe_and_inverted_range(
+    db_session: AsyncSession,
+) -> None:
+    with pytest.raises(HTTPException) as exc:
+        await upsert_plan_entry(
+            db_session,
+            PlanEntryCreate(
+                user_id=uuid.uuid4(),
+                date=MONDAY,
+                meal=MealType.LUNCH,
+                recipe_id=uuid.uuid4(),
+            ),
+        )
+    assert exc.value.status_code == 404
+
+    with pytest.raises(HTTPException) as exc:
+        await get_shopping_list(
+            db_session, uuid.uuid4(), MONDAY, MONDAY - timedelta(days=1)
+        )
+    assert exc.value.status_code == 400
@@ -0,0 +1,151 @@
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import CategoryDB, RecipeMatchRequest, Users
+from app.models.recipes import (
+    RecipeIngredientsCreateInput,
+    RecipesCreate,
+    RecipeVisibility,
+)
+from app.services.recipe_index import RecipeIngredientIndex, recipe_index
+from app.services.recipes_service import create_recipe, match_recipes
+
+
+def test_search_ranks_by_coverage_then_missing() -> None:
+    index = RecipeIngredientIndex()
+    a, b, c, d = (uuid.uuid4() for _ in range(4))
+    full, half, partial = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    index.put(full, [a, b])
+    index.put(half, [a, c])
+    index.put(partial, [a, b, c, d])
+
+    matches = index.search([a, b], limit=10)
+
+    # half y partial empatan en cobertura (0.5): gana la que tiene menos faltantes
+    assert [m.recipe_id for m in matches] == [full, half, partial]
+    assert [(m.matched, m.required) for m in matches] == [(2, 2), (1, 2), (2, 4)]
+    assert [m.recipe_id for m in index.search([a, b], limit=1)] == [full]
+    assert {m.recipe_id for m in index.search([a], 10, min_coverage=0.5)} == {
+        full,
+        half,
+    }
+
+
+def test_put_replaces_and_remove_forgets_recipe() -> None:
+    index = RecipeIngredientIndex()
+    a, b = uuid.uuid4(), uuid.uuid4()
+    recipe_id = uuid.uuid4()
+    index.put(recipe_id, [a])
+    index.put(recipe_id, [b])
+
+    assert index.search([a], 10) == []
+    assert [m.recipe_id for m in index.search([b], 10)] == [recipe_id]
+    other = uuid.uuid4()
+    index.put(other, [b])
+    assert {m.recipe_id for m in index.search([b], 10)} == {recipe_id, other}
+    index.remove(other)
+
+    index.remove(recipe_id)
+    assert index.search([b], 10) == []
+    assert index.stats() == {"recipes": 0, "ingredients": 0, "postings": 0}
+
+
+def test_replacing_recipes_does_not_grow_the_index() -> None:
+    index = RecipeIngredientIndex()
+    a, b = uuid.uuid4(), uuid.uuid4()
+    recipe_ids = [uuid.uuid4() for _ in range(10)]
+    for round_ in range(300):
+        for recipe_id in recipe_ids:
+            index.put(recipe_id, [a, b] if round_ % 2 else [a])
+
+    assert index.stats() == {"recipes": 10, "ingredients": 2, "postings": 20}
+    # Las listas siguen ordenadas y el desempate respeta el orden de alta
+    assert all(p == sorted(p) for p in index._postings.values())
+    assert [m.recipe_id for m in index.search([a, b], 20)] == recipe_ids
+
+
+def test_search_keeps_the_best_when_limited() -> None:
+    index = RecipeIngredientIndex()
+    pantry = [uuid.uuid4() for _ in range(4)]
+    # La receta i requiere los ingredientes 0..i: cubre 1/(i+1) con solo el 0
+    recipe_ids = [uuid.uuid4() for _ in range(4)]
+    for size, recipe_id in enumerate(recipe_ids, start=1):
+        index.put(recipe_id, pantry[:size])
+
+    matches = index.search(pantry[:1], limit=2)
+
+    assert [(m.recipe_id, m.matched, m.required) for m in matches] == [
+        (recipe_ids[0], 1, 1),
+        (recipe_ids[1], 1, 2),
+    ]
+    assert index.search(pantry[:1], limit=10, min_coverage=0.34)[-1].required == 2
+
+
+@pytest.mark.asyncio
+async def test_load_and_match_ignore_optional_and_private(
+    db_session: AsyncSession, user: Users
+) -> None:
+    category = CategoryDB(name="Verduras")
+    db_session.add(category)
+    await db_session.commit()
+
+    def recipe(name: str, visibility: RecipeVisibility) -> RecipesCreate:
+        return RecipesCreate(
+            name=name,
+            description="",
+            visibility=visibility,
+            ingredients=[
+                RecipeIngredientsCreateInput(
+                    name=ingredient,
+                    category_id=category.category_id,
+                    default_unit="g",
+                    quantity=1,
+                    optional=optional,
+                )
+                for ingredient, optional in [
+                    ("Papa", False),
+                    ("Huevo", False),
+                    ("Perejil", True),
+                ]
+            ],
+        )
+
+    tortilla = await create_recipe(
+        db_session, recipe("Tortilla", RecipeVisibility.PUBLIC), user.id
+    )
+    await create_recipe(
+        db_session, recipe("Secreta", RecipeVisibility.PRIVATE), user.id
+    )
+    by_name = {
+        ri.ingredient.name: ri.ingredient.ingredient_id
+        for ri in tortilla.recipe_ingredients
+    }
+    request = RecipeMatchRequest(ingredient_ids=[by_name["Papa"], by_name["Huevo"]])
+
+    # Actualizado en forma incremental por create_recipe
+    incremental = await match_recipes(db_session, request)
+    await recipe_index.load(db_session)
+    reloaded = await match_recipes(db_session, request)
+
+    for response in (incremental, reloaded):
+        assert [
+            (m.name, m.matched, m.required, m.coverage) for m in response.matches
+        ] == [("Tortilla", 2, 2, 1.0)]
+    only_optional = RecipeMatchRequest(ingredient_ids=[by_name["Perejil"]])
+    assert (await match_recipes(db_session, only_optional)).matches == []
+
+
+@pytest.mark.asyncio
+async def test_match_skips_recipes_missing_from_database(
+    db_session: AsyncSession,
+) -> None:
+    ingredient_id = uuid.uuid4()
+    recipe_index.put(uuid.uuid4(), [ingredient_id])
+    recipe_index.loaded = True
+    # Sin filas en la base: la receta del índice se descarta
+    response = await match_recipes(
+        db_session, RecipeMatchRequest(ingredient_ids=[ingredient_id])
+    )
+    assert response.matches == []
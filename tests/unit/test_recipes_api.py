@@ -0,0 +1,131 @@
+import uuid
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import CategoryDB, Users
+from app.models.recipes import (
+    RecipeIngredientsCreateInput,
+    RecipesCreate,
+    RecipeVisibility,
+)
+from app.services.recipes_service import create_recipe
+
+
+def _ingredient(name: str, category_id: uuid.UUID, quantity: float) -> dict:
+    return RecipeIngredientsCreateInput(
+        name=name,
+        category_id=category_id,
+        default_unit="g",
+        quantity=quantity,
+        optional=False,
+    ).model_dump(mode="json")
+
+
+@pytest.mark.asyncio
+async def test_put_recipe_refreshes_cache_and_index(
+    client: httpx.AsyncClient,
+    db_session: AsyncSession,
+    category: CategoryDB,
+    user: Users,
+) -> None:
+    category_id = category.category_id
+    created = await create_recipe(
+        db_session,
+        RecipesCreate(
+            name="Sopa",
+            description="",
+            visibility=RecipeVisibility.PUBLIC,
+            ingredients=[
+                RecipeIngredientsCreateInput.model_validate(
+                    _ingredient(name, category_id, 100)
+                )
+                for name in ["Apio", "Puerro"]
+            ],
+        ),
+        user.id,
+    )
+    recipe_id = str(created.recipe_id)
+    apio_id = created.recipe_ingredients[0].ingredient.ingredient_id
+    # Deja la receta en la cache y en el índice antes de modificarla
+    assert (await client.get(f"/recipes/{recipe_id}")).status_code == 200
+    match = await client.post("/recipes/match", json={"ingredient_ids": [str(apio_id)]})
+    assert match.json()["matches"][0]["required"] == 2
+
+    response = await client.put(
+        f"/recipes/{recipe_id}",
+        json={
+            "recipe_id": recipe_id,
+            "name": "Sopa de apio",
+            "ingredients": [_ingredient("Apio", category_id, 250)],
+        },
+    )
+
+    assert response.status_code == 200
+    body = (await client.get(f"/recipes/{recipe_id}")).json()
+    assert body["name"] == "Sopa de apio"
+    assert [ri["quantity"] for ri in body["recipe_ingredients"]] == [250]
+    match = await client.post("/recipes/match", json={"ingredient_ids": [str(apio_id)]})
+    assert match.json()["matches"][0]["coverage"] == 1.0
+
+    mismatch = await client.put(
+        f"/recipes/{uuid.uuid4()}",
+        json={"recipe_id": recipe_id, "ingredients": []},
+    )
+    assert mismatch.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_put_recipe_null_clears_optional_fields(
+    client: httpx.AsyncClient,
+    db_session: AsyncSession,
+    category: CategoryDB,
+    user: Users,
+) -> None:
+    created = await create_recipe(
+        db_session,
+        RecipesCreate(
+            name="Sopa",
+            description="De verduras",
+            instructions="Hervir",
+            prep_time=30,
+            servings=4,
+            visibility=RecipeVisibility.PUBLIC,
+            ingredients=[
+                RecipeIngredientsCreateInput.model_validate(
+                    _ingredient("Apio", category.category_id, 100)
+                )
+            ],
+        ),
+        user.id,
+    )
+    recipe_id = str(created.recipe_id)
+    ingredients = [_ingredient("Apio", category.category_id, 100)]
+
+    response = await client.put(
+        f"/recipes/{recipe_id}",
+        json={
+            "recipe_id": recipe_id,
+            "servings": None,
+            "prep_time": None,
+            "ingredients": ingredients,
+        },
+    )
+
+    assert response.status_code == 200
+    body = (await client.get(f"/recipes/{recipe_id}")).json()
+    # Los campos omitidos se conservan; los enviados en null se vacían
+    assert (body["description"], body["instructions"]) == ("De verduras", "Hervir")
+    assert (body["servings"], body["prep_time"], body["total_time"]) == (
+        None,
+        None,
+        0,
+    )
+
+    required = await client.put(
+        f"/recipes/{recipe_id}",
+        json={"recipe_id": recipe_id, "description": None, "ingredients": ingredients},
+    )
+    assert required.status_code == 400
+    assert "description" in required.json()["detail"]
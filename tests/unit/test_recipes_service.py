@@ -1,41 +1,48 @@
+import json
 import uuid
-from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
 
 import pytest
-import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlmodel import SQLModel
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
 
-from app.models.ingredients import Categories, Ingredients
+from app.models import RecipesListResponse, RecipesResponse, Users
+from app.models.ingredients import Categories, Ingredients, IngredientUpdate
+from app.models.recipe_ingredients import RecipeIngredients
 from app.models.recipes import (
     RecipeIngredientsCreateInput,
+    Recipes,
     RecipesCreate,
+    RecipeSort,
+    RecipesUpdate,
     RecipeVisibility,
 )
-from app.services.recipes_service import create_recipe
-
-
-@pytest_asyncio.fixture
-async def sqlite_session() -> AsyncGenerator[AsyncSession, None]:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
-    async with AsyncSession(engine) as session:
-        yield session
+from app.services.category_cache import category_cache
+from app.services.ingredients_service import update_ingredient
+from app.services.recipe_cache import RecipeCache, recipe_cache
+from app.services.recipe_index import recipe_index
+from app.services.recipe_stats import recount_recipe_stats
+from app.services.recipes_service import (
+    create_recipe,
+    get_cached_recipe,
+    get_recipe_last_modified,
+    get_recipes_json,
+    update_recipe,
+)
+from tests.database import QueryCounter
 
 
-@pytest_asyncio.fixture
-async def category(sqlite_session: AsyncSession) -> Categories:
-    cat = Categories(name="Verduras")
-    sqlite_session.add(cat)
-    await sqlite_session.commit()
-    await sqlite_session.refresh(cat)
-    return cat
+async def load_from_db(db: AsyncSession, recipe_id: uuid.UUID) -> RecipesResponse:
+    # Lee la receta como el endpoint, sin pasar por la cache
+    recipe_cache.clear()
+    entry = await get_cached_recipe(db, recipe_id)
+    return RecipesResponse.model_validate_json(entry.data)
 
 
 @pytest.mark.asyncio
 async def test_create_recipe_with_new_and_existing_ingredients(
-    sqlite_session: AsyncSession, category: Categories
+    db_session: AsyncSession, category: Categories, user: Users
 ) -> None:
     # Acceder a category_id inmediatamente y guardar en variable local
     category_id = category.category_id
@@ -44,11 +51,10 @@ async def test_create_recipe_with_new_and_existing_ingredients(
     ing_existente = Ingredients(
         name="Papa", category_id=category_id, default_unit="unidad"
     )
-    sqlite_session.add(ing_existente)
-    await sqlite_session.commit()
-    await sqlite_session.refresh(ing_existente)
+    db_session.add(ing_existente)
+    await db_session.commit()
+    await db_session.refresh(ing_existente)
 
-    owner_id = uuid.uuid4()
     recipe_data = RecipesCreate(
         name="Tortilla de papas",
         description="Receta clásica",
@@ -75,9 +81,9 @@ async def test_create_recipe_with_new_and_existing_ingredients(
             ),
         ],
     )
-    result = await create_recipe(sqlite_session, recipe_data, owner_id)
+    result = await create_recipe(db_session, recipe_data, user.id)
     assert result.name == "Tortilla de papas"
-    assert result.owner_id == owner_id
+    assert result.owner_id == user.id
     assert len(result.recipe_ingredients) == 2
     nombres = [ri.ingredient.name for ri in result.recipe_ingredients]
     assert "Papa" in nombres
@@ -90,3 +96,529 @@ async def test_create_recipe_with_new_and_existing_ingredients(
     ]
     assert huevos[0].ingredient_id is not None
     assert huevos[0].default_unit == "unidad"
+
+
+@pytest.mark.asyncio
+async def test_create_recipe_resolves_ingredients_in_batch(
+    db_session: AsyncSession,
+    category: Categories,
+    user: Users,
+    count_queries: QueryCounter,
+) -> None:
+    category_id = category.category_id
+    with count_queries() as statements:
+        recipe_data = RecipesCreate(
+            name="Ensalada",
+            description="Muchos ingredientes",
+            visibility=RecipeVisibility.PUBLIC,
+            ingredients=[
+                RecipeIngredientsCreateInput(
+                    name=f"Ingrediente {i}",
+                    category_id=category_id,
+                    default_unit="g",
+                    quantity=i,
+                    optional=False,
+                )
+                for i in range(30)
+            ],
+        )
+        result = await create_recipe(db_session, recipe_data, user.id)
+
+    assert len(result.recipe_ingredients) == 30
+    # Las inserciones no dependen de la cantidad de ingredientes
+    inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+    assert len(inserts) == 3
+
+
+@pytest.mark.asyncio
+async def test_create_recipe_builds_response_without_reloading(
+    db_session: AsyncSession,
+    category: Categories,
+    user: Users,
+    count_queries: QueryCounter,
+) -> None:
+    category_id = category.category_id
+    await category_cache.load(db_session)
+    with count_queries() as statements:
+        result = await create_recipe(
+            db_session, _simple_recipe("Caldo", category_id), user.id
+        )
+
+    # Resolución de ingredientes, inserciones y contador de uso; ninguna relectura
+    verbs = [statement.split()[0] for statement in statements]
+    assert verbs == ["SELECT", "INSERT", "INSERT", "INSERT", "UPDATE"]
+    async with AsyncSession(db_session.bind, expire_on_commit=False) as db:
+        assert result == await load_from_db(db, result.recipe_id)
+
+
+@pytest.mark.asyncio
+async def test_create_recipe_missing_data_rolls_back_everything(
+    db_session: AsyncSession, category: Categories, user: Users
+) -> None:
+    recipe_data = RecipesCreate(
+        name="Incompleta",
+        description="Falta la unidad",
+        visibility=RecipeVisibility.PUBLIC,
+        ingredients=[
+            RecipeIngredientsCreateInput(
+                name="Sal",
+                category_id=category.category_id,
+                default_unit="g",
+                quantity=1,
+                optional=False,
+            ),
+            RecipeIngredientsCreateInput(
+                name="Pimienta",
+                category_id=category.category_id,
+                default_unit="",
+                quantity=1,
+                optional=False,
+            ),
+        ],
+    )
+    with pytest.raises(HTTPException) as exc:
+        await create_recipe(db_session, recipe_data, user.id)
+    assert exc.value.status_code == 400
+
+    assert (await db_session.scalars(select(Recipes))).first() is None
+    assert (await db_session.scalars(select(Ingredients))).first() is None
+
+
+@pytest.mark.asyncio
+async def test_get_cached_recipe_miss_uses_fixed_number_of_queries(
+    db_session: AsyncSession,
+    category: Categories,
+    user: Users,
+    count_queries: QueryCounter,
+) -> None:
+    category_id = category.category_id
+    recipe_data = RecipesCreate(
+        name="Guiso",
+        description="Veinticinco ingredientes",
+        visibility=RecipeVisibility.PUBLIC,
+        ingredients=[
+            RecipeIngredientsCreateInput(
+                name=f"Ingrediente {i}",
+                category_id=category_id,
+                default_unit="g",
+                quantity=i,
+                optional=False,
+            )
+            for i in range(25)
+        ],
+    )
+    created = await create_recipe(db_session, recipe_data, user.id)
+
+    with count_queries() as statements:
+        # Sesión como la de la app: sin expirar objetos tras el commit
+        async with AsyncSession(db_session.bind, expire_on_commit=False) as db:
+            result = await load_from_db(db, created.recipe_id)
+
+    assert len(result.recipe_ingredients) == 25
+    assert all(
+        ri.ingredient.category.name == "Verduras" for ri in result.recipe_ingredients
+    )
+    assert len(statements) <= 4
+
+
+@pytest.mark.asyncio
+async def test_get_recipes_paginates_public_recipes(
+    db_session: AsyncSession, category: Categories, user: Users
+) -> None:
+    category_id = category.category_id
+    for i, visibility in enumerate(
+        [RecipeVisibility.PUBLIC, RecipeVisibility.PRIVATE, RecipeVisibility.PUBLIC] * 2
+    ):
+        await create_recipe(
+            db_session,
+            RecipesCreate(
+                name=f"Receta {i}",
+                description="",
+                visibility=visibility,
+                ingredients=[
+                    RecipeIngredientsCreateInput(
+                        name="Sal",
+                        category_id=category_id,
+                        default_unit="g",
+                        quantity=1,
+                        optional=False,
+                    )
+                ],
+            ),
+            user.id,
+        )
+
+    first = json.loads(await get_recipes_json(db_session, limit=3))
+    second = json.loads(
+        await get_recipes_json(db_session, limit=3, cursor=first["next_cursor"])
+    )
+
+    assert [r["name"] for r in first["recipes"]] == ["Receta 0", "Receta 2", "Receta 3"]
+    assert [r["name"] for r in second["recipes"]] == ["Receta 5"]
+    assert second["next_cursor"] is None
+
+
+def _simple_recipe(
+    name: str, category_id: uuid.UUID, visibility=RecipeVisibility.PUBLIC
+) -> RecipesCreate:
+    return RecipesCreate(
+        name=name,
+        description="",
+        visibility=visibility,
+        ingredients=[
+            RecipeIngredientsCreateInput(
+                name="Sal",
+                category_id=category_id,
+                default_unit="g",
+                quantity=1,
+                optional=False,
+            )
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_cached_recipe_hit_skips_database(
+    db_session: AsyncSession,
+    category: Categories,
+    user: Users,
+    count_queries: QueryCounter,
+) -> None:
+    created = await create_recipe(
+        db_session, _simple_recipe("Sopa", category.category_id), user.id
+    )
+    with count_queries() as statements:
+        first = (await get_cached_recipe(db_session, created.recipe_id)).data
+        queries_on_miss = len(statements)
+        second = (await get_cached_recipe(db_session, created.recipe_id)).data
+
+    # Receta, filas de ingredientes, ingredientes y categorías
+    assert queries_on_miss == 4
+    assert len(statements) == queries_on_miss
+    assert first == second
+    assert json.loads(first)["recipe_ingredients"][0]["ingredient"]["name"] == "Sal"
+
+
+@pytest.mark.asyncio
+async def test_get_cached_recipe_hides_private_recipes(
+    db_session: AsyncSession, category: Categories, user: Users
+) -> None:
+    created = await create_recipe(
+        db_session,
+        _simple_recipe("Secreta", category.category_id, RecipeVisibility.PRIVATE),
+        user.id,
+    )
+    with pytest.raises(HTTPException) as exc:
+        await get_cached_recipe(db_session, created.recipe_id)
+    assert exc.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_ingredient_update_invalidates_cached_recipe(
+    db_session: AsyncSession, category: Categories, user: Users
+) -> None:
+    created = await create_recipe(
+        db_session, _simple_recipe("Sopa", category.category_id), user.id
+    )
+    cached = await get_cached_recipe(db_session, created.recipe_id)
+    ingredient_id = created.recipe_ingredients[0].ingredient.ingredient_id
+
+    await update_ingredient(
+        db_session,
+        ingredient_id,
+        IngredientUpdate(name="Sal gruesa", default_unit="g"),
+    )
+
+    recipe_cache.clear()
+    last_modified = await get_recipe_last_modified(db_session, created.recipe_id)
+    entry = await get_cached_recipe(db_session, created.recipe_id)
+    data = json.loads(entry.data)
+    assert data["recipe_ingredients"][0]["ingredient"]["name"] == "Sal gruesa"
+    # La fecha de la receta refleja la modificación de su ingrediente
+    assert last_modified == entry.last_modified
+    assert entry.last_modified > cached.last_modified
+
+
+@pytest.mark.asyncio
+async def test_get_recipes_json_matches_dto_listing(
+    db_session: AsyncSession, category: Categories, user: Users
+) -> None:
+    category_id = category.category_id
+    for i in range(5):
+        await create_recipe(
+            db_session,
+            _simple_recipe(f"Receta {i}", category_id),
+            user.id,
+        )
+
+    first = json.loads(await get_recipes_json(db_session, limit=3))
+    second = json.loads(
+        await get_recipes_json(db_session, limit=3, cursor=first["next_cursor"])
+    )
+    page = RecipesListResponse.model_validate(first)
+
+    assert [r.name for r in page.recipes] == ["Receta 0", "Receta 1", "Receta 2"]
+    assert json.loads(page.model_dump_json()) == first
+    assert [r["name"] for r in second["recipes"]] == ["Receta 3", "Receta 4"]
+    assert second["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_create_recipe_maintains_counters(
+    db_session: AsyncSession, category: Categories, user: Users
+) -> None:
+    category_id = category.category_id
+    first = await create_recipe(
+        db_session, _simple_recipe("Sopa", category_id), user.id
+    )
+    sal_id = first.recipe_ingredients[0].ingredient.ingredient_id
+    second = await create_recipe(
+        db_session,
+        RecipesCreate(
+            name="Puré",
+            description="",
+            prep_time=25,
+            visibility=RecipeVisibility.PUBLIC,
+            ingredients=[
+                RecipeIngredientsCreateInput(
+                    ingredient_id=sal_id,
+                    category_id=category_id,
+                    default_unit="g",
+                    quantity=1,
+                    optional=False,
+                ),
+                RecipeIngredientsCreateInput(
+                    name="Papa",
+                    category_id=category_id,
+                    default_unit="u",
+                    quantity=4,
+                    optional=False,
+                ),
+            ],
+        ),
+        user.id,
+    )
+
+    usage = dict(
+        (await db_session.execute(select(Ingredients.name, Ingredients.usage_count)))
+        .tuples()
+        .all()
+    )
+    assert usage == {"Sal": 2, "Papa": 1}
+    assert (second.ingredient_count, second.total_time) == (2, 25)
+
+    # El recálculo no encuentra diferencias; si se desajustan, los repara
+    assert await recount_recipe_stats(db_session) == {
+        "ingredients": 0,
+        "recipes": 0,
+    }
+    recipe = await db_session.get(Recipes, second.recipe_id)
+    assert recipe is not None
+    recipe.ingredient_count = 9
+    sal = await db_session.get(Ingredients, sal_id)
+    assert sal is not None
+    sal.usage_count = 0
+    await db_session.commit()
+    assert await recount_recipe_stats(db_session) == {
+        "ingredients": 1,
+        "recipes": 1,
+    }
+    await db_session.refresh(recipe)
+    await db_session.refresh(sal)
+    assert (recipe.ingredient_count, sal.usage_count) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_get_recipes_json_sorted_by_counters(
+    db_session: AsyncSession, category: Categories, user: Users
+) -> None:
+    category_id = category.category_id
+    for name, minutes, count in [("A", 40, 3), ("B", None, 1), ("C", 10, 2)]:
+        await create_recipe(
+            db_session,
+            RecipesCreate(
+                name=name,
+                description="",
+                prep_time=minutes,
+                visibility=RecipeVisibility.PUBLIC,
+                ingredients=[
+                    RecipeIngredientsCreateInput(
+                        name=f"Ingrediente {i}",
+                        category_id=category_id,
+                        default_unit="g",
+                        quantity=1,
+                        optional=False,
+                    )
+                    for i in range(count)
+                ],
+            ),
+            user.id,
+        )
+
+    async def names(sort: RecipeSort) -> list[str]:
+        first = json.loads(await get_recipes_json(db_session, limit=2, sort=sort))
+        second = json.loads(
+            await get_recipes_json(
+                db_session, limit=2, cursor=first["next_cursor"], sort=sort
+            )
+        )
+        return [r["name"] for r in first["recipes"] + second["recipes"]]
+
+    assert await names(RecipeSort.INGREDIENTS) == ["B", "C", "A"]
+    assert await names(RecipeSort.TIME) == ["B", "C", "A"]
+    assert await names(RecipeSort.CREATED) == ["A", "B", "C"]
+
+
+def _ingredient_input(
+    name: str, category_id: uuid.UUID, quantity: float, optional: bool = False
+) -> RecipeIngredientsCreateInput:
+    return RecipeIngredientsCreateInput(
+        name=name,
+        category_id=category_id,
+        default_unit="g",
+        quantity=quantity,
+        optional=optional,
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_recipe_changing_one_quantity_touches_one_row(
+    db_session: AsyncSession,
+    category: Categories,
+    user: Users,
+    count_queries: QueryCounter,
+) -> None:
+    category_id = category.category_id
+    await category_cache.load(db_session)
+    names = ["Harina", "Agua", "Sal"]
+    created = await create_recipe(
+        db_session,
+        RecipesCreate(
+            name="Pan",
+            description="",
+            visibility=RecipeVisibility.PUBLIC,
+            ingredients=[
+                _ingredient_input(name, category_id, i + 1)
+                for i, name in enumerate(names)
+            ],
+        ),
+        user.id,
+    )
+    with count_queries() as statements:
+        # Sesión nueva, como en una petición
+        async with AsyncSession(db_session.bind, expire_on_commit=False) as db:
+            result = await update_recipe(
+                db,
+                RecipesUpdate(
+                    recipe_id=created.recipe_id,
+                    ingredients=[
+                        _ingredient_input(name, category_id, 5 if i == 1 else i + 1)
+                        for i, name in enumerate(names)
+                    ],
+                ),
+            )
+
+    # Receta, filas con sus ingredientes, la fila modificada y la receta
+    verbs = [statement.split()[0] for statement in statements]
+    assert verbs == ["SELECT", "SELECT", "UPDATE", "UPDATE"]
+    assert [ri.quantity for ri in result.recipe_ingredients] == [1, 5, 3]
+    assert result.update_at > created.update_at
+    async with AsyncSession(db_session.bind, expire_on_commit=False) as db:
+        assert result == await load_from_db(db, created.recipe_id)
+
+
+@pytest.mark.asyncio
+async def test_update_recipe_reconciles_ingredients_and_counters(
+    db_session: AsyncSession, category: Categories, user: Users
+) -> None:
+    category_id = category.category_id
+    created = await create_recipe(
+        db_session,
+        RecipesCreate(
+            name="Ensalada",
+            description="",
+            visibility=RecipeVisibility.PUBLIC,
+            ingredients=[
+                _ingredient_input("Lechuga", category_id, 1),
+                _ingredient_input("Tomate", category_id, 2),
+                _ingredient_input("Cebolla", category_id, 1, optional=True),
+            ],
+        ),
+        user.id,
+    )
+    recipe_id = created.recipe_id
+    await get_cached_recipe(db_session, recipe_id)
+
+    result = await update_recipe(
+        db_session,
+        RecipesUpdate(
+            recipe_id=recipe_id,
+            name="Ensalada mixta",
+            prep_time=10,
+            ingredients=[
+                _ingredient_input("Lechuga", category_id, 1),
+                _ingredient_input("Cebolla", category_id, 1),
+                _ingredient_input("Zanahoria", category_id, 3),
+            ],
+        ),
+    )
+
+    assert (result.name, result.description) == ("Ensalada mixta", "")
+    assert (result.ingredient_count, result.total_time) == (3, 10)
+    rows = (
+        await db_session.execute(
+            select(
+                Ingredients.name, RecipeIngredients.quantity, RecipeIngredients.optional
+            )
+            .join(Ingredients)
+            .where(RecipeIngredients.recipe_id == recipe_id)
+            .order_by(Ingredients.name)
+        )
+    ).all()
+    assert [tuple(row) for row in rows] == [
+        ("Cebolla", 1, False),
+        ("Lechuga", 1, False),
+        ("Zanahoria", 3, False),
+    ]
+    usage = dict(
+        (await db_session.execute(select(Ingredients.name, Ingredients.usage_count)))
+        .tuples()
+        .all()
+    )
+    assert usage == {"Lechuga": 1, "Tomate": 0, "Cebolla": 1, "Zanahoria": 1}
+    # Los contadores mantenidos en línea coinciden con un recálculo completo
+    assert await recount_recipe_stats(db_session) == {
+        "ingredients": 0,
+        "recipes": 0,
+    }
+    # La cache se invalidó y el índice refleja los nuevos requeridos
+    assert recipe_cache.get(recipe_id) is None
+    recipe_index.loaded = True
+    ids = [ri.ingredient.ingredient_id for ri in result.recipe_ingredients]
+    assert recipe_index.search(ids, limit=5)[0].required == 3
+
+    with pytest.raises(HTTPException) as exc:
+        await update_recipe(
+            db_session, RecipesUpdate(recipe_id=uuid.uuid4(), ingredients=[])
+        )
+    assert exc.value.status_code == 404
+
+
+def test_recipe_cache_evicts_least_recently_used_and_expires() -> None:
+    cache = RecipeCache(max_size=2, ttl=60)
+    ids = [uuid.uuid4() for _ in range(3)]
+    ingredient_id = uuid.uuid4()
+    now = datetime.now(UTC)
+    cache.put(ids[0], b"0", now, [ingredient_id])
+    cache.put(ids[1], b"1", now, [])
+    assert cache.get(ids[0]).data == b"0"  # type: ignore[union-attr]
+    cache.put(ids[2], b"2", now, [])
+
+    assert cache.get(ids[1]) is None
+    assert cache.stats()["evictions"] == 1
+    cache.invalidate_ingredients([ingredient_id])
+    assert cache.get(ids[0]) is None
+
+    expired = RecipeCache(max_size=2, ttl=0)
+    expired.put(ids[0], b"0", now, [])
+    assert expired.get(ids[0]) is None
@@ -0,0 +1,32 @@
+import json
+import uuid
+from datetime import UTC, datetime
+
+from app.api.responses import JSONBytesResponse
+from app.models import CategorieSingleResponse
+
+
+def test_json_bytes_response_passes_serialized_json_through() -> None:
+    body = b'{"recipes":[],"next_cursor":null}'
+    response = JSONBytesResponse(body, headers={"ETag": 'W/"1"'})
+    assert response.body is body
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["etag"] == 'W/"1"'
+
+
+def test_json_bytes_response_serializes_dto_once() -> None:
+    dto = CategorieSingleResponse(category_id=uuid.uuid4(), name="Lácteos")
+    response = JSONBytesResponse(dto)
+    assert response.body == dto.model_dump_json().encode("utf-8")
+    assert json.loads(response.body)["name"] == "Lácteos"
+
+
+def test_json_bytes_response_serializes_plain_values() -> None:
+    recipe_id = uuid.uuid4()
+    now = datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+    response = JSONBytesResponse({"id": recipe_id, "at": now, "tags": ("a", "b")})
+    assert json.loads(response.body) == {
+        "id": str(recipe_id),
+        "at": "2026-01-02T03:04:05Z",
+        "tags": ["a", "b"],
+    }
@@ -0,0 +1,137 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
+
+from app.models import (
+    CategoryDB,
+    Ingredients,
+    RecipeIngredients,
+    Recipes,
+    RecipesResponse,
+    Users,
+)
+from app.models.ingredients import IngredientUpdate
+from app.models.recipes import (
+    RecipeIngredientsCreateInput,
+    RecipesCreate,
+    RecipeVisibility,
+)
+from app.services.ingredients_service import update_ingredient
+from app.services.recipes_service import create_recipe
+from app.services.search_service import build_match_query, search_recipes
+from tests.database import requires_postgres, requires_sqlite
+
+
+async def _create(
+    db: AsyncSession,
+    owner: Users,
+    category: CategoryDB,
+    name: str,
+    description: str,
+    ingredients: list[str],
+    visibility: RecipeVisibility = RecipeVisibility.PUBLIC,
+) -> RecipesResponse:
+    return await create_recipe(
+        db,
+        RecipesCreate(
+            name=name,
+            description=description,
+            visibility=visibility,
+            ingredients=[
+                RecipeIngredientsCreateInput(
+                    name=ingredient,
+                    category_id=category.category_id,
+                    default_unit="g",
+                    quantity=1,
+                    optional=False,
+                )
+                for ingredient in ingredients
+            ],
+        ),
+        owner.id,
+    )
+
+
+def test_build_match_query_keeps_only_words() -> None:
+    assert build_match_query('tor "papa" OR -x*') == '"tor"* "papa"* "OR"* "x"*'
+    with pytest.raises(HTTPException) as exc:
+        build_match_query('"*" ()')
+    assert exc.value.status_code == 400
+
+
+@requires_sqlite
+@pytest.mark.asyncio
+async def test_search_prefix_accents_and_ranking(
+    db_session: AsyncSession, category: CategoryDB, user: Users
+) -> None:
+    await _create(
+        db_session, user, category, "Tortilla de papas", "Clásica", ["Papa", "Huevo"]
+    )
+    await _create(
+        db_session, user, category, "Ensalada", "Para acompañar tortilla", ["Limón"]
+    )
+    await _create(
+        db_session,
+        user,
+        category,
+        "Tortilla secreta",
+        "",
+        ["Papa"],
+        RecipeVisibility.PRIVATE,
+    )
+
+    response = await search_recipes(db_session, "tort", limit=10)
+    # El nombre pesa más que la descripción; las privadas no aparecen
+    assert [r.name for r in response.results] == ["Tortilla de papas", "Ensalada"]
+    assert response.results[0].rank < response.results[1].rank
+
+    # Busca en ingredientes, sin distinguir tildes; todas las palabras deben estar
+    assert [
+        r.name for r in (await search_recipes(db_session, "limon", 10)).results
+    ] == ["Ensalada"]
+    assert (await search_recipes(db_session, "huevo limon", 10)).results == []
+
+
+@requires_sqlite
+@pytest.mark.asyncio
+async def test_triggers_follow_ingredient_and_recipe_changes(
+    db_session: AsyncSession, category: CategoryDB, user: Users
+) -> None:
+    recipe = await _create(
+        db_session, user, category, "Guiso", "De invierno", ["Zapallo"]
+    )
+    ingredient_id = recipe.recipe_ingredients[0].ingredient.ingredient_id
+
+    await update_ingredient(
+        db_session,
+        ingredient_id,
+        IngredientUpdate(name="Calabaza", default_unit="g"),
+    )
+    assert (await search_recipes(db_session, "zapallo", 10)).results == []
+    assert len((await search_recipes(db_session, "calabaza", 10)).results) == 1
+
+    await db_session.execute(
+        delete(RecipeIngredients).where(
+            col(RecipeIngredients.recipe_id) == recipe.recipe_id
+        )
+    )
+    await db_session.execute(
+        delete(Recipes).where(col(Recipes.recipe_id) == recipe.recipe_id)
+    )
+    await db_session.execute(
+        delete(Ingredients).where(col(Ingredients.ingredient_id) == ingredient_id)
+    )
+    await db_session.commit()
+    assert (await search_recipes(db_session, "guiso", 10)).results == []
+
+
+@requires_postgres
+@pytest.mark.asyncio
+async def test_search_is_not_available_without_fts5(
+    db_session: AsyncSession,
+) -> None:
+    with pytest.raises(HTTPException) as exc:
+        await search_recipes(db_session, "tortilla", limit=10)
+    assert exc.value.status_code == 501
@@ -0,0 +1,39 @@
+import asyncio
+import time
+
+import pytest
+
+from app.core.security import (
+    PasswordHashPool,
+    get_hash_password_async,
+    verify_password_async,
+)
+
+
+@pytest.mark.asyncio
+async def test_async_hash_and_verify_roundtrip() -> None:
+    hashed = await get_hash_password_async("secreta")
+    assert await verify_password_async("secreta", hashed)
+    assert not await verify_password_async("otra", hashed)
+
+
+@pytest.mark.asyncio
+async def test_pool_limits_concurrency_and_reports_queue_depth() -> None:
+    pool = PasswordHashPool(kind="thread", max_workers=4, max_concurrency=1)
+    peak_waiting = 0
+
+    async def watch() -> None:
+        nonlocal peak_waiting
+        while pool.completed < 3:
+            peak_waiting = max(peak_waiting, pool.waiting)
+            assert pool.running <= 1
+            await asyncio.sleep(0.005)
+
+    try:
+        await asyncio.gather(watch(), *(pool.run(time.sleep, 0.05) for _ in range(3)))
+    finally:
+        pool.shutdown()
+
+    assert peak_waiting >= 1
+    assert pool.stats()["completed"] == 3
+    assert pool.stats()["waiting"] == 0
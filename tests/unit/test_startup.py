@@ -0,0 +1,66 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.core import password_hash_pool
+from app.main import configure_from_env
+from app.services.recipe_cache import RECIPE_CACHE_SIZE, RECIPE_CACHE_TTL, recipe_cache
+
+# Presupuesto para importar la aplicación en un proceso nuevo (la mayor parte
+# es FastAPI y pydantic). Ajustable en máquinas lentas.
+IMPORT_BUDGET_S = float(os.getenv("IMPORT_BUDGET_S", "3.0"))
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_importing_the_app_is_lazy_and_within_budget() -> None:
+    code = (
+        "import sys, time\n"
+        "started = time.perf_counter()\n"
+        "import app.main\n"
+        "elapsed = time.perf_counter() - started\n"
+        "from app.core.db import database\n"
+        "print(elapsed, len(database.engines()), 'aiosqlite' in sys.modules,\n"
+        "      'dotenv' in sys.modules)\n"
+    )
+    # Sin DATABASE_URL: importar no debe leerla ni crear el motor
+    env = {
+        k: v
+        for k, v in os.environ.items()
+        if k not in ("DATABASE_URL", "DATABASE_READ_URL")
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed, engines, driver_loaded, dotenv_loaded = result.stdout.split()
+    # Ni el driver ni python-dotenv se cargan hasta configurar la base
+    assert (engines, driver_loaded, dotenv_loaded) == ("0", "False", "False")
+    assert float(elapsed) < IMPORT_BUDGET_S
+
+
+def test_lifespan_settings_are_read_when_configuring(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("RECIPE_CACHE_SIZE", "5")
+    monkeypatch.setenv("RECIPE_CACHE_TTL", "1.5")
+    monkeypatch.setenv("PASSWORD_HASH_WORKERS", "2")
+    monkeypatch.delenv("PASSWORD_HASH_MAX_CONCURRENCY", raising=False)
+    try:
+        configure_from_env()
+        assert (recipe_cache.max_size, recipe_cache.ttl) == (5, 1.5)
+        assert (password_hash_pool.kind, password_hash_pool.max_workers) == (
+            "thread",
+            2,
+        )
+        assert password_hash_pool.max_concurrency == 2
+    finally:
+        recipe_cache.configure(RECIPE_CACHE_SIZE, RECIPE_CACHE_TTL)
+        password_hash_pool.configure()
@@ -2,8 +2,9 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
 
-from app.models.users import UserCreate, Users
+from app.models.users import UserCreate, UserUpdate
 from app.services import user_service
 
 
@@ -48,7 +49,9 @@ async def test_create_user_success(
     mock_result = MagicMock()
     mock_result.first.return_value = None
     fake_db.scalars.return_value = mock_result
-    monkeypatch.setattr(user_service, "get_hash_password", lambda pwd: "hashed")
+    monkeypatch.setattr(
+        user_service, "get_hash_password_async", AsyncMock(return_value="hashed")
+    )
 
     # --- INICIO DE LA SOLUCIÓN ---
     # Sobreescribe 'add' para que sea un mock síncrono y evitar el RuntimeWarning
@@ -66,27 +69,82 @@ async def test_create_user_success(
     # Comprobamos que el email es el esperado
     assert hasattr(result, "email")  # nosec
     assert str(result.email) == user_create_data.email  # nosec
+    # El ID y las fechas se generan en el cliente: no se relee la fila
+    fake_db.refresh.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_create_user_already_exists(
-    fake_db: AsyncMock, user_create_data: UserCreate
+    fake_db: AsyncMock, user_create_data: UserCreate, monkeypatch: pytest.MonkeyPatch
 ):
     """Prueba la creación de un usuario que ya existe.
 
+    El duplicado se detecta por la restricción UNIQUE del email al confirmar.
+
     Args:
         fake_db (MagicMock): Simulación de la base de datos.
         user_create_data (UserCreate): Datos de creación del usuario.
+        monkeypatch (MonkeyPatch): Herramienta para modificar el comportamiento de las funciones.
     """
-    mock_result = MagicMock()
-    mock_result.first.return_value = Users(
-        email=user_create_data.email,
-        full_name=user_create_data.full_name,
-        family_name=user_create_data.family_name,
-        hashed_password="hashed",  # nosec
+    fake_db.add = MagicMock()
+    fake_db.commit.side_effect = IntegrityError(
+        "INSERT INTO users ...",
+        {},
+        Exception("UNIQUE constraint failed: users.email"),
+    )
+    monkeypatch.setattr(
+        user_service, "get_hash_password_async", AsyncMock(return_value="hashed")
     )
-    fake_db.scalars.return_value = mock_result
     with pytest.raises(HTTPException) as exc:
         await user_service.create_user(fake_db, user_create_data)
     assert exc.value.status_code == 400  # nosec
     assert "ya existe" in exc.value.detail  # nosec
+    fake_db.rollback.assert_awaited_once()
+    fake_db.scalars.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_user_issues_single_update(fake_db: AsyncMock):
+    """Prueba que la actualización escribe solo los campos enviados, sin SELECT previo.
+
+    Args:
+        fake_db (AsyncMock): Simulación de la base de datos.
+    """
+    updated = MagicMock()
+    mock_result = MagicMock()
+    mock_result.first.return_value = updated
+    fake_db.scalars.return_value = mock_result
+
+    result = await user_service.update_user(
+        fake_db, "test@example.com", UserUpdate(full_name="Cristian")
+    )
+
+    assert result is updated  # nosec
+    fake_db.scalars.assert_awaited_once()
+    statement = fake_db.scalars.await_args.args[0]
+    sql = str(statement)
+    assert sql.startswith("UPDATE users SET full_name=")  # nosec
+    assert "email=" not in sql.split("WHERE")[0]  # nosec
+    assert "updated_at=" in sql and "RETURNING" in sql  # nosec
+    fake_db.commit.assert_awaited_once()
+    fake_db.refresh.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_user_not_found(fake_db: AsyncMock):
+    """Prueba que un UPDATE sin filas devueltas responde 404.
+
+    Args:
+        fake_db (AsyncMock): Simulación de la base de datos.
+    """
+    mock_result = MagicMock()
+    mock_result.first.return_value = None
+    fake_db.scalars.return_value = mock_result
+
+    with pytest.raises(HTTPException) as exc:
+        await user_service.update_user(
+            fake_db, "nadie@example.com", UserUpdate(family_name="x")
+        )
+    assert exc.value.status_code == 404  # nosec
+    fake_db.rollback.assert_awaited_once()
+    fake_db.commit.assert_not_called()